@@ -0,0 +1,87 @@
+"""
+Extracting rows then pivoting them into columns
+versus extracting columns directly, by time and peak memory.
+
+    python benchmarks/bench_columnar.py [--rows 50000] [--no-numpy]
+"""
+
+# Standard Library
+import argparse
+import time
+import tracemalloc
+
+from typing import Any, Callable, Dict, List, Tuple
+
+# First Party Library
+from data_extractor.columnar import extract_columns
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+
+
+class Author(Item):
+    username = Field(JSONExtractor("name"))
+
+
+class Row(Item):
+    id = Field(JSONExtractor("id"), type=int)
+    score = Field(JSONExtractor("score"), type=float, default=None)
+    label = Field(JSONExtractor("label"))
+    author = Author(JSONExtractor("author"))
+
+
+def generate_document(rows: int) -> Dict[str, Any]:
+    return {
+        "rows": [
+            {
+                "id": idx,
+                "score": idx / 3,
+                "label": f"row{idx}",
+                "author": {"name": f"user{idx % 100}"},
+            }
+            for idx in range(rows)
+        ]
+    }
+
+
+def pivot(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    return {
+        "id": [row["id"] for row in rows],
+        "score": [row["score"] for row in rows],
+        "label": [row["label"] for row in rows],
+        "author.username": [row["author"]["username"] for row in rows],
+    }
+
+
+def measure(func: Callable[[], Any]) -> Tuple[float, float]:
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        rv = func()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del rv
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--no-numpy", dest="numpy", action="store_false")
+    args = parser.parse_args()
+
+    document = generate_document(args.rows)
+    item = Row(JSONExtractor("rows[*]"), is_many=True)
+    item.extract(generate_document(1))
+
+    elapsed, peak = measure(lambda: pivot(item.extract(document)))
+    print(f"rows then pivot: {elapsed:.3f}s, peak {peak:.1f}MiB")
+
+    elapsed, peak = measure(lambda: extract_columns(item, [document], args.numpy))
+    print(f"extract_columns: {elapsed:.3f}s, peak {peak:.1f}MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Peak memory of keeping the extracted texts of many HTML documents,
+the smart strings keep their documents alive, the detached results don't.
+
+    python benchmarks/bench_detached.py [--documents 2000] [--rows 200]
+    python benchmarks/bench_detached.py --detached
+"""
+
+# Standard Library
+import argparse
+import resource
+import time
+
+from typing import Any, List
+
+# Third Party Library
+from lxml.html import fromstring
+
+# First Party Library
+from data_extractor.lxml import XPathExtractor
+
+
+def render(rows: int) -> str:
+    items = "".join(
+        f"<li class='row-{idx}'><a href='/item/{idx}'>item {idx}</a></li>"
+        for idx in range(rows)
+    )
+    return f"<html><head><title>items</title></head><ul>{items}</ul></html>"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--detached", action="store_true")
+    args = parser.parse_args()
+
+    text = render(args.rows)
+    extractor = XPathExtractor("//title/text()", detached=args.detached)
+    results: List[Any] = []
+    start = time.perf_counter()
+    for _ in range(args.documents):
+        # only the title is kept, like a result queued for writing
+        results.extend(extractor.extract(fromstring(text)))
+
+    elapsed = time.perf_counter() - start
+    # kibibytes on Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"detached={args.detached}: {len(results)} results, "
+        f"peak RSS {peak:.1f}MiB, {elapsed / args.documents * 1e6:.1f}us per document"
+    )
+
+
+if __name__ == "__main__":
+    main()
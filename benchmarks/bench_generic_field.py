@@ -0,0 +1,62 @@
+"""
+Startup cost of a schema module with many parametrized fields.
+
+    python benchmarks/bench_generic_field.py [--schemas 200] [--fields 20]
+"""
+
+# Standard Library
+import argparse
+import importlib
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+# First Party Library
+from data_extractor.item import Field
+
+TYPES = ["str", "int", "float", "bool"]
+
+
+def generate_module(schemas: int, fields: int) -> str:
+    lines = ["from data_extractor.item import Field, Item", ""]
+    for idx in range(schemas):
+        lines.append(f"class Schema{idx}(Item):")
+        for field_idx in range(fields):
+            type_ = TYPES[field_idx % len(TYPES)]
+            lines.append(f"    field{field_idx} = Field[{type_}]()")
+
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def count_subclasses(cls: type) -> int:
+    return sum(1 + count_subclasses(sub) for sub in cls.__subclasses__())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--schemas", type=int, default=200)
+    parser.add_argument("--fields", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        module_path = Path(tmp_dir) / "bench_generic_field_schemas.py"
+        module_path.write_text(generate_module(args.schemas, args.fields))
+        sys.path.insert(0, tmp_dir)
+
+        classes = count_subclasses(Field)
+        start = time.perf_counter()
+        importlib.import_module(module_path.stem)
+        elapsed = time.perf_counter() - start
+        classes = count_subclasses(Field) - classes
+
+    print(f"schemas: {args.schemas}, parametrized fields: {args.schemas * args.fields}")
+    print(f"import: {elapsed:.3f}s")
+    print(f"classes created: {classes}")
+
+
+if __name__ == "__main__":
+    main()
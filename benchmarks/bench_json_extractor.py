@@ -0,0 +1,59 @@
+"""
+Construction cost and memory of JSONExtractor instantiations.
+
+    python benchmarks/bench_json_extractor.py [--number 100000] [--backend NAME]
+"""
+
+# Standard Library
+import argparse
+import gc
+import time
+import tracemalloc
+
+# First Party Library
+import data_extractor.json
+
+from data_extractor.json import JSONExtractor
+
+BACKENDS = {
+    "jsonpath-extractor": data_extractor.json.JSONPathExtractor,
+    "jsonpath-rw": data_extractor.json.JSONPathRWExtractor,
+    "jsonpath-rw-ext": data_extractor.json.JSONPathRWExtExtractor,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    parser.add_argument("--backend", choices=sorted(BACKENDS))
+    args = parser.parse_args()
+
+    if args.backend:
+        data_extractor.json.json_extractor_backend = BACKENDS[args.backend]
+
+    print(f"backend: {data_extractor.json.json_extractor_backend.__name__}")
+    exprs = [f"data.users[{idx % 100}].name" for idx in range(args.number)]
+    JSONExtractor(exprs[0])  # warm up
+
+    gc.collect()
+    start = time.perf_counter()
+    extractors = [JSONExtractor(expr) for expr in exprs]
+    elapsed = time.perf_counter() - start
+    classes = {type(extractor) for extractor in extractors}
+    del extractors
+
+    gc.collect()
+    tracemalloc.start()
+    extractors = [JSONExtractor(expr) for expr in exprs]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(extractors) == args.number
+
+    print(f"instantiations: {args.number}")
+    print(f"elapsed: {elapsed:.3f}s ({elapsed / args.number * 1e6:.2f}us each)")
+    print(f"memory: {current / 2**20:.1f}MiB ({current / args.number:.0f}B each)")
+    print(f"distinct classes: {len(classes)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Line-by-line reading and writing versus the memory-mapped reader
+and the buffered sink on a JSON Lines file.
+
+    python benchmarks/bench_jsonl.py [--records 500000] [--shards 1 2 4]
+        [--repeat 3]
+"""
+
+# Standard Library
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Tuple
+
+# First Party Library
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+from data_extractor.jsonl import JSONLinesWriter, iterextract, shards
+
+
+class User(Item):
+    id = Field(JSONExtractor("id"), type=int)
+    username = Field(JSONExtractor("profile.name"))
+    email = Field(JSONExtractor("profile.email"))
+
+
+def generate_file(path: str, records: int) -> None:
+    with open(path, "w") as fp:
+        for idx in range(records):
+            record = {
+                "id": idx,
+                "profile": {"name": f"user{idx}", "email": f"user{idx}@example.com"},
+                "tags": ["a", "b", "c"],
+                "bio": "lorem ipsum " * 8,
+            }
+            fp.write(json.dumps(record) + "\n")
+
+
+def naive(path: str, output: str) -> int:
+    item = User()
+    count = 0
+    with open(path, encoding="utf-8") as src, open(output, "w") as dst:
+        for line in src:
+            if line.strip():
+                dst.write(json.dumps(item.extract(json.loads(line))) + "\n")
+                count += 1
+
+    return count
+
+
+def extract_shard(args: Tuple[str, int, int, str]) -> int:
+    path, start, end, output = args
+    with JSONLinesWriter(output) as sink:
+        return sink.write_many(iterextract(User(), path, start, end))
+
+
+def best_of(repeat: int, func: Callable[[], int], expect: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        assert func() == expect
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def extract_shards(path: str, count: int, tmpdir: str) -> int:
+    jobs = [
+        (path, start, end, os.path.join(tmpdir, f"shard-{idx}.jsonl"))
+        for idx, (start, end) in enumerate(shards(path, count))
+    ]
+    with ProcessPoolExecutor(count) as executor:
+        return sum(executor.map(extract_shard, jobs))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=500000)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "users.jsonl")
+        generate_file(path, args.records)
+        size = os.path.getsize(path)
+        print(f"file: {args.records} records, {size / 2**20:.1f}MiB")
+
+        output = os.path.join(tmpdir, "output.jsonl")
+        baseline = best_of(args.repeat, lambda: naive(path, output), args.records)
+        print(f"readline + write: {baseline:.3f}s")
+
+        elapsed = best_of(
+            args.repeat, lambda: extract_shard((path, 0, size, output)), args.records
+        )
+        print(f"mmap + buffered sink: {elapsed:.3f}s ({baseline / elapsed:.2f}x)")
+
+        for count in args.shards:
+            elapsed = best_of(
+                args.repeat, partial(extract_shards, path, count, tmpdir), args.records
+            )
+            print(
+                f"shards={count}, processes={count}: {elapsed:.3f}s "
+                f"({baseline / elapsed:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
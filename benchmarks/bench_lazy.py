@@ -0,0 +1,54 @@
+"""
+Eager versus lazy results of a wide item when only a few fields are read.
+
+    python benchmarks/bench_lazy.py [--fields 40] [--read 3] [--number 2000]
+"""
+
+# Standard Library
+import argparse
+import timeit
+
+from typing import Any, Dict
+
+# First Party Library
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+
+
+def make_item(fields: int) -> Item:
+    attrs: Dict[str, Any] = {
+        f"field_{idx}": Field(JSONExtractor(f"data.values[{idx}].value"))
+        for idx in range(fields)
+    }
+    return type("Page", (Item,), attrs)()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=40)
+    parser.add_argument("--read", type=int, default=3)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    item = make_item(args.fields)
+    document = {"data": {"values": [{"value": idx} for idx in range(args.fields)]}}
+    keys = [f"field_{idx}" for idx in range(args.read)]
+
+    def eager() -> None:
+        rv = item.extract(document)
+        for key in keys:
+            rv[key]
+
+    def lazy() -> None:
+        rv = item.extract(document, lazy=True)
+        for key in keys:
+            rv[key]
+
+    for name, func in (("eager", eager), ("lazy", lazy)):
+        func()
+        best = min(timeit.repeat(func, number=args.number, repeat=5))
+        print(f"{name}: {best / args.number * 1e6:.2f}us per document")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Memory per extractor, field and item object,
+and the time of extracting by fields and extractors.
+
+    python benchmarks/bench_memory.py [--objects 100000] [--number 200000]
+"""
+
+# Standard Library
+import argparse
+import gc
+import timeit
+import tracemalloc
+
+from typing import Any, Callable, List
+
+# First Party Library
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+
+
+class User(Item):
+    id = Field(JSONExtractor("id"))
+    username = Field(JSONExtractor("name"))
+
+
+class SlottedUser(Item):
+    # opt out the instance dictionary
+    __slots__ = ()
+
+    id = Field(JSONExtractor("id"))
+    username = Field(JSONExtractor("name"))
+
+
+def bytes_per_object(factory: Callable[[int], Any], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects: List[Any] = [factory(idx) for idx in range(count)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # exclude the list holding the objects
+    return (after - before) / len(objects) - 8
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=100000)
+    parser.add_argument("--number", type=int, default=200000)
+    args = parser.parse_args()
+
+    # share one extractor, so that only the objects themselves are counted
+    extractor = JSONExtractor("id", lazy=False)
+    factories = {
+        "JSONExtractor(lazy=True)": lambda idx: JSONExtractor("id", lazy=True),
+        "Field": lambda idx: Field(extractor),
+        "Item subclass": lambda idx: User(extractor),
+        "Item subclass with __slots__": lambda idx: SlottedUser(extractor),
+    }
+    for name, factory in factories.items():
+        size = bytes_per_object(factory, args.objects)
+        print(f"{name}: {size:.0f} bytes per object")
+
+    field = Field(JSONExtractor("id"))
+    user = User()
+    document = {"id": 1, "name": "user"}
+    benchmarks = {
+        "Field.extract": lambda: field.extract(document),
+        "Item.extract": lambda: user.extract(document),
+        "JSONExtractor.extract": lambda: extractor.extract(document),
+        "Field.is_many": lambda: field.is_many,
+    }
+    for name, func in benchmarks.items():
+        elapsed = min(timeit.repeat(func, number=args.number, repeat=5))
+        print(f"{name}: {elapsed / args.number * 1e9:.0f}ns per call")
+
+
+if __name__ == "__main__":
+    main()
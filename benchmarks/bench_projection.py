@@ -0,0 +1,58 @@
+"""
+Extracting all the fields of a wide item versus a projection of a few of them.
+
+    python benchmarks/bench_projection.py [--fields 40] [--only 3] [--number 2000]
+"""
+
+# Standard Library
+import argparse
+import timeit
+
+from typing import Any, Dict
+
+# First Party Library
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+
+
+def make_item(fields: int) -> Item:
+    attrs: Dict[str, Any] = {
+        f"field_{idx}": Field(JSONExtractor(f"data.values[{idx}].value"))
+        for idx in range(fields)
+    }
+    return type("Page", (Item,), attrs)()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=40)
+    parser.add_argument("--only", type=int, default=3)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    item = make_item(args.fields)
+    document = {"data": {"values": [{"value": idx} for idx in range(args.fields)]}}
+    only = frozenset(f"field_{idx}" for idx in range(args.only))
+
+    def full() -> None:
+        item.extract(document)
+
+    def projected() -> None:
+        item.extract(document, only=only)
+
+    def projected_set() -> None:
+        # a new set per call, hashed into the cache key again
+        item.extract(document, only={*only})
+
+    for name, func in (
+        ("all fields", full),
+        ("only=frozenset", projected),
+        ("only=set", projected_set),
+    ):
+        func()
+        best = min(timeit.repeat(func, number=args.number, repeat=5))
+        print(f"{name}: {best / args.number * 1e6:.2f}us per document")
+
+
+if __name__ == "__main__":
+    main()
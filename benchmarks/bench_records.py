@@ -0,0 +1,71 @@
+"""
+Rows as dicts versus namedtuple and __slots__ records, by time and memory.
+
+    python benchmarks/bench_records.py [--rows 500000] [--disable-gc]
+"""
+
+# Standard Library
+import argparse
+import gc
+import time
+import tracemalloc
+
+from functools import partial
+from typing import Any, Callable, Tuple
+
+# First Party Library
+from data_extractor.item import Field, Item
+from data_extractor.record import record_type
+
+
+class Row(Item):
+    # select the row itself, so that the cost of making rows is measured
+    id = Field()
+    label = Field()
+    score = Field()
+    url = Field()
+
+
+def measure(func: Callable[[], Any]) -> Tuple[float, float]:
+    timings = []
+    for _ in range(5):
+        gc.collect()
+        start = time.perf_counter()
+        rv = func()
+        timings.append(time.perf_counter() - start)
+        del rv
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        retained = func()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del retained
+    return min(timings), size / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--disable-gc", action="store_true")
+    args = parser.parse_args()
+    if args.disable_gc:
+        gc.disable()
+
+    rows = list(range(args.rows))
+    items = {
+        "dict": Row(is_many=True),
+        "namedtuple": Row(is_many=True, type=record_type(Row)),
+        "__slots__": Row(is_many=True, type=record_type(Row, slots=True)),
+    }
+    for name, item in items.items():
+        item.extract([0])
+        elapsed, size = measure(partial(item.extract, rows))
+        print(f"{name}: {elapsed:.3f}s, {size:.1f}MiB retained")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Serial parse and extract versus the thread-pool pipeline on an HTML corpus.
+
+    python benchmarks/bench_threaded_pipeline.py [--pages 200] [--rows 2000]
+        [--threads 1 2 4 8]
+"""
+
+# Standard Library
+import argparse
+import time
+
+from typing import List
+
+# First Party Library
+from data_extractor.item import Field, Item
+from data_extractor.lxml import XPathExtractor
+from data_extractor.parallel import parsers, threaded_extract
+
+
+class Row(Item):
+    id = Field(XPathExtractor("./td[1]/text()"))
+    label = Field(XPathExtractor("./td[2]/a/text()"))
+    url = Field(XPathExtractor("./td[2]/a/@href"))
+
+
+class Page(Item):
+    title = Field(XPathExtractor("//title/text()"))
+    rows = Row(XPathExtractor("//tr[@class='row']"), is_many=True)
+
+
+def generate_pages(pages: int, rows: int) -> List[bytes]:
+    rv = []
+    for page in range(pages):
+        body = "".join(
+            f"<tr class='row'><td>{row}</td>"
+            f"<td><a href='/items/{page}/{row}'>item {row}</a></td>"
+            f"<td><p>{'lorem ipsum ' * 10}</p></td></tr>"
+            for row in range(rows)
+        )
+        rv.append(
+            f"<html><head><title>page {page}</title></head>"
+            f"<body><table>{body}</table></body></html>".encode()
+        )
+
+    return rv
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    pages = generate_pages(args.pages, args.rows)
+    size = sum(map(len, pages))
+    print(f"corpus: {args.pages} pages, {size / 2**20:.1f}MiB")
+
+    item = Page()
+    parse = parsers["html"]
+    start = time.perf_counter()
+    expect = [item.extract(parse(page)) for page in pages]
+    serial = time.perf_counter() - start
+    print(f"serial: {serial:.3f}s")
+
+    for threads in args.threads:
+        start = time.perf_counter()
+        rv = list(threaded_extract(item, pages, threads=threads))
+        elapsed = time.perf_counter() - start
+        assert rv == expect
+        print(f"threads={threads}: {elapsed:.3f}s ({serial / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
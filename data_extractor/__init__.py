@@ -4,6 +4,11 @@
 Combine **XPath**, **CSS Selectors** and **JSONPath** for Web data extracting.
 """
 
+# Standard Library
+import importlib
+
+from typing import TYPE_CHECKING, Any, List
+
 # Local Folder
 from .core import (
     AbstractComplexExtractor,
@@ -13,19 +18,6 @@ from .core import (
 )
 from .exceptions import ExprError, ExtractError
 from .item import RV, Convertor, Field, Item
-from .json import (
-    JSONExtractor,
-    JSONPathExtractor,
-    JSONPathRWExtExtractor,
-    JSONPathRWExtractor,
-)
-from .lxml import (
-    AttrCSSExtractor,
-    CSSExtractor,
-    Element,
-    TextCSSExtractor,
-    XPathExtractor,
-)
 from .utils import (
     LazyStr,
     is_complex_extractor,
@@ -34,6 +26,56 @@ from .utils import (
     sentinel,
 )
 
+if TYPE_CHECKING:
+    # Local Folder
+    from .json import (
+        JSONExtractor,
+        JSONPathExtractor,
+        JSONPathRWExtExtractor,
+        JSONPathRWExtractor,
+    )
+    from .lxml import (
+        AttrCSSExtractor,
+        CSSExtractor,
+        Element,
+        TextCSSExtractor,
+        XPathExtractor,
+    )
+
+# PEP 562 -- Module __getattr__ and __dir__
+# import the optional backends on demand.
+_lazy_attrs = {
+    "JSONExtractor": "json",
+    "JSONPathExtractor": "json",
+    "JSONPathRWExtExtractor": "json",
+    "JSONPathRWExtractor": "json",
+    "AttrCSSExtractor": "lxml",
+    "CSSExtractor": "lxml",
+    "Element": "lxml",
+    "TextCSSExtractor": "lxml",
+    "XPathExtractor": "lxml",
+}
+_lazy_modules = ("json", "lxml")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_modules:
+        return importlib.import_module(f".{name}", __name__)
+
+    try:
+        module_name = _lazy_attrs[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_lazy_attrs, *_lazy_modules})
+
+
 __all__ = (
     "AbstractComplexExtractor",
     "AbstractExtractors",
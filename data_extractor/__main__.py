@@ -0,0 +1,243 @@
+"""
+Command line interface of data_extractor.
+
+Check the Item definitions of modules,
+which are deferred by :data:`data_extractor.core.defer_source_checks`::
+
+    python -m data_extractor check MODULE [MODULE ...]
+
+Extract the documents of files, directories or stdin in parallel,
+the gzip, bz2 and xz compressed inputs are decompressed transparently::
+
+    python -m data_extractor run --schema module:Item --input DIR|FILE|- \\
+        --format html|xml|json|jsonl --workers N --output out.jsonl
+"""
+
+# Standard Library
+import argparse
+import bz2
+import gzip
+import importlib
+import io
+import lzma
+import os
+import sys
+import time
+
+from collections import Counter
+from contextlib import ExitStack
+from typing import IO, Any, Iterable, Iterator, List, Optional, Tuple
+
+# Local Folder
+from . import core
+from .item import Field, _plan_of
+from .jsonl import JSONLinesWriter
+from .parallel import (
+    ExtractorPool,
+    _failed_field,
+    _resolve_parser,
+    _resolve_schema,
+)
+
+
+def _format_syntax_error(exc: SyntaxError) -> str:
+    location = f"{exc.filename}:{exc.lineno}" if exc.filename else "<unknown>"
+    return f"{location}: {exc.msg}"
+
+
+def check(args: argparse.Namespace) -> int:
+    core.defer_source_checks = True
+    errors: List[SyntaxError] = []
+    for module in args.modules:
+        try:
+            importlib.import_module(module)
+        except SyntaxError as exc:
+            errors.append(exc)
+
+    errors.extend(core.run_deferred_source_checks())
+    for error in errors:
+        print(_format_syntax_error(error), file=sys.stderr)
+
+    return 1 if errors else 0
+
+
+_MAGIC_NUMBERS = (
+    (b"\x1f\x8b", gzip.open),
+    (b"BZh", bz2.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+)
+
+
+def _iter_input_files(path: str) -> Iterator[str]:
+    if not os.path.isdir(path):
+        yield path
+        return
+
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for filename in sorted(files):
+            yield os.path.join(root, filename)
+
+
+def _read_payloads(
+    fp: io.BufferedReader, format: str, stats: Counter
+) -> Iterator[bytes]:
+    source: IO[bytes] = fp
+    head = fp.peek(6)
+    for magic, open_ in _MAGIC_NUMBERS:
+        if head.startswith(magic):
+            # decompress while reading, closing it leaves fp open
+            source = open_(fp, "rb")  # type: ignore
+            break
+
+    try:
+        if format != "jsonl":
+            payload = source.read()
+            stats["bytes"] += len(payload)
+            yield payload
+            return
+
+        for line in source:
+            stats["bytes"] += len(line)
+            if line.strip():
+                yield line
+    finally:
+        if source is not fp:
+            source.close()
+
+
+def _iter_payloads(path: str, format: str, stats: Counter) -> Iterator[bytes]:
+    if path == "-":
+        yield from _read_payloads(sys.stdin.buffer, format, stats)  # type: ignore
+        return
+
+    for filename in _iter_input_files(path):
+        with open(filename, "rb") as fp:
+            yield from _read_payloads(fp, format, stats)
+
+
+def _extract_serially(
+    schema: Field, parser: str, payloads: Iterable[bytes]
+) -> Iterator[Tuple[Any, Optional[Exception]]]:
+    plan = _plan_of(schema)
+    parse = _resolve_parser(parser)
+    assert parse is not None
+    for payload in payloads:
+        try:
+            yield plan(parse(payload)), None
+        except Exception as exc:
+            yield None, exc
+
+
+def run(args: argparse.Namespace) -> int:
+    schema = _resolve_schema(args.schema)
+    parser = "json" if args.format == "jsonl" else args.format
+    workers = args.workers or os.cpu_count() or 1
+    output = sys.stdout.buffer if args.output == "-" else args.output
+    stats: Counter = Counter()
+    failures: Counter = Counter()
+    start = time.perf_counter()
+    with ExitStack() as stack:
+        payloads = _iter_payloads(args.input, args.format, stats)
+        if workers > 1:
+            pool = stack.enter_context(
+                ExtractorPool(args.schema, parser, processes=workers)
+            )
+            results = pool.extract(
+                payloads, chunksize=args.chunksize, return_exceptions=True
+            )
+        else:
+            results = _extract_serially(schema, parser, payloads)
+
+        sink = stack.enter_context(JSONLinesWriter(output, default=str))
+        for rv, exc in results:
+            stats["documents"] += 1
+            if exc is None:
+                sink.write(rv)
+            else:
+                failures[_failed_field(exc)] += 1
+
+    elapsed = time.perf_counter() - start
+    documents = stats["documents"]
+    mebibytes = stats["bytes"] / 2**20
+    errors = sum(failures.values())
+    print(
+        f"{documents} documents ({mebibytes:.1f}MiB) in {elapsed:.3f}s "
+        f"with {workers} worker(s): {documents / elapsed:.1f} documents/s, "
+        f"{mebibytes / elapsed:.2f}MiB/s",
+        file=sys.stderr,
+    )
+    print(f"{errors} errors", file=sys.stderr)
+    for field, count in failures.most_common():
+        print(
+            f"  {field or '<document>'}: {count} ({count / documents:.2%})",
+            file=sys.stderr,
+        )
+
+    return 1 if errors else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m data_extractor",
+        description="Combine XPath, CSS Selectors and JSONPath "
+        "for Web data extracting.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    check_parser = subparsers.add_parser(
+        "check", help="check the Item definitions of modules"
+    )
+    check_parser.add_argument("modules", nargs="+", metavar="MODULE")
+    check_parser.set_defaults(func=check)
+
+    run_parser = subparsers.add_parser(
+        "run", help="extract the documents of files in parallel"
+    )
+    run_parser.add_argument(
+        "--schema",
+        required=True,
+        metavar="MODULE:ATTR",
+        help="reference of the item or field",
+    )
+    run_parser.add_argument(
+        "--input",
+        required=True,
+        metavar="DIR|FILE|-",
+        help="directory of documents, document file, or - for stdin",
+    )
+    run_parser.add_argument(
+        "--format",
+        required=True,
+        choices=("html", "xml", "json", "jsonl"),
+        help="format of documents, jsonl for one JSON document per line",
+    )
+    run_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="number of worker processes, 1 to extract in the main process "
+        "(default: the number of CPUs)",
+    )
+    run_parser.add_argument(
+        "--output",
+        default="-",
+        metavar="FILE|-",
+        help="JSON Lines file of results, or - for stdout (default: -)",
+    )
+    run_parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=64,
+        metavar="N",
+        help="number of documents sent to a worker at once (default: 64)",
+    )
+    run_parser.set_defaults(func=run)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
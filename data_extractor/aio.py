@@ -0,0 +1,217 @@
+"""
+====================================================
+:mod:`aio` -- Extracting documents within asyncio.
+====================================================
+
+Parse and extract documents in an executor,
+so that extracting large documents doesn't block the event loop::
+
+    article = await Article().extract_async(html, parser="html")
+
+The async convertors of fields are awaited in the event loop.
+Extracting by the `extract` method outside an event loop runs them to complete,
+but it raises :class:`RuntimeError` inside a running event loop.
+"""
+
+# Standard Library
+import asyncio
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Iterable,
+    Optional,
+    Set,
+    Union,
+)
+
+# Local Folder
+from .item import Field, _async_context, _plan_of
+from .parallel import Parser, _resolve_parser, _resolve_schema
+
+
+@lru_cache(maxsize=None)
+def _resolve_schema_reference(schema: str) -> Field:
+    return _resolve_schema(schema)
+
+
+def _work(
+    schema: Union[Field, str],
+    parser: Union[str, Parser, None],
+    payload: Any,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Any:
+    if isinstance(schema, str):
+        schema = _resolve_schema_reference(schema)
+
+    plan = _plan_of(schema)
+    parse = _resolve_parser(parser)
+    element = payload if parse is None else parse(payload)
+    if loop is None:
+        return plan(element)
+
+    # await the async convertors in the event loop
+    _async_context.loop = loop
+    try:
+        return plan(element)
+    finally:
+        del _async_context.loop
+
+
+def _check_schema(schema: Union[Field, str], executor: Optional[Executor]) -> None:
+    if isinstance(executor, ProcessPoolExecutor) and not isinstance(schema, str):
+        # the schema would be pickled and compiled again per payload
+        raise ValueError(
+            f"Invalid schema: {schema!r}, "
+            "refer it in the form of 'module:attr' with process pool executor"
+        )
+
+
+async def extract_async(
+    schema: Union[Field, str],
+    payload: Any,
+    parser: Union[str, Parser, None] = None,
+    executor: Optional[Executor] = None,
+) -> Any:
+    """
+    Parse and extract the payload in the executor.
+
+    Cancelling it stops waiting for the result, \
+        but the running extracting in the executor can't be interrupted.
+
+    :param schema: The item or field, or its reference in the form of \
+        ``"module:attr"``, which is required by process pool executor \
+        for resolving the schema once per worker process.
+    :type schema: :class:`data_extractor.item.Field`, str
+    :param payload: Raw document, or the parsed one if parser is None.
+    :type payload: Any
+    :param parser: Name of the builtin parser in \
+        :data:`data_extractor.parallel.parsers`, a function parses the payload, \
+        or None to extract the payload as it is. Default: None.
+    :type parser: str, Callable[[Any], Any], optional
+    :param executor: Thread or process pool executor. \
+        Default: the default executor of the event loop.
+    :type executor: :class:`concurrent.futures.Executor`, optional
+
+    :returns: The extracted result.
+    :rtype: Any
+
+    :raises ValueError: Invalid schema or parser, \
+        or the schema isn't a reference with process pool executor.
+    :raises ~data_extractor.exceptions.ExtractError: \
+        Thrown by extractor extracting wrong data.
+    """
+    _check_schema(schema, executor)
+    _resolve_parser(parser)
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, ProcessPoolExecutor):
+        # async convertors are run to complete in the worker process
+        func = partial(_work, schema, parser, payload)
+    else:
+        func = partial(_work, schema, parser, payload, loop)
+
+    return await loop.run_in_executor(executor, func)
+
+
+async def _aiter(
+    payloads: Union[Iterable[Any], AsyncIterable[Any]],
+) -> AsyncIterator[Any]:
+    if isinstance(payloads, AsyncIterable):
+        async for payload in payloads:
+            yield payload
+    else:
+        for payload in payloads:
+            yield payload
+
+
+async def extract_many_async(
+    schema: Union[Field, str],
+    payloads: Union[Iterable[Any], AsyncIterable[Any]],
+    parser: Union[str, Parser, None] = None,
+    executor: Optional[Executor] = None,
+    concurrency: int = 4,
+    ordered: bool = True,
+    return_exceptions: bool = False,
+) -> AsyncIterator[Any]:
+    """
+    Parse and extract payloads in the executor concurrently,
+    the other parameters are the same as :func:`extract_async`.
+
+    Closing the iterator or cancelling the task iterating it \
+        cancels the pending extractings.
+
+    :param payloads: Raw documents, or the parsed ones if parser is None.
+    :type payloads: Iterable[Any], AsyncIterable[Any]
+    :param concurrency: Maximum number of payloads being extracted. Default: 4.
+    :type concurrency: int, optional
+    :param ordered: Yield results in the order of payloads, \
+        otherwise in the order of done. Default: True.
+    :type ordered: bool, optional
+    :param return_exceptions: Yield pairs of (result, None) \
+        or (None, exception) instead of raising the first exception. \
+        Default: False.
+    :type return_exceptions: bool, optional
+
+    :returns: Results, or pairs of result and exception.
+    :rtype: AsyncIterator[Any]
+    """
+    if concurrency < 1:
+        raise ValueError(f"Invalid concurrency: {concurrency!r}")
+
+    _check_schema(schema, executor)
+
+    if not isinstance(executor, ProcessPoolExecutor):
+        # resolve the schema and compile its plan once for the whole batch
+        schema = _resolve_schema(schema)
+        _plan_of(schema)
+
+    extract = partial(extract_async, schema, parser=parser, executor=executor)
+    pending: Deque["asyncio.Task[Any]"] = deque()
+    try:
+        async for payload in _aiter(payloads):
+            while len(pending) >= concurrency:
+                task = await _next_done(pending, ordered)
+                yield _result(task, return_exceptions)
+
+            pending.append(asyncio.ensure_future(extract(payload)))
+
+        while pending:
+            task = await _next_done(pending, ordered)
+            yield _result(task, return_exceptions)
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _next_done(
+    pending: Deque["asyncio.Task[Any]"], ordered: bool
+) -> "asyncio.Task[Any]":
+    if ordered:
+        task = pending[0]
+        await asyncio.wait((task,))
+    else:
+        done: Set["asyncio.Task[Any]"]
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        task = next(iter(done))
+
+    pending.remove(task)
+    return task
+
+
+def _result(task: "asyncio.Task[Any]", return_exceptions: bool) -> Any:
+    if not return_exceptions:
+        return task.result()
+
+    exc = task.exception()
+    if exc is None:
+        return task.result(), None
+
+    return None, exc
+
+
+__all__ = ("extract_async", "extract_many_async")
@@ -0,0 +1,142 @@
+"""
+===================================================
+:mod:`cache` -- Process-wide caches for extractors.
+===================================================
+"""
+
+# Standard Library
+import threading
+
+from collections import OrderedDict, namedtuple
+from typing import Callable, Dict, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+_caches: Dict[str, "LRUCache"] = {}
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Bounded and thread-safe LRU cache, registered by its name
+    for monitoring via :func:`data_extractor.cache.cache_info`.
+
+    :param name: Name of the cache.
+    :type name: str
+    :param maxsize: Maximum number of cached values, \
+        0 to disable caching. Default: 1024.
+    :type maxsize: int, optional
+    """
+
+    def __init__(self, name: str, maxsize: int = 1024):
+        self.name = name
+        self._maxsize = maxsize
+        self._data: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        _caches[name] = self
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, maxsize={self._maxsize!r})"
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        """
+        Get the cached value of key, or create it by factory then cache it.
+
+        Exception raised by factory is not cached.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :param factory: Function creates the value.
+        :type factory: Callable[[], Any]
+
+        :returns: The cached or created value.
+        :rtype: Any
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._data.move_to_end(key)
+                return value
+
+        value = factory()
+        with self._lock:
+            if self._maxsize <= 0:
+                return value
+
+            # another thread may created it when the lock released.
+            value = self._data.setdefault(key, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+        return value
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the maximum number of cached values, evicting the least recently used.
+
+        :param maxsize: Maximum number of cached values, 0 to disable caching.
+        :type maxsize: int
+        """
+        with self._lock:
+            self._maxsize = maxsize
+            while self._data and len(self._data) > max(maxsize, 0):
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all cached values and reset the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Statistics of the cache.
+
+        :returns: Hits, misses, evictions, maxsize and currsize of the cache.
+        :rtype: :class:`data_extractor.cache.CacheInfo`
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._data),
+            )
+
+
+def cache_info() -> Dict[str, CacheInfo]:
+    """
+    Statistics of all the process-wide caches.
+
+    :returns: Mapping of cache name to its statistics.
+    :rtype: Dict[str, :class:`data_extractor.cache.CacheInfo`]
+    """
+    return {name: cache.cache_info() for name, cache in _caches.items()}
+
+
+def clear_caches() -> None:
+    """
+    Clear all the process-wide caches.
+    """
+    for cache in _caches.values():
+        cache.clear()
+
+
+__all__ = ("CacheInfo", "LRUCache", "cache_info", "clear_caches")
@@ -0,0 +1,266 @@
+"""
+=======================================================
+:mod:`columnar` -- Columnar results of item extracting.
+=======================================================
+
+Extract the rows of an item into one column per field,
+instead of a list of dicts pivoted afterwards::
+
+    columns = extract_columns(Article(CSSExtractor("article"), is_many=True), [root])
+    columns.data["title"]  # list of titles
+    columns.valid["author.name"]  # validity mask of the flattened nested field
+
+The fields typed as :class:`int`, :class:`float` or :class:`bool` are stored
+in :class:`array.array`, or NumPy arrays if NumPy is installed.
+"""
+
+# Standard Library
+import importlib.util
+
+from array import array
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    TypeGuard,
+)
+
+# Local Folder
+from .exceptions import ExtractError
+from .item import Field, Item, _is_customized_extract, _plan_of, _select_element
+from .utils import _missing_dependency, sentinel
+
+_missing_numpy = importlib.util.find_spec("numpy") is None
+
+_TYPECODES = {bool: "B", int: "q", float: "d"}
+_DTYPES = {"B": "bool", "q": "int64", "d": "float64"}
+
+
+class Columns(NamedTuple):
+    """
+    Columnar result of :func:`extract_columns`.
+
+    The nested items are flattened into the columns named with dotted path, \
+        e.g. ``"author.name"``.
+    """
+
+    data: Dict[str, Any]
+    """Values of columns."""
+    valid: Dict[str, Any]
+    """Validity masks of columns, False for the missing values."""
+    size: int
+    """Number of rows."""
+
+
+class _Column:
+    __slots__ = ("values", "valid")
+
+    def __init__(self, typecode: Optional[str] = None):
+        self.values: Any = [] if typecode is None else array(typecode)
+        self.valid = array("B")
+
+    def append(self, value: Any) -> None:
+        try:
+            self.values.append(value)
+        except (TypeError, OverflowError):
+            # the value doesn't fit the typed column, e.g. a big int
+            self.values = self.values.tolist()
+            self.values.append(value)
+
+        self.valid.append(1)
+
+    def append_missing(self, value: Any) -> None:
+        if isinstance(self.values, list):
+            self.values.append(value)
+        else:
+            # the typed column is filled with zero, the validity mask tells
+            self.values.append(0)
+
+        self.valid.append(0)
+
+
+def _is_flattened(field: Field) -> TypeGuard[Item]:
+    # the nested item is flattened unless it is converted or customized
+    return (
+        isinstance(field, Item)
+        and not field.is_many
+        and field.type is None
+        and getattr(field.convertor, "__func__", None) is Item.default_convertor
+        and not _is_customized_extract(field)
+        and type(field)._extract is Item._extract
+    )
+
+
+def _typecode(field: Field) -> Optional[str]:
+    if field.is_many or field.convertor is not None or isinstance(field, Item):
+        return None
+
+    return _TYPECODES.get(field.type)  # type: ignore
+
+
+def _select_of(field: Field) -> Callable[[Any], Any]:
+    if field.extractor is None:
+        return _select_element
+
+    return field.extractor.extract
+
+
+def _compile_columns(
+    item: Item, prefix: str, columns: Dict[str, _Column]
+) -> Callable[[Any], None]:
+    steps: List[Callable[[Any], None]] = []
+    for key in item.field_names():
+        field: Field = getattr(item, key)
+        name = prefix + (field.name or key)
+        if _is_flattened(field):
+            steps.append(_compile_nested(field, name, columns))
+        elif field.is_many or _is_customized_extract(field):
+            steps.append(_compile_valid(_plan_of(field), name, columns))
+        else:
+            steps.append(_compile_field(field, name, columns))
+
+    def fill(element: Any) -> None:
+        try:
+            for step in steps:
+                step(element)
+        except ExtractError as exc:
+            exc._append(extractor=item)
+            raise exc
+
+    return fill
+
+
+def _compile_valid(
+    plan: Callable[[Any], Any], name: str, columns: Dict[str, _Column]
+) -> Callable[[Any], None]:
+    column = columns[name] = _Column()
+
+    def step(element: Any) -> None:
+        column.append(plan(element))
+
+    return step
+
+
+def _compile_field(
+    field: Field, name: str, columns: Dict[str, _Column]
+) -> Callable[[Any], None]:
+    default = field.default
+    column = columns[name] = _Column(_typecode(field))
+    select = _select_of(field)
+    convert = field._compile_extract()
+
+    def step(element: Any) -> None:
+        rv = select(element)
+        if not rv:
+            if default is sentinel:
+                raise ExtractError(field, element)
+
+            column.append_missing(default)
+        elif convert is None:
+            column.append(rv[0])
+        else:
+            column.append(convert(rv[0]))
+
+    return step
+
+
+def _compile_nested(
+    item: Item, name: str, columns: Dict[str, _Column]
+) -> Callable[[Any], None]:
+    nested: Dict[str, _Column] = {}
+    fill = _compile_columns(item, f"{name}.", nested)
+    columns.update(nested)
+    missing = list(nested.values())
+    default = item.default
+    select = _select_of(item)
+
+    def step(element: Any) -> None:
+        rv = select(element)
+        if rv:
+            fill(rv[0])
+        elif default is sentinel:
+            raise ExtractError(item, element)
+        else:
+            # the default of the nested item is a whole row
+            for column in missing:
+                column.append_missing(None)
+
+    return step
+
+
+def extract_columns(
+    item: Item, elements: Iterable[Any], numpy: Optional[bool] = None
+) -> Columns:
+    """
+    Extract the rows of elements into columns.
+
+    The rows are selected by the extractor of item, \
+        all of them if the item is_many, otherwise the first one. \
+        The values of fields are appended to their columns directly, \
+        the nested items are flattened into columns of their fields \
+        unless they have type or convertor, \
+        the fields is_many are stored as lists of values. \
+        The convertor of item itself isn't applied.
+
+    The missing values are filled with the default of field, \
+        None for the fields of missing nested item, \
+        or zero for the typed columns.
+
+    :param item: The item extracts rows.
+    :type item: :class:`data_extractor.item.Item`
+    :param elements: The target data node elements.
+    :type elements: Iterable[Any]
+    :param numpy: Convert the typed columns and validity masks into NumPy arrays. \
+        Default: True if NumPy is installed.
+    :type numpy: bool, optional
+
+    :returns: The columns.
+    :rtype: :class:`data_extractor.columnar.Columns`
+
+    :raises RuntimeError: NumPy is needed but not installed.
+    :raises ~data_extractor.exceptions.ExtractError: \
+        Thrown by extractor extracting wrong data.
+    """
+    if numpy is None:
+        numpy = not _missing_numpy
+    elif numpy and _missing_numpy:
+        _missing_dependency("numpy")
+
+    columns: Dict[str, _Column] = {}
+    fill = _compile_columns(item, "", columns)
+    select = _select_of(item)
+    size = 0
+    for element in elements:
+        rows = select(element)
+        if not item.is_many:
+            if not rows and item.default is sentinel:
+                raise ExtractError(item, element)
+
+            rows = rows[:1]
+
+        for row in rows:
+            fill(row)
+
+        size += len(rows)
+
+    data = {name: column.values for name, column in columns.items()}
+    valid: Dict[str, Any] = {name: column.valid for name, column in columns.items()}
+    if numpy:
+        # Third Party Library
+        import numpy as np
+
+        for name, values in data.items():
+            if isinstance(values, array):
+                data[name] = np.frombuffer(values, dtype=_DTYPES[values.typecode])
+
+        for name, mask in valid.items():
+            valid[name] = np.frombuffer(mask, dtype=bool)
+
+    return Columns(data, valid, size)
+
+
+__all__ = ("Columns", "extract_columns")
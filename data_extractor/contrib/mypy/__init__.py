@@ -7,6 +7,7 @@ from typing import Any, Callable, Dict, List, Optional, Type, Union, cast
 # Third Party Library
 from mypy.checker import TypeChecker, is_true_literal
 from mypy.nodes import (
+    ARG_NAMED,
     AssignmentStmt,
     CallExpr,
     ClassDef,
@@ -300,10 +301,41 @@ class DataExtractorPlugin(Plugin):
             return self.is_extractor_cls(fullname[: -len(suffix)])
         return False
 
+    def is_lazy_extract_signature(self, signature: CallableType) -> bool:
+        # the overloads of Item.extract with lazy=True return LazyResult
+        ret_type = signature.ret_type
+        if not isinstance(ret_type, UnionType):
+            return False
+
+        for item in ret_type.items:
+            if isinstance(item, Instance) and item.type.name == "list" and item.args:
+                item = item.args[0]
+
+            if (
+                isinstance(item, Instance)
+                and item.type.fullname == "data_extractor.lazy.LazyResult"
+            ):
+                return True
+
+        return False
+
+    def is_projected_extract_signature(self, signature: CallableType) -> bool:
+        # the overloads of Item.extract with only or exclude return dicts
+        return any(
+            kind == ARG_NAMED and name in ("only", "exclude")
+            for name, kind in zip(signature.arg_names, signature.arg_kinds)
+        )
+
     def apply_extract_method(
         self, ctx: MethodSigContext, fullname: str
     ) -> CallableType:
+        if self.is_lazy_extract_signature(ctx.default_signature):
+            return ctx.default_signature
+
         rv = self.apply_is_many_on_extract_method(ctx, fullname)
+        if self.is_projected_extract_signature(ctx.default_signature):
+            # the projected dicts have part of the fields
+            return rv
 
         # apply item typeddict
         item_classname = fullname[: -len(".extract")]
@@ -6,15 +6,20 @@
 
 # Standard Library
 import ast
+import copyreg
 import inspect
+import linecache
+import os
 
 from abc import abstractmethod
 from collections import namedtuple
+from functools import partial
 from types import FrameType, FunctionType, MethodType
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Local Folder
-from .utils import Property, getframe, sentinel
+from .cache import LRUCache
+from .utils import Property, _private_name, getframe, sentinel
 
 _LineInfo = namedtuple("_LineInfo", ["file", "lineno", "offset", "line"])
 
@@ -104,84 +109,263 @@ def _check_field_overwrites_bases_method(
         raise SyntaxError(err_msg, exc_args)
 
 
-def _check_field_overwrites_method(cls: object) -> None:
-    frame = getframe(2)
-    if frame is None:
-        return
+_SourceIndex = namedtuple("_SourceIndex", ["lines", "classes"])
 
-    filename = frame.f_code.co_filename
-    firstlineno = frame.f_lineno
+source_index_cache: LRUCache[Tuple[str, int, int], _SourceIndex] = LRUCache(
+    "source_index", maxsize=256
+)
+"""
+Process-wide cache of the class definitions indexed by line number
+per source file, keyed by filename, mtime and size of the file.
+"""
+
+defer_source_checks: bool = os.environ.get(
+    "DATA_EXTRACTOR_DEFER_SOURCE_CHECKS", ""
+) not in ("", "0")
+"""
+Defer the source code inspection checks of Item definitions
+until :func:`run_deferred_source_checks` is called,
+so that creating Item subclasses costs nearly nothing.
+Set environment variable **DATA_EXTRACTOR_DEFER_SOURCE_CHECKS=1**
+or change this value to enable it.
+"""
+
+lazy_compile: bool = os.environ.get("DATA_EXTRACTOR_LAZY_COMPILE", "") not in (
+    "",
+    "0",
+)
+"""
+Defer compiling the expressions of simple extractors
+until their first extracting, which is thread-safe and done exactly once,
+so that creating extractors costs nearly nothing.
+Call :meth:`AbstractSimpleExtractor.validate` to compile them eagerly.
+Set environment variable **DATA_EXTRACTOR_LAZY_COMPILE=1**
+or change this value to enable it,
+or pass the optional parameter **lazy** to the extractor.
+"""
+
+_deferred_source_checks: Dict[Tuple[str, int], str] = {}
+
+
+def _build_source_index(lines: List[str]) -> _SourceIndex:
+    mod = ast.parse("".join(lines))
+    classes: Dict[int, Optional[Tuple[Dict[str, Tuple[int, int]], ...]]] = {}
+    for node in ast.walk(mod):
+        if not isinstance(node, (ast.ClassDef, ast.Call)) or node.lineno in classes:
+            continue
+
+        if isinstance(node, ast.Call):
+            # There is no point to check if field overwrites method,
+            # due to item is created by `type` function.
+            classes[node.lineno] = None
+            continue
+
+        assigns: Dict[str, Tuple[int, int]] = {}
+        methods: Dict[str, Tuple[int, int]] = {}
+        for stmt in node.body:
+            if isinstance(stmt, ast.Assign):
+                for target_ in stmt.targets:
+                    if not isinstance(target_, ast.Name):
+                        continue
+
+                    assigns[target_.id] = (stmt.lineno, stmt.col_offset)
+            elif isinstance(stmt, ast.FunctionDef):
+                methods[stmt.name] = (stmt.lineno, stmt.col_offset)
+
+        classes[node.lineno] = (assigns, methods)
+
+    return _SourceIndex(lines, classes)
+
+
+def _load_source_index(
+    filename: str, getlines: Callable[[], List[str]]
+) -> _SourceIndex:
     try:
-        lines, _ = inspect.findsource(frame)
+        stat = os.stat(filename)
     except OSError:
-        # can't get the source code from python repl
-        return
+        # source code not from file, e.g. exec in python repl
+        return _build_source_index(getlines())
 
-    source = "".join(lines)
-    mod = ast.parse(source)
-    for node in ast.walk(mod):
-        if isinstance(node, (ast.ClassDef, ast.Call)) and node.lineno == firstlineno:
-            item_node = node
-            break
-    else:  # pragma: no cover
-        assert 0, f"Can't find the source of {cls}."
+    key = (filename, stat.st_mtime_ns, stat.st_size)
+    return source_index_cache.get_or_create(
+        key, lambda: _build_source_index(getlines())
+    )
 
-    if isinstance(item_node, ast.Call):
-        # There is no point to check if field overwrites method,
-        # due to item is created by `type` function.
-        return
 
-    assigns: Dict[str, ast.Assign] = {}
-    methods: Dict[str, ast.FunctionDef] = {}
-    for node in item_node.body:
-        if isinstance(node, ast.Assign):
-            for target_ in node.targets:
-                if not isinstance(target_, ast.Name):
-                    continue
+def _check_source(
+    name: str, filename: str, firstlineno: int, index: _SourceIndex
+) -> None:
+    try:
+        class_info = index.classes[firstlineno]
+    except KeyError:  # pragma: no cover
+        assert 0, f"Can't find the source of {name}."
 
-                assigns[target_.id] = node
-        elif isinstance(node, ast.FunctionDef):
-            methods[node.name] = node
+    if class_info is None:
+        return
 
+    assigns, methods = class_info
     unions = assigns.keys() & methods.keys()
     if not unions:
         return
 
+    lines = index.lines
     key = next(iter(unions))
-    assign = assigns[key]
-    method = methods[key]
-    if assign.lineno > method.lineno:
-        lineno = assign.lineno
-        offset = assign.col_offset
+    assign_lineno, assign_offset = assigns[key]
+    method_lineno, method_offset = methods[key]
+    if assign_lineno > method_lineno:
+        lineno = assign_lineno
+        offset = assign_offset
         line = lines[lineno - 1].strip()
 
         msg = (
-            f"method {lines[method.lineno - 1].strip()!r} "
-            f"on lineno={method.lineno} "
+            f"method {lines[method_lineno - 1].strip()!r} "
+            f"on lineno={method_lineno} "
             f"overwrited by assign {line!r}. "
             f"Please using the optional parameter name={key!r} "
             f"in {line!r} to avoid overwriting."
         )
     else:
-        lineno = method.lineno
-        offset = method.col_offset
+        lineno = method_lineno
+        offset = method_offset
         line = lines[lineno - 1].strip()
         msg = (
-            f"assign {lines[assign.lineno - 1].strip()!r} "
-            f"on lineno={assign.lineno} "
+            f"assign {lines[assign_lineno - 1].strip()!r} "
+            f"on lineno={assign_lineno} "
             f"overwrited by method {line!r}. "
             f"Please using the optional parameter name={key!r} "
-            f"in {lines[assign.lineno - 1].strip()!r} to avoid overwriting."
+            f"in {lines[assign_lineno - 1].strip()!r} to avoid overwriting."
         )
 
     raise SyntaxError(msg, (filename, lineno, offset, line))
 
 
+def _check_field_overwrites_method(cls: type) -> None:
+    frame = getframe(2)
+    if frame is None:
+        return
+
+    code = frame.f_code
+    filename = code.co_filename
+    firstlineno = frame.f_lineno
+    if defer_source_checks:
+        _deferred_source_checks.setdefault((filename, firstlineno), cls.__qualname__)
+        return
+
+    try:
+        index = _load_source_index(filename, lambda: inspect.findsource(code)[0])
+    except OSError:
+        # can't get the source code from python repl
+        return
+
+    _check_source(cls.__qualname__, filename, firstlineno, index)
+
+
+def _getlines(filename: str) -> List[str]:
+    lines = linecache.getlines(filename)
+    if not lines:
+        raise OSError("could not get source code")
+
+    return lines
+
+
+def run_deferred_source_checks() -> List[SyntaxError]:
+    """
+    Run the source code inspection checks deferred by :data:`defer_source_checks`.
+
+    :returns: Errors of the Item definitions, \
+        e.g. its field overwrites method.
+    :rtype: List[SyntaxError]
+    """
+    errors: List[SyntaxError] = []
+    deferred = list(_deferred_source_checks.items())
+    _deferred_source_checks.clear()
+    for (filename, firstlineno), name in deferred:
+        try:
+            index = _load_source_index(filename, partial(_getlines, filename))
+        except OSError:
+            continue
+
+        try:
+            _check_source(name, filename, firstlineno, index)
+        except SyntaxError as exc:
+            errors.append(exc)
+
+    return errors
+
+
+def _loader_properties(cls: type) -> List[Property]:
+    props: Dict[str, Property] = {}
+    for klass in cls.__mro__:
+        for key, attr in vars(klass).items():
+            if isinstance(attr, Property) and attr.loader is not None:
+                props.setdefault(key, attr)
+
+    return list(props.values())
+
+
+def _slots_of(attr_dict: Dict[str, Any], bases: Tuple[type, ...]) -> Tuple[str, ...]:
+    slots = attr_dict.get("__slots__", ())
+    if isinstance(slots, str):
+        slots = (slots,)
+
+    slots = tuple(slots)
+    for key, attr in attr_dict.items():
+        if not isinstance(attr, Property):
+            continue
+
+        slot = _private_name(key)
+        # the property redefined by subclass reuses the slot of its bases.
+        if slot not in slots and not any(hasattr(base, slot) for base in bases):
+            slots += (slot,)
+
+    return slots
+
+
+def _getstate(obj: Any) -> Dict[str, Any]:
+    state = dict(getattr(obj, "__dict__", ()))
+    for klass in type(obj).__mro__:
+        slots = vars(klass).get("__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot in ("__dict__", "__weakref__"):
+                continue
+
+            try:
+                state[slot] = getattr(obj, slot)
+            except AttributeError:
+                # unset slot
+                pass
+
+    return state
+
+
+def _setstate(obj: Any, state: Dict[str, Any]) -> None:
+    for key, value in state.items():
+        object.__setattr__(obj, key, value)
+
+
 class SimpleExtractorMeta(type):
     """
     Simple Extractor Meta Class.
+
+    The values of :class:`data_extractor.utils.Property` are stored in slots, \
+        which are added into the `__slots__` of the classes of this package \
+        and the classes defining `__slots__`. \
+        The other classes keep the instance dictionary for their own attributes.
     """
 
+    def __new__(
+        mcs,  # noqa: B902
+        name: str,
+        bases: Tuple[type, ...],
+        attr_dict: Dict[str, Any],
+        **kwargs: Any,
+    ) -> Any:
+        module = attr_dict.get("__module__", "")
+        if "__slots__" in attr_dict or module.partition(".")[0] == __package__:
+            attr_dict["__slots__"] = _slots_of(attr_dict, bases)
+
+        return super().__new__(mcs, name, bases, attr_dict, **kwargs)
+
 
 class ComplexExtractorMeta(SimpleExtractorMeta):
     """
@@ -196,7 +380,7 @@ class ComplexExtractorMeta(SimpleExtractorMeta):
     ):
         super().__init__(name, bases, attr_dict)
 
-        field_names = set()
+        new_field_names = []
         for key, attr in attr_dict.items():
             if isinstance(type(attr), ComplexExtractorMeta):
                 # can't using data_extractor.utils.is_complex_extractor here,
@@ -205,18 +389,31 @@ class ComplexExtractorMeta(SimpleExtractorMeta):
                 _check_field_overwrites_bases_method(cls, name, bases, key, attr)
                 _check_field_overwrites_bases_property(cls, name, bases, key, attr)
 
-                field_names.add(key)
+                new_field_names.append(key)
 
-        # check field overwrites method
-        _check_field_overwrites_method(cls)
+        # check field overwrites method,
+        # except the classes of this package which are checked by its tests.
+        if cls.__module__.partition(".")[0] != __package__:
+            _check_field_overwrites_method(cls)
 
-        field_names |= set(getattr(cls, "_field_names", []))
-        for key in field_names.copy():
-            attr = getattr(cls, key, None)
-            if not attr or not isinstance(type(attr), ComplexExtractorMeta):
-                field_names.remove(key)
+        # the fields of bases go first, then the new ones in definition order
+        field_names = list(getattr(cls, "_field_names", []))
+        field_names.extend(key for key in new_field_names if key not in field_names)
+        cls._field_names: Tuple[str, ...] = tuple(
+            key
+            for key in field_names
+            if isinstance(type(getattr(cls, key, None)), ComplexExtractorMeta)
+        )
+
+
+def _reduce_extractor_class(cls: type) -> Any:
+    # The dynamically created classes, e.g. Field[int],
+    # can't be pickled by reference, rebuild them by their factories.
+    return vars(cls).get("_class_reduce", cls.__qualname__)
 
-        cls._field_names: Tuple[str, ...] = tuple(field_names)
+
+copyreg.pickle(SimpleExtractorMeta, _reduce_extractor_class)
+copyreg.pickle(ComplexExtractorMeta, _reduce_extractor_class)
 
 
 class AbstractSimpleExtractor(metaclass=SimpleExtractorMeta):
@@ -227,16 +424,37 @@ class AbstractSimpleExtractor(metaclass=SimpleExtractorMeta):
 
     :param expr: Extractor selector expression.
     :type expr: str
+    :param lazy: Compile the expression on first extracting. \
+        Default: :data:`data_extractor.core.lazy_compile`.
+    :type lazy: bool, optional
+
+    :raises ~data_extractor.exceptions.ExprError: Extractor Expression Error.
     """
 
+    __slots__ = ("__weakref__",)
+
     expr = Property[str]()
 
-    def __init__(self, expr: str):
+    def __init__(self, expr: str, *, lazy: Optional[bool] = None):
         self.expr = expr
+        if not (lazy_compile if lazy is None else lazy):
+            self.validate()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.expr!r})"
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # the compiled expressions may not be picklable,
+        # which are compiled again via caches after unpickling.
+        state = _getstate(self)
+        for prop in _loader_properties(type(self)):
+            state.pop(prop.private_name, None)
+
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        _setstate(self, state)
+
     @abstractmethod
     def extract(self, element: Any) -> Any:
         """
@@ -252,6 +470,17 @@ class AbstractSimpleExtractor(metaclass=SimpleExtractorMeta):
         """
         raise NotImplementedError
 
+    def validate(self) -> None:
+        """
+        Compile the expression if it is not compiled yet, \
+            e.g. the extractor is created in lazy mode.
+
+        :raises ~data_extractor.exceptions.ExprError: Extractor Expression Error.
+        """
+        cls = type(self)
+        for prop in _loader_properties(cls):
+            prop.__get__(self, cls)
+
     def extract_first(self, element: Any, default: Any = sentinel) -> Any:
         """
         Extract the first data or subelement from `extract` method call result.
@@ -288,6 +517,14 @@ class AbstractComplexExtractor(metaclass=ComplexExtractorMeta):
     Its metaclass is :class:`data_extractor.core.ComplexExtractorMeta`
     """
 
+    __slots__ = ("__weakref__",)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return _getstate(self)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        _setstate(self, state)
+
     @abstractmethod
     def extract(self, element: Any) -> Any:
         """
@@ -313,4 +550,8 @@ __all__ = (
     "AbstractSimpleExtractor",
     "ComplexExtractorMeta",
     "SimpleExtractorMeta",
+    "defer_source_checks",
+    "lazy_compile",
+    "run_deferred_source_checks",
+    "source_index_cache",
 )
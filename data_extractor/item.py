@@ -6,28 +6,111 @@
 
 # Standard Library
 import copy
+import inspect
+import operator
+import threading
 
 from typing import (
+    TYPE_CHECKING,
     Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
     Callable,
     Dict,
     Generic,
+    Iterable,
     Iterator,
     List,
+    Literal,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
+    overload,
 )
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
 # Local Folder
 from .core import AbstractComplexExtractor, AbstractSimpleExtractor
 from .exceptions import ExtractError
 from .utils import Property, is_simple_extractor, sentinel
 
+if TYPE_CHECKING:
+    # Standard Library
+    from concurrent.futures import Executor
+
+    # Local Folder
+    from .lazy import LazyResult
+
 RV = TypeVar("RV")
 Convertor = Callable[[Any], RV]
 
+# the event loop awaits async convertors for the extracting in executor,
+# see data_extractor.aio
+_async_context = threading.local()
+
+# bumped on changing any property of fields, the plans compiled in an older
+# generation are compiled again, e.g. the items built with the plans of fields.
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def _run_awaitable(awaitable: Awaitable[RV]) -> RV:
+    # Standard Library
+    import asyncio
+
+    loop: Optional[asyncio.AbstractEventLoop] = getattr(_async_context, "loop", None)
+    if loop is not None:
+        return asyncio.run_coroutine_threadsafe(
+            _await(awaitable), loop
+        ).result()  # type: ignore
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_await(awaitable))
+
+    if inspect.iscoroutine(awaitable):
+        # never awaited
+        awaitable.close()
+
+    raise RuntimeError(
+        "Can't await the async convertor by extracting in the running event loop, "
+        "use the extract_async method instead."
+    )
+
+
+async def _await(awaitable: Awaitable[RV]) -> RV:
+    return await awaitable
+
+
+def _sync_convertor(convertor: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    if inspect.iscoroutinefunction(convertor):
+
+        def convert(value: Any) -> Any:
+            return _run_awaitable(convertor(value))
+
+        return convert
+
+    def maybe_convert(value: Any) -> Any:
+        # e.g. lambda or callable object returns coroutine, like Field._extract
+        rv = convertor(value)
+        if inspect.isawaitable(rv):
+            return _run_awaitable(rv)
+
+        return rv
+
+    return maybe_convert
+
+
+# cache of Field[T] and Item[T] specializations per class,
+# the values are weak too, for the specializations are subclasses of the keys.
+_specializations: "WeakKeyDictionary[type, WeakValueDictionary[Any, type]]" = (
+    WeakKeyDictionary()
+)
+
 
 class Field(Generic[RV], AbstractComplexExtractor):
     """
@@ -47,6 +130,8 @@ class Field(Generic[RV], AbstractComplexExtractor):
     :raises ValueError: Can't both set default and is_manay=True.
     """
 
+    __slots__ = ("_plan", "_plan_generation", "_plan_codegen")
+
     extractor = Property[Optional[AbstractSimpleExtractor]]()
     name = Property[Optional[str]]()
     default = Property[Any]()
@@ -78,6 +163,9 @@ class Field(Generic[RV], AbstractComplexExtractor):
         self.is_many = is_many
         self.type = type
         self.convertor = convertor
+        self._plan: Optional[Callable[[Any], Union[RV, List[RV]]]] = None
+        self._plan_generation = 0
+        self._plan_codegen = False
 
     def __class_getitem__(cls, rv_type: Type[RV]):
         def new_init(
@@ -102,8 +190,25 @@ class Field(Generic[RV], AbstractComplexExtractor):
         if rv_type is RV:  # type: ignore
             # it is a type-unbound container class
             return cls
-        else:
-            return type(cls.__name__, (cls,), {"__init__": new_init})
+
+        attrs = {
+            "__slots__": (),
+            "__init__": new_init,
+            "_class_reduce": (operator.getitem, (cls, rv_type)),
+        }
+        try:
+            by_type = _specializations[cls]
+        except KeyError:
+            by_type = _specializations.setdefault(cls, WeakValueDictionary())
+
+        try:
+            return by_type[rv_type]
+        except KeyError:
+            specialized = type(cls.__name__, (cls,), attrs)
+            return by_type.setdefault(rv_type, specialized)
+        except TypeError:
+            # unhashable type parameter
+            return type(cls.__name__, (cls,), attrs)
 
     def __repr__(self) -> str:
         args = [f"{self.extractor!r}"]
@@ -118,29 +223,111 @@ class Field(Generic[RV], AbstractComplexExtractor):
 
         return f"{self.__class__.__name__}({', '.join(args)})"
 
+    def validate(self) -> None:
+        """
+        Compile the expression of extractor if it is not compiled yet, \
+            e.g. the extractor is created in lazy mode.
+
+        :raises ~data_extractor.exceptions.ExprError: Extractor Expression Error.
+        """
+        if self.extractor is not None:
+            self.extractor.validate()
+
     def extract(self, element: Any) -> Union[RV, List[RV]]:
-        if self.extractor is None:
-            if isinstance(element, list):
-                rv = element
+        plan = self._plan
+        if plan is None or self._plan_generation != _generation:
+            plan = self.compile(self._plan_codegen)
+
+        return plan(element)
+
+    def extract_many(
+        self, elements: Iterable[Any], return_exceptions: bool = False
+    ) -> Iterator[Any]:
+        """
+        Extract the wanted data from every element lazily,
+        resolving the properties once for the whole batch.
+
+        :param elements: The target data node elements, e.g. parsed documents.
+        :type elements: Iterable[Any]
+        :param return_exceptions: Yield pairs of (result, None) or (None, exception) \
+            instead of raising the first exception. Default: False.
+        :type return_exceptions: bool, optional
+
+        :returns: Results in the order of elements, \
+            or pairs of result and exception.
+        :rtype: Iterator[Any]
+
+        :raises ~data_extractor.exceptions.ExtractError: \
+            Thrown by extractor extracting wrong data.
+        """
+        plan = _plan_of(self)
+        if not return_exceptions:
+            yield from map(plan, elements)
+            return
+
+        for element in elements:
+            try:
+                rv = plan(element)
+            except Exception as exc:
+                yield None, exc
             else:
-                rv = [element]
-        else:
-            rv = self.extractor.extract(element)
+                yield rv, None
 
-        if self.is_many:
-            return [self._extract(r) for r in rv]
+    async def extract_async(
+        self,
+        element: Any,
+        parser: Union[str, Callable[[Any], Any], None] = None,
+        executor: Optional["Executor"] = None,
+    ) -> Union[RV, List[RV]]:
+        """
+        Parse and extract the wanted data in the executor \
+            without blocking the event loop, \
+            see :func:`data_extractor.aio.extract_async`.
+
+        The process pool executor needs the schema referred by ``"module:attr"``, \
+            call :func:`data_extractor.aio.extract_async` with it instead.
+        """
+        # Local Folder
+        from .aio import extract_async
+
+        return await extract_async(self, element, parser, executor)
 
-        if not rv:
-            if self.default is sentinel:
-                raise ExtractError(self, element)
+    def extract_many_async(
+        self,
+        elements: Union[Iterable[Any], AsyncIterable[Any]],
+        parser: Union[str, Callable[[Any], Any], None] = None,
+        executor: Optional["Executor"] = None,
+        concurrency: int = 4,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Any]:
+        """
+        Parse and extract the wanted data in the executor concurrently, \
+            see :func:`data_extractor.aio.extract_many_async`.
 
-            return self.default
+        The process pool executor needs the schema referred by ``"module:attr"``, \
+            call :func:`data_extractor.aio.extract_many_async` with it instead.
+        """
+        # Local Folder
+        from .aio import extract_many_async
 
-        return self._extract(rv[0])
+        return extract_many_async(
+            self,
+            elements,
+            parser,
+            executor,
+            concurrency,
+            ordered,
+            return_exceptions,
+        )
 
     def _extract(self, element: Any) -> RV:
         if self.convertor is not None:
-            return self.convertor(element)
+            rv = self.convertor(element)
+            if inspect.isawaitable(rv):
+                return _run_awaitable(rv)
+
+            return rv
         else:
             cls = self.type
             if cls is not None and callable(cls):
@@ -149,19 +336,161 @@ class Field(Generic[RV], AbstractComplexExtractor):
             else:
                 return element
 
-    def __deepcopy__(self, memo: Dict[int, Any]) -> AbstractComplexExtractor:
-        deepcopy_method = self.__deepcopy__
-        self.__deepcopy__ = None  # type: ignore
-        cp = copy.deepcopy(self, memo)
-        self.__deepcopy__ = deepcopy_method  # type: ignore
+    def compile(self, codegen: bool = False) -> Callable[[Any], Union[RV, List[RV]]]:
+        """
+        Lower the field into a plan with all properties resolved once,
+        which is used by the `extract` method from now on.
+
+        The plan is compiled automatically on the first extracting \
+            and after changing the properties of any field, \
+            calling it again rebuilds the plan.
 
+        :param codegen: Generate the source code of items' extracting functions \
+            by :mod:`data_extractor.codegen`. Default: False.
+        :type codegen: bool, optional
+
+        :returns: A function has the same behavior as the `extract` method.
+        :rtype: Callable[[Any], Any]
+        """
+        generation = _generation
+        plan = self._compile(codegen)
+        self._plan = plan
+        self._plan_generation = generation
+        self._plan_codegen = codegen
+        return plan
+
+    def _compile(self, codegen: bool = False) -> Callable[[Any], Union[RV, List[RV]]]:
+        extract_row: Optional[Callable[[Any], Any]]
+        if codegen:
+            # Local Folder
+            from .codegen import compile_extract
+
+            extract_row = compile_extract(self)
+        else:
+            extract_row = self._compile_extract()
+
+        return _compile_plan(self, extract_row)
+
+    def _compile_extract(self) -> Optional[Callable[[Any], RV]]:
+        if type(self)._extract is not Field._extract:
+            # respect the customized _extract method
+            return self._extract
+
+        return self._compile_convertor()
+
+    def _compile_convertor(self) -> Optional[Callable[[Any], RV]]:
+        if self.convertor is not None:
+            return _sync_convertor(self.convertor)
+
+        cls = self.type
+        if cls is not None and callable(cls):
+            return cls
+
+        return None
+
+    def _property_changed(self, name: str) -> None:
+        # called by Property.change_internal_value, the plans built with this field
+        # are compiled with the old value.
+        global _generation
+        with _generation_lock:
+            _generation += 1
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        # the plan is made of closures, which is compiled again after unpickling.
+        state["_plan"] = None
+        return state
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> AbstractComplexExtractor:
+        cls = type(self)
+        cp = cls.__new__(cls)
+        memo[id(self)] = cp
         # avoid duplicating the sentinel object.
-        if self.default is sentinel:
-            Property.change_internal_value(cp, "default", sentinel)
+        memo.setdefault(id(sentinel), sentinel)
+        cp.__setstate__(copy.deepcopy(self.__getstate__(), memo))
 
+        # the plan refers to the original one, needs to be compiled again.
+        cp._plan = None
         return cp
 
 
+def _select_element(element: Any) -> List[Any]:
+    if isinstance(element, list):
+        return element
+    else:
+        return [element]
+
+
+def _is_customized_extract(field: Field) -> bool:
+    return type(field).extract not in (Field.extract, Item.extract)
+
+
+def _compile_plan(
+    field: Field, extract_row: Optional[Callable[[Any], Any]]
+) -> Callable[[Any], Any]:
+    # select the rows by the extractor of field, then extract every row
+    select: Callable[[Any], Any]
+    if field.extractor is None:
+        select = _select_element
+    else:
+        select = field.extractor.extract
+
+    plan: Callable[[Any], Any]
+    if field.is_many:
+        if extract_row is None:
+
+            def plan(element: Any) -> List[Any]:
+                return list(select(element))
+
+        else:
+            row = extract_row
+
+            def plan(element: Any) -> List[Any]:
+                return [row(r) for r in select(element)]
+
+        return plan
+
+    default = field.default
+    if extract_row is None:
+
+        def plan(element: Any) -> Any:
+            rv = select(element)
+            if not rv:
+                if default is sentinel:
+                    raise ExtractError(field, element)
+
+                return default
+
+            return rv[0]
+
+    else:
+        row = extract_row
+
+        def plan(element: Any) -> Any:
+            rv = select(element)
+            if not rv:
+                if default is sentinel:
+                    raise ExtractError(field, element)
+
+                return default
+
+            return row(rv[0])
+
+    return plan
+
+
+def _plan_of(field: Field) -> Callable[[Any], Any]:
+    if _is_customized_extract(field):
+        # respect the customized extract method
+        return field.extract
+
+    plan = field._plan
+    if plan is None or field._plan_generation != _generation:
+        plan = field.compile(field._plan_codegen)
+
+    return plan
+
+
 class Item(Field[RV]):
     """
     Extract data by cooperating with extractors, fields and items.
@@ -193,6 +522,113 @@ class Item(Field[RV]):
 
         return rv  # type: ignore
 
+    @overload
+    def extract(
+        self,
+        element: Any,
+        lazy: Literal[False] = False,
+        only: None = None,
+        exclude: None = None,
+    ) -> Union[RV, List[RV]]:
+        pass
+
+    @overload
+    def extract(
+        self,
+        element: Any,
+        lazy: Literal[False] = False,
+        *,
+        only: Iterable[str],
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        pass
+
+    @overload
+    def extract(
+        self,
+        element: Any,
+        lazy: Literal[False] = False,
+        only: Optional[Iterable[str]] = None,
+        *,
+        exclude: Iterable[str],
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        pass
+
+    @overload
+    def extract(
+        self,
+        element: Any,
+        lazy: Literal[True],
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union["LazyResult", List["LazyResult"]]:
+        pass
+
+    @overload
+    def extract(
+        self,
+        element: Any,
+        lazy: bool,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[
+        RV,
+        List[RV],
+        Dict[str, Any],
+        List[Dict[str, Any]],
+        "LazyResult",
+        List["LazyResult"],
+    ]:
+        pass
+
+    def extract(
+        self,
+        element: Any,
+        lazy: bool = False,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Any:
+        """
+        Extract the wanted data.
+
+        :param element: The target data node element.
+        :type element: Any
+        :param lazy: Return :class:`data_extractor.lazy.LazyResult` \
+            evaluating the fields on first access instead, \
+            see :func:`data_extractor.lazy.extract_lazy`. Default: False.
+        :type lazy: bool, optional
+        :param only: Paths of the fields to keep, e.g. ``{"title", "seller.name"}``, \
+            see :func:`data_extractor.projection.compile_projection`. \
+            Default: all the fields.
+        :type only: Iterable[str], optional
+        :param exclude: Paths of the fields to remove. Default: no field.
+        :type exclude: Iterable[str], optional
+
+        :returns: Data or subelement.
+        :rtype: Any
+
+        :raises ValueError: Invalid projection.
+        :raises ~data_extractor.exceptions.ExtractError: \
+            Thrown by extractor extracting wrong data.
+        """
+        if lazy:
+            # Local Folder
+            from .lazy import extract_lazy
+
+            return extract_lazy(self, element, only, exclude)
+
+        if only is not None or exclude is not None:
+            # Local Folder
+            from .projection import compile_projection
+
+            return compile_projection(self, only, exclude).plan(element)
+
+        plan = self._plan
+        if plan is None or self._plan_generation != _generation:
+            plan = self.compile(self._plan_codegen)
+
+        return plan(element)
+
     def _extract(self, element: Any) -> RV:
         rv = {}
         for field in self.field_names():
@@ -208,6 +644,93 @@ class Item(Field[RV]):
 
         return super()._extract(rv)
 
+    def _compile_extract(self) -> Optional[Callable[[Any], RV]]:
+        if type(self)._extract is not Item._extract:
+            # respect the customized _extract method
+            return self._extract
+
+        fields = []
+        for key in self.field_names():
+            extractor = getattr(self, key)
+            if extractor.name is not None:
+                key = extractor.name
+
+            fields.append((key, _plan_of(extractor)))
+
+        item = self
+        record = self._record_type_of()
+        if record is not None:
+            # Local Folder
+            from .record import compile_record
+
+            # create the record positionally without the intermediate dict
+            return compile_record(item, record, [plan for _, plan in fields])
+
+        convert = self._compile_convertor()
+
+        def extract_row(element: Any) -> Any:
+            rv = {}
+            try:
+                for key, plan in fields:
+                    rv[key] = plan(element)
+            except ExtractError as exc:
+                exc._append(extractor=item)
+                raise exc
+
+            if convert is None:
+                return rv
+
+            return convert(rv)
+
+        return extract_row
+
+    def _record_type_of(self) -> Optional[type]:
+        convertor = self.convertor
+        cls = self.type
+        if (
+            getattr(convertor, "__func__", None) is not Item.default_convertor
+            or getattr(convertor, "__self__", None) is not self
+            or not callable(getattr(cls, "_make", None))
+        ):
+            return None
+
+        keys = []
+        for key in self.field_names():
+            name = getattr(self, key).name
+            keys.append(key if name is None else name)
+
+        # the namedtuple or record class has the fields in the same order
+        if getattr(cls, "_fields", None) != tuple(keys):
+            return None
+
+        return cls
+
+    def _compile_convertor(self) -> Optional[Callable[[Any], RV]]:
+        convertor = self.convertor
+        if (
+            getattr(convertor, "__func__", None) is Item.default_convertor
+            and getattr(convertor, "__self__", None) is self
+        ):
+            # inline the default convertor
+            cls = self.type
+            if cls is not None and callable(cls):
+                return lambda rv: cls(**rv)  # type: ignore
+
+            return None
+
+        return super()._compile_convertor()
+
+    def validate(self) -> None:
+        """
+        Compile the expressions of all the extractors of item and its fields, \
+            e.g. in CI to find out the invalid expressions in lazy mode.
+
+        :raises ~data_extractor.exceptions.ExprError: Extractor Expression Error.
+        """
+        super().validate()
+        for key in self.field_names():
+            getattr(self, key).validate()
+
     @classmethod
     def field_names(cls) -> Iterator[str]:
         """
@@ -231,9 +754,16 @@ class Item(Field[RV]):
         def extract(self: AbstractSimpleExtractor, element: Any) -> List[RV]:
             return duplicated.extract(element)  # type: ignore
 
+        def validate(self: AbstractSimpleExtractor) -> None:
+            duplicated.validate()
+
+        def reduce(self: AbstractSimpleExtractor) -> Tuple[Any, ...]:
+            # the class is created dynamically, simplify the item again on unpickling.
+            return duplicated.simplify, ()
+
         def getter(self: AbstractSimpleExtractor, name: str) -> Any:
             if (
-                name not in ("extract", "extract_first")
+                name not in ("extract", "extract_first", "validate")
                 and not name.startswith("__")
                 and hasattr(duplicated.extractor, name)
             ):
@@ -249,7 +779,10 @@ class Item(Field[RV]):
             classname,
             (base,),
             {
+                "__slots__": (),
                 "extract": extract,
+                "validate": validate,
+                "__reduce__": reduce,
                 "__getattribute__": getter,
             },
         )
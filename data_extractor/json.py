@@ -5,13 +5,38 @@
 """
 
 # Standard Library
-from typing import TYPE_CHECKING, Any, Optional, Type
+import codecs
+import importlib.util
+import io
+import json
+import os
+import re
+
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 # Local Folder
+from .cache import LRUCache
 from .core import AbstractSimpleExtractor
 from .exceptions import ExprError
 from .utils import Property, _missing_dependency
 
+if TYPE_CHECKING:
+    # Local Folder
+    from .item import Field
+
 
 class JSONExtractor(AbstractSimpleExtractor):
     """
@@ -27,6 +52,9 @@ class JSONExtractor(AbstractSimpleExtractor):
 
     :param expr: JSONPath Expression.
     :type expr: str
+    :param lazy: Compile the expression on first extracting. \
+        Default: :data:`data_extractor.core.lazy_compile`.
+    :type lazy: bool, optional
     """
 
     def __new__(
@@ -41,11 +69,8 @@ class JSONExtractor(AbstractSimpleExtractor):
         obj: JSONExtractor
         if cls is JSONExtractor:
             # invoke the json extractor backend for object creation
-            # TODO: cache renamed type
             obj = super(AbstractSimpleExtractor, cls).__new__(
-                type(
-                    "JSONExtractor", (json_extractor_backend,), {}
-                )  # rename into JSONExtractor
+                _renamed_backend(json_extractor_backend)
             )
         else:
             # invoke subclasses directly
@@ -57,13 +82,61 @@ class JSONExtractor(AbstractSimpleExtractor):
         raise NotImplementedError
 
 
-try:
-    # Third Party Library
-    import jsonpath_rw
+_renamed_backends: Dict[Type[JSONExtractor], Type[JSONExtractor]] = {}
+
+
+def _renamed_backend(backend: Type[JSONExtractor]) -> Type[JSONExtractor]:
+    """
+    Get the subclass of backend which is renamed into JSONExtractor.
+
+    The subclass is cached per backend,
+    so switching **json_extractor_backend** picks up its own one.
+    """
+    try:
+        return _renamed_backends[backend]
+    except KeyError:
+        renamed = type(
+            "JSONExtractor",
+            (backend,),
+            {"__slots__": (), "_class_reduce": (_renamed_backend, (backend,))},
+        )
+        return _renamed_backends.setdefault(backend, renamed)
+
+
+jsonpath_cache: LRUCache[Tuple[Type[JSONExtractor], str], Any] = LRUCache("jsonpath")
+"""
+Process-wide cache of parsed JSONPath objects,
+keyed by the backend class and the expression.
+"""
+
 
-    _missing_jsonpath_rw = False
-except ImportError:
-    _missing_jsonpath_rw = True
+def _parse(backend: Type[JSONExtractor], parse: Callable[[str], Any], expr: str) -> Any:
+    return jsonpath_cache.get_or_create((backend, expr), lambda: parse(expr))
+
+
+def prewarm(
+    exprs: Iterable[str], backend: Optional[Type[JSONExtractor]] = None
+) -> None:
+    """
+    Parse JSONPath expressions into the cache ahead,
+    e.g. at process start.
+
+    :param exprs: JSONPath expressions.
+    :type exprs: Iterable[str]
+    :param backend: The backend parses expressions. \
+        Default: **json_extractor_backend**.
+    :type backend: Type[:class:`data_extractor.json.JSONExtractor`], optional
+
+    :raises ~data_extractor.exceptions.ExprError: JSONPath Expression Error.
+    """
+    if backend is None:
+        backend = JSONExtractor
+
+    for expr in exprs:
+        backend(expr, lazy=False)
+
+
+_missing_jsonpath_rw = importlib.util.find_spec("jsonpath_rw") is None
 
 
 class JSONPathRWExtractor(JSONExtractor):
@@ -75,23 +148,30 @@ class JSONPathRWExtractor(JSONExtractor):
 
     :param expr: JSONPath Expression.
     :type expr: str
+    :param lazy: Compile the expression on first extracting. \
+        Default: :data:`data_extractor.core.lazy_compile`.
+    :type lazy: bool, optional
     """
 
     if TYPE_CHECKING:
         # Third Party Library
         from jsonpath_rw import JSONPath
-    _jsonpath = Property["JSONPath"]()
+    _jsonpath = Property["JSONPath"](loader="_compile")
 
-    def __init__(self, expr: str) -> None:
-        super(JSONExtractor, self).__init__(expr)
+    def __init__(self, expr: str, *, lazy: Optional[bool] = None) -> None:
         if _missing_jsonpath_rw:
             _missing_dependency("jsonpath-rw")
 
+        super(JSONExtractor, self).__init__(expr, lazy=lazy)
+
+    def _compile(self) -> "JSONPath":
         # Third Party Library
+        import jsonpath_rw
+
         from jsonpath_rw.lexer import JsonPathLexerError
 
         try:
-            self._jsonpath = jsonpath_rw.parse(self.expr)
+            return _parse(JSONPathRWExtractor, jsonpath_rw.parse, self.expr)
         except (JsonPathLexerError, Exception) as exc:
             # jsonpath_rw.parser.JsonPathParser.p_error raises exc of Exception type
             raise ExprError(extractor=self, exc=exc) from exc
@@ -109,13 +189,9 @@ class JSONPathRWExtractor(JSONExtractor):
         return [m.value for m in self._jsonpath.find(element)]
 
 
-try:
-    # Third Party Library
-    import jsonpath_rw_ext
-
-    _missing_jsonpath_rw_ext = False
-except ImportError:
-    _missing_jsonpath_rw_ext = True
+_missing_jsonpath_rw_ext = (
+    _missing_jsonpath_rw or importlib.util.find_spec("jsonpath_rw_ext") is None
+)
 
 
 class JSONPathRWExtExtractor(JSONPathRWExtractor):
@@ -127,35 +203,36 @@ class JSONPathRWExtExtractor(JSONPathRWExtractor):
 
     :param expr: JSONPath Expression.
     :type expr: str
+    :param lazy: Compile the expression on first extracting. \
+        Default: :data:`data_extractor.core.lazy_compile`.
+    :type lazy: bool, optional
     """
 
     if TYPE_CHECKING:
         # Third Party Library
         from jsonpath_rw_ext import JSONPath as JSONPathExt
-    _jsonpath = Property["JSONPathExt"]()
+    _jsonpath = Property["JSONPathExt"](loader="_compile")
 
-    def __init__(self, expr: str) -> None:
-        super(JSONExtractor, self).__init__(expr)
+    def __init__(self, expr: str, *, lazy: Optional[bool] = None) -> None:
         if _missing_jsonpath_rw_ext:
             _missing_dependency("jsonpath-rw-ext")
 
+        super(JSONExtractor, self).__init__(expr, lazy=lazy)
+
+    def _compile(self) -> "JSONPathExt":
         # Third Party Library
+        import jsonpath_rw_ext
+
         from jsonpath_rw.lexer import JsonPathLexerError
 
         try:
-            self._jsonpath = jsonpath_rw_ext.parse(self.expr)
+            return _parse(JSONPathRWExtExtractor, jsonpath_rw_ext.parse, self.expr)
         except (JsonPathLexerError, Exception) as exc:
             # jsonpath_rw.parser.JsonPathParser.p_error raises exc of Exception type
             raise ExprError(extractor=self, exc=exc) from exc
 
 
-try:
-    # Third Party Library
-    import jsonpath
-
-    _missing_jsonpath = False
-except ImportError:
-    _missing_jsonpath = True
+_missing_jsonpath = importlib.util.find_spec("jsonpath") is None
 
 
 class JSONPathExtractor(JSONExtractor):
@@ -167,22 +244,29 @@ class JSONPathExtractor(JSONExtractor):
 
     :param expr: JSONPath Expression.
     :type expr: str
+    :param lazy: Compile the expression on first extracting. \
+        Default: :data:`data_extractor.core.lazy_compile`.
+    :type lazy: bool, optional
     """
 
     if TYPE_CHECKING:
         # Third Party Library
         from jsonpath import Expr
 
-    _jsonpath = Property["Expr"]()
-
-    def __init__(self, expr: str) -> None:
-        super(JSONExtractor, self).__init__(expr)
+    _jsonpath = Property["Expr"](loader="_compile")
 
+    def __init__(self, expr: str, *, lazy: Optional[bool] = None) -> None:
         if _missing_jsonpath:
             _missing_dependency("jsonpath-extractor")
 
+        super(JSONExtractor, self).__init__(expr, lazy=lazy)
+
+    def _compile(self) -> "Expr":
+        # Third Party Library
+        import jsonpath
+
         try:
-            self._jsonpath = jsonpath.parse(self.expr)
+            return _parse(JSONPathExtractor, jsonpath.parse, self.expr)
         except SyntaxError as exc:
             raise ExprError(extractor=self, exc=exc) from exc
 
@@ -208,10 +292,358 @@ elif not _missing_jsonpath_rw:
     json_extractor_backend = JSONPathRWExtractor
 
 
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_MEMBER = re.compile(
+    r'[ \t\n\r]*"([^"\\]*(?:\\.[^"\\]*)*)"[ \t\n\r]*:[ \t\n\r]*', re.DOTALL
+)
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+_SCALAR = re.compile(r"[^,:{}\[\]\s\"]+")
+# skip strings and scalars until the next bracket at once
+_STRUCTURE = re.compile(r'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+_STEP = re.compile(
+    r"""\.(?P<name>\*|[^.\[\]'"]+)""" r"""|\[(?P<index>\*|\d+|'[^']*'|"[^"]*")\]"""
+)
+
+_Step = Union[str, int, None]  # key, index or wildcard
+
+
+def _parse_streaming_path(path: str) -> List[_Step]:
+    expr = path.strip()
+    if expr.startswith("$"):
+        expr = expr[1:]
+    elif expr and not expr.startswith("["):
+        expr = f".{expr}"
+
+    steps: List[_Step] = []
+    pos = 0
+    while pos < len(expr):
+        m = _STEP.match(expr, pos)
+        if m is None:
+            raise ValueError(f"Unsupported streaming JSONPath: {path!r}")
+
+        step = m.group("name") or m.group("index")
+        if step == "*":
+            steps.append(None)
+        elif step.isdigit() and m.group("index"):
+            steps.append(int(step))
+        elif step[0] in "'\"" and m.group("index"):
+            steps.append(step[1:-1])
+        else:
+            steps.append(step)
+
+        pos = m.end()
+
+    return steps
+
+
+class _JSONStream:
+    """
+    Incremental JSON tokenizer over a text reader,
+    materializes the values at matched paths only.
+    """
+
+    def __init__(self, read: Callable[[int], str], chunksize: int):
+        self.read = read
+        self.chunksize = chunksize
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def more(self) -> bool:
+        if self.eof:
+            return False
+
+        if self.pos >= self.chunksize:
+            self.buf = self.buf[self.pos :]
+            self.pos = 0
+
+        # grow geometrically to avoid rescanning a huge token quadratically
+        chunk = self.read(max(self.chunksize, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.buf += chunk
+        return True
+
+    def error(self, msg: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(msg, self.buf, self.pos)
+
+    def peek(self) -> str:
+        pos = self.pos
+        if pos < len(self.buf):
+            char = self.buf[pos]
+            if char not in " \t\n\r":
+                return char
+
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()  # type: ignore
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+
+            if not self.more():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise self.error(f"Expecting {' or '.join(map(repr, chars))}")
+
+        self.pos += 1
+        return char
+
+    def string(self) -> str:
+        while True:
+            m = _STRING.match(self.buf, self.pos)
+            if m is not None:
+                self.pos = m.end()
+                raw = m.group()
+                if "\\" not in raw:
+                    return raw[1:-1]
+
+                return self.decoder.decode(raw)
+
+            if not self.more():
+                raise self.error("Unterminated string")
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.more():
+                    raise
+
+                continue
+
+            if (
+                end == len(self.buf)
+                or (isinstance(value, (int, float)) and self.buf[end] in _NUMBER_CHARS)
+            ) and self.more():
+                # the number or literal may be cut off by the end of buffer,
+                # e.g. "12." is decoded as 12 without the fraction part
+                continue
+
+            self.pos = end
+            return value
+
+    def skip(self) -> None:
+        char = self.peek()
+        if char == '"':
+            self.string()
+            return
+
+        if char not in ("{", "["):
+            while True:
+                m = _SCALAR.match(self.buf, self.pos)
+                if m is None:
+                    raise self.error("Expecting value")
+
+                if m.end() < len(self.buf) or not self.more():
+                    self.pos = m.end()
+                    return
+
+        depth = 0
+        while True:
+            self.pos = _STRUCTURE.match(self.buf, self.pos).end()  # type: ignore
+            if self.pos == len(self.buf):
+                if not self.more():
+                    raise self.error("Unterminated container")
+
+                continue
+
+            char = self.buf[self.pos]
+            if char == '"':
+                self.string()
+                continue
+
+            self.pos += 1
+            depth += 1 if char in "{[" else -1
+            if depth == 0:
+                return
+
+    def walk(self, steps: List[_Step], depth: int = 0) -> Iterator[Any]:
+        if depth == len(steps):
+            yield self.value()
+            return
+
+        step = steps[depth]
+        char = self.peek()
+        if char == "{" and not isinstance(step, int):
+            self.pos += 1
+            if self.peek() == "}":
+                self.pos += 1
+                return
+
+            while True:
+                m = _MEMBER.match(self.buf, self.pos)
+                if m is not None and m.end() < len(self.buf):
+                    self.pos = m.end()
+                    key = m.group(1)
+                    if "\\" in key:
+                        key = self.decoder.decode(f'"{key}"')
+                else:
+                    # the member may be cut off by the end of buffer
+                    self.peek()
+                    key = self.string()
+                    self.expect(":")
+
+                if step is None or step == key:
+                    yield from self.walk(steps, depth + 1)
+                else:
+                    self.skip()
+
+                if self.expect(",}") == "}":
+                    return
+        elif char == "[" and not isinstance(step, str):
+            self.pos += 1
+            if self.peek() == "]":
+                self.pos += 1
+                return
+
+            idx = 0
+            while True:
+                if step is None or step == idx:
+                    yield from self.walk(steps, depth + 1)
+                else:
+                    self.skip()
+
+                idx += 1
+                if self.expect(",]") == "]":
+                    return
+        else:
+            self.skip()
+
+
+def iterparse(
+    source: Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, IO[Any]],
+    path: str,
+    chunksize: int = 2**16,
+) -> Iterator[Any]:
+    """
+    Parse the values matched by the path from JSON document in streaming,
+    which materializes the matched values only, \
+        so that the memory usage stays low regardless of the document size.
+
+    Supported the streamable subset of JSONPath: \
+        child keys (``$.data.users``, ``$['data']``), \
+        array indexes (``$[0]``) and wildcards (``$.*``, ``$[*]``).
+
+    :param source: Filename, the encoded document, \
+        or text or binary file object of the document, \
+        e.g. :class:`io.StringIO` of JSON text.
+    :type source: str, os.PathLike, bytes, IO
+    :param path: JSONPath expression, e.g. ``$.data.users[*]``.
+    :type path: str
+    :param chunksize: Number of characters read from file at once. Default: 65536.
+    :type chunksize: int, optional
+
+    :returns: Matched values in the document order.
+    :rtype: Iterator[Any]
+
+    :raises TypeError: Unsupported source.
+    :raises ValueError: Unsupported streaming JSONPath.
+    :raises json.JSONDecodeError: Invalid JSON document.
+    """
+    steps = _parse_streaming_path(path)
+    if isinstance(source, (str, os.PathLike)):
+        # the filename, same as data_extractor.lxml.iterextract
+        with open(source, "rb") as file:
+            yield from iterparse(file, path, chunksize)
+
+        return
+
+    fp: IO[Any]
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        fp = io.BytesIO(source)
+    elif hasattr(source, "read"):
+        fp = source
+    else:
+        raise TypeError(f"Unsupported source: {source!r}")
+
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+    def read(size: int) -> str:
+        while True:
+            data = fp.read(size)
+            if isinstance(data, str):
+                return data
+
+            # decode binary file incrementally
+            text = decoder.decode(data, final=not data)
+            if text or not data:
+                return text
+
+    stream = _JSONStream(read, chunksize)
+    yield from stream.walk(steps)
+    if stream.peek():
+        raise stream.error("Extra data")
+
+
+def iterextract(
+    field: "Field",
+    source: Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, IO[Any]],
+    path: str,
+    return_exceptions: bool = False,
+    chunksize: int = 2**16,
+) -> Iterator[Any]:
+    """
+    Extract the records of large JSON document in streaming,
+    every value matched by the path is extracted by the field as a row of it \
+        with is_many=True, see :func:`iterparse`.
+    The records are selected by the path instead of the extractor of the field.
+
+    :param field: The item or field without extractor extracts the record.
+    :type field: :class:`data_extractor.item.Field`
+    :param source: Filename, the encoded document, \
+        or text or binary file object of the document, \
+        e.g. :class:`io.StringIO` of JSON text.
+    :type source: str, os.PathLike, bytes, IO
+    :param path: JSONPath expression of records, e.g. ``$.data.users[*]``.
+    :type path: str
+    :param return_exceptions: Yield pairs of (result, None) or (None, exception) \
+        instead of raising the first exception. Default: False.
+    :type return_exceptions: bool, optional
+    :param chunksize: Number of characters read from file at once. Default: 65536.
+    :type chunksize: int, optional
+
+    :returns: Results of records.
+    :rtype: Iterator[Any]
+
+    :raises ValueError: The field has an extractor.
+    :raises ~data_extractor.exceptions.ExtractError: \
+        Thrown by extractor extracting wrong data.
+    """
+    if field.extractor is not None:
+        raise ValueError(
+            f"Can't select the records by the extractor of field: {field!r}, "
+            "they are selected by the path"
+        )
+
+    extract_row = field._compile_extract()
+    for record in iterparse(source, path, chunksize):
+        try:
+            rv = record if extract_row is None else extract_row(record)
+        except Exception as exc:
+            if not return_exceptions:
+                raise
+
+            yield None, exc
+        else:
+            yield (rv, None) if return_exceptions else rv
+
+
 __all__ = (
     "JSONExtractor",
     "JSONPathExtractor",
     "JSONPathRWExtExtractor",
     "JSONPathRWExtractor",
+    "iterextract",
+    "iterparse",
     "json_extractor_backend",
+    "jsonpath_cache",
+    "prewarm",
 )
@@ -0,0 +1,249 @@
+"""
+===========================================
+:mod:`jsonl` -- JSON Lines data extracting.
+===========================================
+
+Extract the JSON Lines file memory-mapped, one document per line.
+The file can be split into byte ranges by :func:`shards`,
+so that several processes work on one file::
+
+    for start, end in shards("users.jsonl", 4):
+        # in every process
+        with JSONLinesWriter(f"output-{start}.jsonl") as sink:
+            sink.write_many(iterextract(User(), "users.jsonl", start, end))
+"""
+
+# Standard Library
+import json
+import mmap
+import os
+
+from typing import IO, Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Local Folder
+from .item import Field, _plan_of
+
+PathType = Union[str, "os.PathLike[str]"]
+
+
+def shards(path: PathType, count: int) -> List[Tuple[int, int]]:
+    """
+    Split the file into byte ranges of nearly equal size.
+
+    The lines starting in the range belong to it, \
+        see :func:`iterlines`.
+
+    :param path: Filename.
+    :type path: str, os.PathLike
+    :param count: Number of shards.
+    :type count: int
+
+    :returns: List of (start, end) byte offsets.
+    :rtype: List[Tuple[int, int]]
+
+    :raises ValueError: Invalid count.
+    """
+    if count < 1:
+        raise ValueError(f"Invalid count: {count!r}")
+
+    size = os.path.getsize(path)
+    bounds = [size * idx // count for idx in range(count + 1)]
+    return list(zip(bounds, bounds[1:]))
+
+
+def iterlines(
+    path: PathType, start: int = 0, end: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    Iterate the non-blank lines starting in the byte range of the memory-mapped file.
+
+    A line starting in the range is read to its end \
+        even if it ends after the range, \
+        so that the adjacent ranges share no line and miss no line. \
+        Every line is copied out of the map once.
+
+    :param path: Filename.
+    :type path: str, os.PathLike
+    :param start: Start byte offset. Default: 0.
+    :type start: int, optional
+    :param end: End byte offset, exclusive. Default: the file size.
+    :type end: int, optional
+
+    :returns: Lines without the line breaks.
+    :rtype: Iterator[bytes]
+    """
+    with open(path, "rb") as fp:
+        size = os.fstat(fp.fileno()).st_size
+        if end is None or end > size:
+            end = size
+
+        if size == 0 or start >= end:
+            return
+
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = start
+            if pos > 0 and mm[pos - 1] != ord("\n"):
+                # the line starting before the range belongs to the previous one
+                pos = mm.find(b"\n", pos)
+                if pos == -1:
+                    return
+
+                pos += 1
+
+            while pos < end:
+                stop = mm.find(b"\n", pos)
+                if stop == -1:
+                    stop = size
+
+                line = mm[pos:stop]
+                # checks the blank line without copying it like strip
+                if line and not line.isspace():
+                    yield line
+
+                pos = stop + 1
+
+
+def iterextract(
+    field: Field,
+    path: PathType,
+    start: int = 0,
+    end: Optional[int] = None,
+    return_exceptions: bool = False,
+) -> Iterator[Any]:
+    """
+    Decode every line of the byte range of JSON Lines file \
+        then extract it by the field.
+
+    :param field: The item or field extracts the document.
+    :type field: :class:`data_extractor.item.Field`
+    :param path: Filename.
+    :type path: str, os.PathLike
+    :param start: Start byte offset. Default: 0.
+    :type start: int, optional
+    :param end: End byte offset, exclusive. Default: the file size.
+    :type end: int, optional
+    :param return_exceptions: Yield pairs of (result, None) or (None, exception) \
+        instead of raising the first exception. Default: False.
+    :type return_exceptions: bool, optional
+
+    :returns: Results of lines.
+    :rtype: Iterator[Any]
+
+    :raises UnicodeDecodeError: Line isn't UTF-8 encoded.
+    :raises json.JSONDecodeError: Invalid JSON line.
+    :raises ~data_extractor.exceptions.ExtractError: \
+        Thrown by extractor extracting wrong data.
+    """
+    plan = _plan_of(field)
+    # json.loads(bytes) detects the encoding of every line, decode UTF-8 directly
+    decode = json.JSONDecoder().decode
+    lines = iterlines(path, start, end)
+    if not return_exceptions:
+        for line in lines:
+            yield plan(decode(str(line, "utf-8")))
+
+        return
+
+    for line in lines:
+        try:
+            rv = plan(decode(str(line, "utf-8")))
+        except Exception as exc:
+            yield None, exc
+        else:
+            yield rv, None
+
+
+class JSONLinesWriter:
+    """
+    JSON Lines sink writes the encoded lines in large buffered writes.
+
+    :param file: Filename or binary file object.
+    :type file: str, os.PathLike, BinaryIO
+    :param buffer_size: Number of bytes buffered before writing. Default: 1MiB.
+    :type buffer_size: int, optional
+    :param ensure_ascii: Escape the non-ASCII characters. Default: False.
+    :type ensure_ascii: bool, optional
+    :param default: Function returns a serializable version of object, \
+        see :func:`json.dumps`.
+    :type default: Callable[[Any], Any], optional
+    """
+
+    def __init__(
+        self,
+        file: Union[PathType, IO[bytes]],
+        buffer_size: int = 2**20,
+        ensure_ascii: bool = False,
+        default: Optional[Any] = None,
+    ):
+        self._fp: IO[bytes]
+        if isinstance(file, (str, os.PathLike)):
+            self._fp = open(file, "wb")
+            self._owned = True
+        else:
+            self._fp = file
+            self._owned = False
+
+        self.buffer_size = buffer_size
+        self._encode = json.JSONEncoder(
+            ensure_ascii=ensure_ascii, separators=(",", ":"), default=default
+        ).encode
+        self._buffer: List[bytes] = []
+        self._buffered = 0
+
+    def __enter__(self) -> "JSONLinesWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def write(self, obj: Any) -> None:
+        """
+        Encode the object as a line into the buffer.
+
+        :param obj: JSON serializable object.
+        :type obj: Any
+        """
+        line = (self._encode(obj) + "\n").encode()
+        self._buffer.append(line)
+        self._buffered += len(line)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, objs: Iterable[Any]) -> int:
+        """
+        Encode the objects as lines into the buffer.
+
+        :param objs: JSON serializable objects, e.g. results of :func:`iterextract`.
+        :type objs: Iterable[Any]
+
+        :returns: Number of lines written.
+        :rtype: int
+        """
+        count = 0
+        for obj in objs:
+            self.write(obj)
+            count += 1
+
+        return count
+
+    def flush(self) -> None:
+        """
+        Write the buffered lines into the file.
+        """
+        if self._buffer:
+            self._fp.write(b"".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+
+        self._fp.flush()
+
+    def close(self) -> None:
+        """
+        Flush the buffer, and close the file if it is opened by the writer.
+        """
+        self.flush()
+        if self._owned:
+            self._fp.close()
+
+
+__all__ = ("JSONLinesWriter", "iterextract", "iterlines", "shards")
@@ -0,0 +1,198 @@
+"""
+===============================================
+:mod:`lazy` -- Lazy results of item extracting.
+===============================================
+
+Extract the fields of an item on first access instead of all of them::
+
+    page = Page(CSSExtractor("html")).extract(root, lazy=True)
+    page["title"]  # only the title field is extracted
+    dict(page)  # the rest fields are extracted
+"""
+
+# Standard Library
+import threading
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+# Local Folder
+from .exceptions import ExtractError
+from .item import Item, _select_element
+from .projection import Plans, compile_projection
+from .utils import sentinel
+
+
+class LazyResult(Mapping[str, Any]):
+    """
+    Read-only mapping of field names to values, \
+        which extracts the field on its first access and caches the value.
+
+    The exception of extracting is raised on access, \
+        and raised again on the next access. \
+        The element is released once all the fields are extracted.
+
+    It is safe to access from multiple threads, \
+        every field is extracted exactly once.
+
+    :param item: The item extracts the element.
+    :type item: :class:`data_extractor.item.Item`
+    :param element: The target data node element.
+    :type element: Any
+    :param plans: Plans of the fields by field name, \
+        e.g. :attr:`data_extractor.projection.Projection.fields`. \
+        Default: all the fields of item.
+    :type plans: Dict[str, Callable[[Any], Any]], optional
+    """
+
+    __slots__ = ("_item", "_element", "_plans", "_values", "_lock")
+
+    def __init__(self, item: Item, element: Any, plans: Optional[Plans] = None):
+        self._item = item
+        self._element = element
+        self._plans = compile_projection(item).fields if plans is None else plans
+        self._values: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        plan = self._plans[key]
+        with self._lock:
+            try:
+                # extracted by another thread
+                return self._values[key]
+            except KeyError:
+                pass
+
+            try:
+                value = plan(self._element)
+            except ExtractError as exc:
+                exc._append(extractor=self._item)
+                raise exc
+
+            self._values[key] = value
+            if len(self._values) == len(self._plans):
+                # free the document
+                self._element = None
+
+            return value
+
+    def __contains__(self, key: object) -> bool:
+        # without extracting the field
+        return key in self._plans
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Extract the field if it is not extracted yet, \
+            or return default if the field name is unknown.
+
+        :param key: Field name.
+        :type key: str
+        :param default: Default value of unknown field name. Default: None.
+        :type default: Any, optional
+
+        :returns: The value of field.
+        :rtype: Any
+
+        :raises ~data_extractor.exceptions.ExtractError: \
+            Thrown by extractor extracting wrong data.
+        """
+        if key not in self._plans:
+            return default
+
+        return self[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._plans)
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            (
+                f"{key!r}: {self._values[key]!r}"
+                if key in self._values
+                else f"{key!r}: ..."
+            )
+            for key in self._plans
+        )
+        return f"{self.__class__.__name__}({{{values}}})"
+
+    def __reduce__(self) -> Any:
+        # the element may not be picklable, e.g. lxml element
+        return dict, (dict(self),)
+
+    def is_extracted(self, key: str) -> bool:
+        """
+        Determine the field is extracted, return :obj:`True` if it is.
+
+        :param key: Field name.
+        :type key: str
+
+        :raises KeyError: Unknown field name.
+        """
+        if key not in self._plans:
+            raise KeyError(key)
+
+        return key in self._values
+
+
+def extract_lazy(
+    item: Item,
+    element: Any,
+    only: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> Union[LazyResult, List[LazyResult], Any]:
+    """
+    Select the rows of element by the extractor of item eagerly, \
+        then wrap them into :class:`LazyResult` extracting the fields on access.
+
+    The convertor and type of item aren't applied, \
+        the nested items are extracted as a whole on access.
+
+    :param item: The item extracts rows.
+    :type item: :class:`data_extractor.item.Item`
+    :param element: The target data node element.
+    :type element: Any
+    :param only: Paths of the fields to keep, \
+        see :func:`data_extractor.projection.compile_projection`. \
+        Default: all the fields.
+    :type only: Iterable[str], optional
+    :param exclude: Paths of the fields to remove. Default: no field.
+    :type exclude: Iterable[str], optional
+
+    :returns: The lazy result, list of them if the item is_many, \
+        or the default of item if the row is not found.
+    :rtype: :class:`LazyResult`, List[:class:`LazyResult`], Any
+
+    :raises ValueError: The item has customized `_extract` method, \
+        or invalid projection.
+    :raises ~data_extractor.exceptions.ExtractError: \
+        Thrown by extractor extracting wrong data.
+    """
+    if type(item)._extract is not Item._extract:
+        raise ValueError(f"Can't extract lazily by customized {item!r}")
+
+    plans = compile_projection(item, only, exclude).fields
+    if item.extractor is None:
+        rows = _select_element(element)
+    else:
+        rows = item.extractor.extract(element)
+
+    if item.is_many:
+        return [LazyResult(item, row, plans) for row in rows]
+
+    if not rows:
+        if item.default is sentinel:
+            raise ExtractError(item, element)
+
+        return item.default
+
+    return LazyResult(item, rows[0], plans)
+
+
+__all__ = ("LazyResult", "extract_lazy")
@@ -4,9 +4,14 @@
 """
 
 # Standard Library
-from typing import List, Union
+import importlib.util
+import os
+
+from functools import lru_cache
+from typing import IO, TYPE_CHECKING, Any, Iterator, List, Optional, Tuple, Union
 
 # Local Folder
+from .cache import LRUCache
 from .core import AbstractSimpleExtractor
 from .exceptions import ExprError
 from .utils import Property, _missing_dependency
@@ -22,6 +27,39 @@ except ImportError:
 
     Element = None  # TODO: Find a way to get rid of this. See PEP 562
 
+xpath_cache: LRUCache[Tuple[str, Tuple[Tuple[str, Any], ...]], "XPath"] = LRUCache(
+    "xpath"
+)
+"""
+Process-wide cache of compiled :class:`lxml.etree.XPath` objects
+shared by all :class:`data_extractor.lxml.XPathExtractor` instances.
+
+.. note::
+
+    lxml serializes the concurrent evaluations of the same XPath object.
+    Disable the cache by ``xpath_cache.resize(0)``
+    if evaluating the same expression in many threads.
+"""
+
+detach_results: bool = os.environ.get("DATA_EXTRACTOR_DETACH_RESULTS", "") not in (
+    "",
+    "0",
+)
+"""
+Extract the texts and attribute values as plain :class:`str`,
+instead of lxml smart strings referencing their parent elements,
+so that the parsed document is freed once the results are the only
+objects left, e.g. the results queued for writing.
+Set environment variable **DATA_EXTRACTOR_DETACH_RESULTS=1**
+or change this value to enable it,
+or pass the optional parameter **detached** to the extractor.
+"""
+
+
+def _compile_xpath(expr: str, **options: Any) -> "XPath":
+    key = (expr, tuple(sorted(options.items())))
+    return xpath_cache.get_or_create(key, lambda: XPath(expr, **options))
+
 
 class XPathExtractor(AbstractSimpleExtractor):
     """
@@ -32,18 +70,39 @@ class XPathExtractor(AbstractSimpleExtractor):
 
     :param expr: XPath Expression.
     :type exprt: str
+    :param lazy: Compile the expression on first extracting. \
+        Default: :data:`data_extractor.core.lazy_compile`.
+    :type lazy: bool, optional
+    :param detached: Extract plain str instead of smart strings \
+        referencing the document. \
+        Default: :data:`data_extractor.lxml.detach_results`.
+    :type detached: bool, optional
+
+    :raises ~data_extractor.exceptions.ExprError: XPath Expression Error.
     """
 
-    _find = Property["XPath"]()
-
-    def __init__(self, expr: str):
-        super().__init__(expr)
+    detached = Property[bool]()
+    _find = Property["XPath"](loader="_compile")
 
+    def __init__(
+        self,
+        expr: str,
+        *,
+        lazy: Optional[bool] = None,
+        detached: Optional[bool] = None,
+    ):
         if _missing_lxml:
             _missing_dependency("lxml")
 
+        self.detached = detach_results if detached is None else detached
+        super().__init__(expr, lazy=lazy)
+
+    def _compile(self) -> "XPath":
         try:
-            self._find = XPath(self.expr)
+            if self.detached:
+                return _compile_xpath(self.expr, smart_strings=False)
+
+            return _compile_xpath(self.expr)
         except XPathSyntaxError as exc:
             raise ExprError(extractor=self, exc=exc) from exc
 
@@ -73,14 +132,45 @@ class XPathExtractor(AbstractSimpleExtractor):
             raise ExprError(extractor=self, exc=exc) from exc
 
 
-try:
+_missing_cssselect = importlib.util.find_spec("cssselect") is None
+
+
+if TYPE_CHECKING:
     # Third Party Library
-    import cssselect
+    from cssselect import GenericTranslator
+    from cssselect.parser import SelectorError
 
-    del cssselect
-    _missing_cssselect = False
-except ImportError:
-    _missing_cssselect = True
+    # Local Folder
+    from .item import Field
+
+css_to_xpath_cache: LRUCache[str, Union[str, "SelectorError"]] = LRUCache(
+    "css_to_xpath"
+)
+"""
+Process-wide memo of CSS Selector translated XPath expression,
+including the failures of invalid selectors.
+"""
+
+
+@lru_cache(maxsize=None)
+def _get_translator() -> "GenericTranslator":
+    # Third Party Library
+    from cssselect import GenericTranslator
+
+    return GenericTranslator()
+
+
+def _css_to_xpath(expr: str) -> Union[str, "SelectorError"]:
+    # Third Party Library
+    from cssselect.parser import SelectorError
+
+    def translate() -> Union[str, SelectorError]:
+        try:
+            return _get_translator().css_to_xpath(expr)
+        except SelectorError as exc:
+            return exc
+
+    return css_to_xpath_cache.get_or_create(expr, translate)
 
 
 class CSSExtractor(AbstractSimpleExtractor):
@@ -92,26 +182,39 @@ class CSSExtractor(AbstractSimpleExtractor):
 
     :param expr: CSS Selector Expression.
     :type expr: str
+    :param lazy: Compile the expression on first extracting. \
+        Default: :data:`data_extractor.core.lazy_compile`.
+    :type lazy: bool, optional
+    :param detached: Extract plain str instead of smart strings \
+        referencing the document. \
+        Default: :data:`data_extractor.lxml.detach_results`.
+    :type detached: bool, optional
+
+    :raises ~data_extractor.exceptions.ExprError: CSS Selector Expression Error.
     """
 
-    _extractor = Property[XPathExtractor]()
-
-    def __init__(self, expr: str):
-        super().__init__(expr)
+    detached = Property[bool]()
+    _extractor = Property[XPathExtractor](loader="_compile")
 
+    def __init__(
+        self,
+        expr: str,
+        *,
+        lazy: Optional[bool] = None,
+        detached: Optional[bool] = None,
+    ):
         if _missing_cssselect:
             _missing_dependency("cssselect")
 
-        # Third Party Library
-        from cssselect import GenericTranslator
-        from cssselect.parser import SelectorError
+        self.detached = detach_results if detached is None else detached
+        super().__init__(expr, lazy=lazy)
 
-        try:
-            xpath_expr = GenericTranslator().css_to_xpath(self.expr)
-        except SelectorError as exc:
-            raise ExprError(extractor=self, exc=exc) from exc
+    def _compile(self) -> XPathExtractor:
+        xpath_expr = _css_to_xpath(self.expr)
+        if not isinstance(xpath_expr, str):
+            raise ExprError(extractor=self, exc=xpath_expr) from xpath_expr
 
-        self._extractor = XPathExtractor(xpath_expr)
+        return XPathExtractor(xpath_expr, lazy=False, detached=self.detached)
 
     def extract(self, element: Element) -> List[Element]:
         """
@@ -136,21 +239,32 @@ class TextCSSExtractor(CSSExtractor):
 
     :param expr: CSS Selector Expression.
     :type expr: str
+    :param lazy: Compile the expression on first extracting. \
+        Default: :data:`data_extractor.core.lazy_compile`.
+    :type lazy: bool, optional
+    :param detached: Extract plain str instead of smart strings \
+        referencing the document. \
+        Default: :data:`data_extractor.lxml.detach_results`.
+    :type detached: bool, optional
     """
 
-    def extract(self, element: Element) -> List[str]:
+    def extract(self, element: Element) -> List[Optional[str]]:
         """
         Extract subelements' text from XML or HTML data.
 
         :param element: Target.
         :type element: :class:`data_extractor.lxml.Element`
 
-        :returns: List of str, extracted result.
+        :returns: List of str, extracted result, None for subelement without text.
         :rtype: list
 
         :raises ~data_extractor.exceptions.ExprError: CSS Selector Expression Error.
         """
-        return [ele.text for ele in super().extract(element)]
+        texts = [ele.text for ele in super().extract(element)]
+        if self.detached:
+            return [text if text is None else str(text) for text in texts]
+
+        return texts
 
 
 class AttrCSSExtractor(CSSExtractor):
@@ -164,13 +278,27 @@ class AttrCSSExtractor(CSSExtractor):
     :type expr: str
     :param attr: Target attribute name.
     :type attr: str
+    :param lazy: Compile the expression on first extracting. \
+        Default: :data:`data_extractor.core.lazy_compile`.
+    :type lazy: bool, optional
+    :param detached: Extract plain str instead of smart strings \
+        referencing the document. \
+        Default: :data:`data_extractor.lxml.detach_results`.
+    :type detached: bool, optional
     """
 
     attr = Property[str]()
 
-    def __init__(self, expr: str, attr: str):
-        super().__init__(expr)
+    def __init__(
+        self,
+        expr: str,
+        attr: str,
+        *,
+        lazy: Optional[bool] = None,
+        detached: Optional[bool] = None,
+    ):
         self.attr = attr
+        super().__init__(expr, lazy=lazy, detached=detached)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(expr={self.expr!r}, attr={self.attr!r})"
@@ -187,11 +315,84 @@ class AttrCSSExtractor(CSSExtractor):
 
         :raises ~data_extractor.exceptions.ExprError: CSS Selector Expression Error.
         """
-        return [
+        values = [
             ele.get(self.attr)
             for ele in super().extract(element)
             if self.attr in ele.keys()
         ]
+        if self.detached:
+            return [str(value) for value in values]
+
+        return values
+
+
+def iterextract(
+    field: "Field",
+    source: Union[str, "os.PathLike[str]", IO[bytes]],
+    tag: str,
+    return_exceptions: bool = False,
+    **options: Any,
+) -> Iterator[Any]:
+    """
+    Extract the records of huge XML document in streaming,
+    so that the memory usage stays constant regardless of the document size.
+
+    The document is parsed by :func:`lxml.etree.iterparse`, \
+        every element of the tag is extracted by the field as a row \
+        of it with is_many=True, then cleared along with its preceding siblings. \
+        So the XPath expressions of the fields should be relative to the record, \
+        e.g. ``./name/text()``.
+        The records are selected by the tag instead of the extractor of the field.
+
+    :param field: The item or field without extractor extracts the record.
+    :type field: :class:`data_extractor.item.Field`
+    :param source: Filename or file object of the document.
+    :type source: str, os.PathLike, BinaryIO
+    :param tag: Tag of the record, e.g. ``product`` or ``{namespace}product``.
+    :type tag: str
+    :param return_exceptions: Yield pairs of (result, None) or (None, exception) \
+        instead of raising the first exception. Default: False.
+    :type return_exceptions: bool, optional
+    :param options: Other keyword arguments of :func:`lxml.etree.iterparse`, \
+        e.g. huge_tree=True.
+
+    :returns: Results of records.
+    :rtype: Iterator[Any]
+
+    :raises ValueError: The field has an extractor.
+    :raises ~data_extractor.exceptions.ExtractError: \
+        Thrown by extractor extracting wrong data.
+    """
+    if field.extractor is not None:
+        raise ValueError(
+            f"Can't select the records by the extractor of field: {field!r}, "
+            "they are selected by the tag"
+        )
+
+    if _missing_lxml:
+        _missing_dependency("lxml")
+
+    # Third Party Library
+    from lxml.etree import iterparse
+
+    extract_row = field._compile_extract()
+    for _, element in iterparse(source, events=("end",), tag=tag, **options):
+        try:
+            rv = element if extract_row is None else extract_row(element)
+        except Exception as exc:
+            if not return_exceptions:
+                raise
+
+            yield None, exc
+        else:
+            yield (rv, None) if return_exceptions else rv
+        finally:
+            # free the memory of extracted records
+            element.clear(keep_tail=True)
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
 
 
 __all__ = (
@@ -200,4 +401,8 @@ __all__ = (
     "Element",
     "TextCSSExtractor",
     "XPathExtractor",
+    "css_to_xpath_cache",
+    "detach_results",
+    "iterextract",
+    "xpath_cache",
 )
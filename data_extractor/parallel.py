@@ -0,0 +1,505 @@
+"""
+=================================================
+:mod:`parallel` -- Parallel extracting documents.
+=================================================
+
+Parse and extract raw HTML, XML or JSON documents in a pool of processes,
+which are started once and reused by batches::
+
+    from data_extractor.parallel import ExtractorPool
+
+    with ExtractorPool("myproject.schemas:Article", parser="html") as pool:
+        for rv in pool.extract(pages):
+            ...
+
+Or in a pool of threads by :func:`threaded_extract`.
+"""
+
+# Standard Library
+import importlib
+import json
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+from multiprocessing.context import BaseContext
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+# Local Folder
+from .exceptions import ExtractError
+from .item import Field, Item, _plan_of
+
+Parser = Callable[[Any], Any]
+T = TypeVar("T")
+
+
+_local = threading.local()
+
+
+def _lxml_parser(name: str) -> Any:
+    # lxml parser is not thread-safe, reuses one per thread.
+    try:
+        return getattr(_local, name)
+    except AttributeError:
+        pass
+
+    if name == "html":
+        # Third Party Library
+        from lxml.html import HTMLParser as Parser
+    else:
+        # Third Party Library
+        from lxml.etree import XMLParser as Parser  # type: ignore
+
+    parser = Parser()
+    setattr(_local, name, parser)
+    return parser
+
+
+def _parse_html(payload: Union[str, bytes]) -> Any:
+    # Third Party Library
+    from lxml.html import fromstring
+
+    return fromstring(payload, parser=_lxml_parser("html"))
+
+
+def _parse_xml(payload: Union[str, bytes]) -> Any:
+    # Third Party Library
+    from lxml.etree import fromstring
+
+    return fromstring(payload, parser=_lxml_parser("xml"))
+
+
+def _parse_json(payload: Union[str, bytes]) -> Any:
+    return json.loads(payload)
+
+
+parsers: Dict[str, Parser] = {
+    "html": _parse_html,
+    "xml": _parse_xml,
+    "json": _parse_json,
+}
+"""
+Names of the builtin parsers of documents.
+"""
+
+
+class WorkerError(Exception):
+    """
+    Thrown by worker process extracting the document,
+    the original exception is formatted for being sent back.
+
+    :param message: Type and message of the original exception.
+    :type message: str
+    :param traceback: Formatted traceback of the original exception.
+    :type traceback: str
+    :param field: Dotted path of the field failed to extract, \
+        e.g. ``"rows.id"``. Default: None.
+    :type field: str, optional
+    """
+
+    def __init__(self, message: str, traceback: str, field: Optional[str] = None):
+        super().__init__(message, traceback, field)
+        self.message = message
+        self.traceback = traceback
+        self.field = field
+
+    def __str__(self) -> str:
+        return f"{self.message}\n\nWorker traceback:\n{self.traceback}"
+
+
+class WorkerStats(NamedTuple):
+    """
+    Statistics of a worker process.
+    """
+
+    documents: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """
+        Documents extracted per second.
+        """
+        return self.documents / self.seconds if self.seconds else 0.0
+
+
+def _resolve_schema(schema: Union[Field, str]) -> Field:
+    if not isinstance(schema, str):
+        return schema
+
+    module_name, _, attr = schema.partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for name in attr.split("."):
+        obj = getattr(obj, name)
+
+    if isinstance(obj, type):
+        obj = obj()
+
+    if not isinstance(obj, Field):
+        raise ValueError(f"Invalid schema: {schema!r} is {obj!r}")
+
+    return obj
+
+
+def _resolve_parser(parser: Union[str, Parser, None]) -> Optional[Parser]:
+    if parser is None or callable(parser):
+        return parser
+
+    try:
+        return parsers[parser]
+    except KeyError:
+        raise ValueError(f"Invalid parser: {parser!r}") from None
+
+
+def _failed_field(exc: BaseException) -> Optional[str]:
+    if isinstance(exc, WorkerError):
+        return exc.field
+
+    if not isinstance(exc, ExtractError):
+        return None
+
+    # the extractors are traced from the failed one to the outermost item
+    names: List[str] = []
+    for child, parent in zip(exc.extractors, exc.extractors[1:]):
+        if not isinstance(parent, Item):
+            break
+
+        for key in parent.field_names():
+            field: Field = getattr(parent, key)
+            if field is child:
+                names.append(field.name or key)
+                break
+
+    return ".".join(reversed(names)) or None
+
+
+_worker: Optional[Tuple[Callable[[Any], Any], Optional[Parser]]] = None
+
+_ChunkResult = Tuple[int, float, List[Any], Dict[int, WorkerError]]
+
+
+def _init_worker(schema: Union[Field, str], parser: Union[str, Parser, None]) -> None:
+    global _worker
+    _worker = (_plan_of(_resolve_schema(schema)), _resolve_parser(parser))
+
+
+def _extract_chunk(payloads: List[Any]) -> _ChunkResult:
+    assert _worker is not None, "worker is not initialized"
+    plan, parse = _worker
+    start = time.perf_counter()
+    results: List[Any] = []
+    failures: Dict[int, WorkerError] = {}
+    for idx, payload in enumerate(payloads):
+        try:
+            element = payload if parse is None else parse(payload)
+            results.append(plan(element))
+        except Exception as exc:
+            results.append(None)
+            failures[idx] = WorkerError(
+                f"{type(exc).__name__}: {exc}",
+                traceback.format_exc(),
+                _failed_field(exc),
+            )
+
+    return os.getpid(), time.perf_counter() - start, results, failures
+
+
+def _chunks(payloads: Iterable[Any], chunksize: int) -> Iterator[List[Any]]:
+    iterator = iter(payloads)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _completed_ordered(
+    executor: Executor, fn: Callable[[Any], T], args: Iterable[Any], max_in_flight: int
+) -> Iterator["Future[T]"]:
+    pending: Deque["Future[T]"] = deque()
+    try:
+        for arg in args:
+            if len(pending) >= max_in_flight:
+                yield pending.popleft()
+
+            pending.append(executor.submit(fn, arg))
+
+        while pending:
+            yield pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _completed_unordered(
+    executor: Executor, fn: Callable[[Any], T], args: Iterable[Any], max_in_flight: int
+) -> Iterator["Future[T]"]:
+    pending: Set["Future[T]"] = set()
+    try:
+        for arg in args:
+            while len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from done
+
+            pending.add(executor.submit(fn, arg))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from done
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+class ExtractorPool:
+    """
+    Pool of processes extracting documents by the schema,
+    which is sent to every worker once at its start.
+
+    :param schema: The item or field, \
+        or its reference in the form of ``"module:attr"`` which is imported \
+        by workers. The classes of item and field should be importable \
+        by workers unless using the **fork** start method.
+    :type schema: :class:`data_extractor.item.Field`, str
+    :param parser: Name of the builtin parser in \
+        :data:`data_extractor.parallel.parsers`, \
+        a picklable function parses the payload, \
+        or None to extract the payloads as they are. Default: "html".
+    :type parser: str, Callable[[Any], Any], optional
+    :param processes: Number of worker processes. Default: :func:`os.cpu_count`.
+    :type processes: int, optional
+    :param mp_context: The multiprocessing context or the name of start method, \
+        e.g. "fork" or "spawn". Default: the default context.
+    :type mp_context: :class:`multiprocessing.context.BaseContext`, str, optional
+
+    :raises ValueError: Invalid schema or parser.
+    """
+
+    def __init__(
+        self,
+        schema: Union[Field, str],
+        parser: Union[str, Parser, None] = "html",
+        processes: Optional[int] = None,
+        mp_context: Union[BaseContext, str, None] = None,
+    ):
+        # fail fast, instead of breaking the pool in worker initializer
+        _resolve_schema(schema)
+        _resolve_parser(parser)
+        if isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+
+        self.processes = processes or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(schema, parser),
+        )
+        self._stats: Dict[int, WorkerStats] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ExtractorPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shutdown the worker processes.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> Dict[int, WorkerStats]:
+        """
+        Statistics of the worker processes.
+
+        :returns: Mapping of the worker process id to its statistics.
+        :rtype: Dict[int, :class:`data_extractor.parallel.WorkerStats`]
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _collect(
+        self, future: "Future[_ChunkResult]", return_exceptions: bool
+    ) -> Iterator[Any]:
+        pid, seconds, results, failures = future.result()
+        with self._lock:
+            documents, total = self._stats.get(pid, (0, 0.0))
+            self._stats[pid] = WorkerStats(documents + len(results), total + seconds)
+
+        for idx, rv in enumerate(results):
+            exc = failures.get(idx)
+            if return_exceptions:
+                yield rv, exc
+            elif exc is not None:
+                raise exc
+            else:
+                yield rv
+
+    def extract(
+        self,
+        payloads: Iterable[Any],
+        chunksize: int = 64,
+        ordered: bool = True,
+        max_in_flight: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Parse and extract payloads in worker processes lazily.
+
+        :param payloads: Raw documents, e.g. HTML text.
+        :type payloads: Iterable[Any]
+        :param chunksize: Number of payloads sent to a worker at once. Default: 64.
+        :type chunksize: int, optional
+        :param ordered: Yield results in the order of payloads, \
+            otherwise in the order of chunks done. Default: True.
+        :type ordered: bool, optional
+        :param max_in_flight: Maximum number of chunks being extracted, \
+            for bounding the memory usage. Default: twice the number of processes.
+        :type max_in_flight: int, optional
+        :param return_exceptions: Yield pairs of (result, None) \
+            or (None, exception) instead of raising the first exception. \
+            Default: False.
+        :type return_exceptions: bool, optional
+
+        :returns: Results, or pairs of result and exception.
+        :rtype: Iterator[Any]
+
+        :raises ~data_extractor.parallel.WorkerError: \
+            Thrown by worker process extracting the document.
+        """
+        if max_in_flight is None:
+            max_in_flight = self.processes * 2
+
+        completed = _completed_ordered if ordered else _completed_unordered
+        for future in completed(
+            self._executor, _extract_chunk, _chunks(payloads, chunksize), max_in_flight
+        ):
+            yield from self._collect(future, return_exceptions)
+
+
+def threaded_extract(
+    schema: Union[Field, str],
+    payloads: Iterable[Any],
+    parser: Union[str, Parser, None] = "html",
+    threads: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    ordered: bool = True,
+    return_exceptions: bool = False,
+) -> Iterator[Any]:
+    """
+    Parse and extract payloads in a pool of threads lazily.
+
+    lxml releases the GIL while parsing, so that parsing large documents \
+        runs in parallel with extracting the parsed ones. \
+        Every thread reuses its own lxml parser.
+
+    :param schema: The item or field, or its reference in the form of \
+        ``"module:attr"``.
+    :type schema: :class:`data_extractor.item.Field`, str
+    :param payloads: Raw documents, e.g. HTML bytes.
+    :type payloads: Iterable[Any]
+    :param parser: Name of the builtin parser in \
+        :data:`data_extractor.parallel.parsers`, a function parses the payload, \
+        or None to extract the payloads as they are. Default: "html".
+    :type parser: str, Callable[[Any], Any], optional
+    :param threads: Number of worker threads. \
+        Default: the number of processors plus 4, at most 32.
+    :type threads: int, optional
+    :param max_in_flight: Maximum number of payloads being parsed or extracted, \
+        for bounding the memory usage. Default: twice the number of threads.
+    :type max_in_flight: int, optional
+    :param ordered: Yield results in the order of payloads, \
+        otherwise in the order of done. Default: True.
+    :type ordered: bool, optional
+    :param return_exceptions: Yield pairs of (result, None) \
+        or (None, exception) instead of raising the first exception. \
+        Default: False.
+    :type return_exceptions: bool, optional
+
+    :returns: Results, or pairs of result and exception.
+    :rtype: Iterator[Any]
+
+    :raises ValueError: Invalid schema or parser.
+    """
+    plan = _plan_of(_resolve_schema(schema))
+    parse = _resolve_parser(parser)
+
+    def work(payload: Any) -> Any:
+        return plan(payload if parse is None else parse(payload))
+
+    if threads is None:
+        threads = min(32, (os.cpu_count() or 1) + 4)
+
+    if max_in_flight is None:
+        max_in_flight = threads * 2
+
+    with ThreadPoolExecutor(threads, thread_name_prefix="data_extractor") as executor:
+        completed = _completed_ordered if ordered else _completed_unordered
+        for future in completed(executor, work, payloads, max_in_flight):
+            if not return_exceptions:
+                yield future.result()
+                continue
+
+            exc = future.exception()
+            if exc is None:
+                yield future.result(), None
+            else:
+                yield None, exc
+
+
+def extract(
+    schema: Union[Field, str],
+    payloads: Iterable[Any],
+    parser: Union[str, Parser, None] = "html",
+    processes: Optional[int] = None,
+    mp_context: Union[BaseContext, str, None] = None,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """
+    Parse and extract payloads in a temporary :class:`ExtractorPool`,
+    the other keyword arguments are passed to :meth:`ExtractorPool.extract`.
+
+    :returns: Results, or pairs of result and exception.
+    :rtype: Iterator[Any]
+    """
+    with ExtractorPool(schema, parser, processes, mp_context) as pool:
+        yield from pool.extract(payloads, **kwargs)
+
+
+__all__ = (
+    "ExtractorPool",
+    "WorkerError",
+    "WorkerStats",
+    "extract",
+    "parsers",
+    "threaded_extract",
+)
@@ -0,0 +1,193 @@
+"""
+=========================================================
+:mod:`projection` -- Field projection of item extracting.
+=========================================================
+
+Extract a subset of the fields of an item,
+the nested items are pruned by the dotted path of fields::
+
+    Product(CSSExtractor("div.product")).extract(
+        root, only={"title", "price", "seller.name"}
+    )
+
+The pruned plans are cached per item and projection,
+so that the repeated extracting with the same projection costs nothing more.
+They are pruned again once the item is compiled again.
+"""
+
+# Standard Library
+import threading
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, NamedTuple, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+# Local Folder
+from .exceptions import ExtractError
+from .item import Item, _compile_plan, _is_customized_extract, _plan_of
+
+Plans = Dict[str, Callable[[Any], Any]]
+# field name to the paths of its nested fields, None for the whole field
+_Tree = Dict[str, Optional["_Tree"]]
+_Key = Tuple[Optional[FrozenSet[str]], Optional[FrozenSet[str]]]
+
+
+class Projection(NamedTuple):
+    """
+    The pruned plans of item, created by :func:`compile_projection`.
+    """
+
+    fields: Plans
+    """Plans of the projected fields by field name, in the order of fields."""
+    plan: Callable[[Any], Any]
+    """Function extracts the element like the `extract` method of item."""
+
+
+# the projections of item built against the plan of item
+_Cache = Tuple[Callable[[Any], Any], Dict[_Key, Projection]]
+_projections: "WeakKeyDictionary[Item, _Cache]" = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _tree_of(paths: Iterable[str]) -> _Tree:
+    tree: _Tree = {}
+    for path in paths:
+        node = tree
+        *parents, name = path.split(".")
+        for parent in parents:
+            child = node.setdefault(parent, {})
+            if child is None:
+                # the whole field is projected already
+                break
+
+            node = child
+        else:
+            node[name] = None
+
+    return tree
+
+
+def _field_names(item: Item) -> Dict[str, Any]:
+    fields = {}
+    for key in item.field_names():
+        field = getattr(item, key)
+        fields[key if field.name is None else field.name] = field
+
+    return fields
+
+
+def _check_prunable(item: Item) -> None:
+    if not isinstance(item, Item):
+        raise ValueError(f"Can't project the fields of non-item {item!r}")
+
+    if _is_customized_extract(item) or type(item)._extract is not Item._extract:
+        raise ValueError(f"Can't project the fields of customized {item!r}")
+
+
+def _project(
+    item: Item, only: Optional[_Tree], exclude: _Tree, prefix: str = ""
+) -> Plans:
+    fields = _field_names(item)
+    for tree in (only, exclude):
+        for name in tree or ():
+            if name not in fields:
+                raise ValueError(f"Unknown field {prefix + name!r} of {item!r}")
+
+    plans: Plans = {}
+    for name, field in fields.items():
+        if only is not None and name not in only:
+            continue
+
+        sub_only = None if only is None else only[name]
+        sub_exclude = exclude.get(name, {})
+        if sub_exclude is None:
+            continue
+
+        if sub_only is None and not sub_exclude:
+            plans[name] = _plan_of(field)
+            continue
+
+        _check_prunable(field)
+        pruned = _project(field, sub_only, sub_exclude, f"{prefix}{name}.")
+        plans[name] = _compile_plan(field, _compile_row(field, pruned))
+
+    return plans
+
+
+def _compile_row(item: Item, plans: Plans) -> Callable[[Any], Dict[str, Any]]:
+    fields = list(plans.items())
+
+    def extract_row(element: Any) -> Dict[str, Any]:
+        rv = {}
+        try:
+            for key, plan in fields:
+                rv[key] = plan(element)
+        except ExtractError as exc:
+            exc._append(extractor=item)
+            raise exc
+
+        return rv
+
+    return extract_row
+
+
+def compile_projection(
+    item: Item,
+    only: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> Projection:
+    """
+    Prune the fields of item, which is cached per item and projection.
+
+    The fields are referred by their names in the results, \
+        and the fields of nested items by the dotted path, e.g. ``"seller.name"``. \
+        The fields in `only` are kept, then the fields in `exclude` are removed. \
+        The convertor and type of the pruned items aren't applied, \
+        which extract dicts of the projected fields.
+
+    :param item: The item to prune.
+    :type item: :class:`data_extractor.item.Item`
+    :param only: Paths of the fields to keep. Default: all the fields.
+    :type only: Iterable[str], optional
+    :param exclude: Paths of the fields to remove. Default: no field.
+    :type exclude: Iterable[str], optional
+
+    :returns: The pruned plans.
+    :rtype: :class:`data_extractor.projection.Projection`
+
+    :raises ValueError: Unknown field, or the field can't be pruned, \
+        e.g. a field isn't item, or an item with customized extracting.
+    """
+    key: _Key = (
+        None if only is None else frozenset(only),
+        None if exclude is None else frozenset(exclude),
+    )
+    base = _plan_of(item)
+    cached = _projections.get(item)
+    # bound methods of the customized extract method are equal, not identical
+    if cached is not None and cached[0] == base:
+        try:
+            return cached[1][key]
+        except KeyError:
+            pass
+
+    only_tree = None if key[0] is None else _tree_of(key[0])
+    exclude_tree = {} if key[1] is None else _tree_of(key[1])
+    if key == (None, None):
+        fields = _project(item, None, {})
+        plan = base
+    else:
+        _check_prunable(item)
+        fields = _project(item, only_tree, exclude_tree)
+        plan = _compile_plan(item, _compile_row(item, fields))
+
+    projection = Projection(fields, plan)
+    with _lock:
+        cached = _projections.get(item)
+        if cached is None or cached[0] != base:
+            # the item is compiled again, drop the stale projections
+            cached = _projections[item] = (base, {})
+
+        return cached[1].setdefault(key, projection)
+
+
+__all__ = ("Projection", "compile_projection")
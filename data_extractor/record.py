@@ -0,0 +1,203 @@
+"""
+=================================================
+:mod:`record` -- Compact record results of items.
+=================================================
+
+Generate the record class of an item,
+whose instances are created positionally by the item
+instead of building a dict per row::
+
+    User(JSONExtractor("users[*]"), is_many=True, type=record_type(User))
+
+The record class is a :func:`collections.namedtuple`,
+or a class with ``__slots__`` if mutable records are wanted.
+"""
+
+# Standard Library
+import keyword
+import pickle
+import threading
+
+from collections import namedtuple
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type
+from weakref import WeakKeyDictionary, ref
+
+# Local Folder
+from .exceptions import ExtractError
+
+# the record classes per item class and slots,
+# they refer to the item class weakly as ``_item_class``.
+_record_types: "WeakKeyDictionary[type, Dict[bool, type]]" = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _record(cls: type, slots: bool, values: Tuple[Any, ...]) -> Any:
+    # records are pickled by their item class,
+    # the classes generated dynamically can't be pickled by reference.
+    return record_type(cls, slots)._make(values)  # type: ignore
+
+
+def _item_class_of(self: Any) -> type:
+    cls = self._item_class()
+    if cls is None:
+        raise pickle.PicklingError(
+            f"Can't pickle {self!r}: the item class is garbage collected"
+        )
+
+    return cls
+
+
+def _reduce_namedtuple(self: Any) -> Tuple[Any, ...]:
+    return _record, (_item_class_of(self), False, tuple(self))
+
+
+def _reduce_slots(self: Any) -> Tuple[Any, ...]:
+    return _record, (_item_class_of(self), True, self._astuple())
+
+
+def _slots_record(name: str, fields: Tuple[str, ...]) -> type:
+    args = ", ".join(fields)
+    body = "".join(f"    self.{field} = {field}\n" for field in fields) or "    pass\n"
+    namespace: Dict[str, Any] = {}
+    exec(f"def __init__(self, {args}):\n{body}", namespace)
+
+    def _make(cls: type, iterable: Iterable[Any]) -> Any:
+        return cls(*iterable)
+
+    def _astuple(self: Any) -> Tuple[Any, ...]:
+        return tuple(getattr(self, field) for field in fields)
+
+    def _asdict(self: Any) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in fields}
+
+    def __repr__(self: Any) -> str:
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in fields)
+        return f"{name}({values})"
+
+    def __eq__(self: Any, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return _astuple(self) == _astuple(other)
+
+    return type(
+        name,
+        (),
+        {
+            "__slots__": fields,
+            "_fields": fields,
+            "__init__": namespace["__init__"],
+            "_make": classmethod(_make),
+            "_astuple": _astuple,
+            "_asdict": _asdict,
+            "__repr__": __repr__,
+            "__eq__": __eq__,
+            "__reduce__": _reduce_slots,
+        },
+    )
+
+
+def compile_record(
+    item: Any, record: type, plans: List[Callable[[Any], Any]]
+) -> Callable[[Any], Any]:
+    """
+    Generate the function extracts a row into the record positionally, \
+        calling the plans of fields in order.
+
+    :param item: The item extracts rows.
+    :type item: :class:`data_extractor.item.Item`
+    :param record: The record class, e.g. created by :func:`record_type`.
+    :type record: type
+    :param plans: The plans of fields.
+    :type plans: List[Callable[[Any], Any]]
+
+    :returns: Function extracts a row into record.
+    :rtype: Callable[[Any], Any]
+    """
+    namespace: Dict[str, Any] = {
+        "ExtractError": ExtractError,
+        "item": item,
+        "record": record,
+        "new": tuple.__new__,
+    }
+    args = []
+    for idx, plan in enumerate(plans):
+        namespace[f"plan_{idx}"] = plan
+        args.append(f"plan_{idx}(element)")
+
+    if "_item_class" in vars(record) and issubclass(record, tuple):
+        # skip the arguments checking of the generated namedtuple
+        make = f"new(record, ({''.join(f'{arg}, ' for arg in args)}))"
+    else:
+        make = f"record({', '.join(args)})"
+
+    source = (
+        "def extract_record(element):\n"
+        "    try:\n"
+        f"        return {make}\n"
+        "    except ExtractError as exc:\n"
+        "        exc._append(extractor=item)\n"
+        "        raise exc\n"
+    )
+    exec(source, namespace)
+    return namespace["extract_record"]
+
+
+def record_type(cls: type, slots: bool = False) -> Type[Any]:
+    """
+    Get the record class of the Item subclass, which is cached per class.
+
+    The fields of record are in the order of the fields of item, \
+        named by the `name` parameter of field if it is set. \
+        The item typed as the record class creates records positionally.
+
+    :param cls: Subclass of :class:`data_extractor.item.Item`.
+    :type cls: type
+    :param slots: Generate a class with ``__slots__``, \
+        otherwise a :func:`collections.namedtuple`. Default: False.
+    :type slots: bool, optional
+
+    :returns: The record class.
+    :rtype: type
+
+    :raises ValueError: The field name is not a valid identifier.
+    """
+    try:
+        return _record_types[cls][slots]
+    except KeyError:
+        pass
+
+    fields = []
+    for key in cls.field_names():  # type: ignore
+        name = getattr(cls, key).name
+        fields.append(key if name is None else name)
+
+    for field in fields:
+        if (
+            not isinstance(field, str)
+            or not field.isidentifier()
+            or keyword.iskeyword(field)
+            or field.startswith("_")
+        ):
+            raise ValueError(f"Invalid field name of record: {field!r}")
+
+    name = f"{cls.__name__}Record"
+    record: type
+    if slots:
+        record = _slots_record(name, tuple(fields))
+    else:
+        record = type(
+            name,
+            (namedtuple(name, fields),),  # type: ignore
+            {"__slots__": (), "__reduce__": _reduce_namedtuple},
+        )
+
+    # the record class doesn't keep the item class alive
+    record._item_class = ref(cls)  # type: ignore
+    record.__module__ = cls.__module__
+    record.__qualname__ = f"record_type({cls.__qualname__})"
+    with _lock:
+        return _record_types.setdefault(cls, {}).setdefault(slots, record)
+
+
+__all__ = ("compile_record", "record_type")
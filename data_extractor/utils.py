@@ -6,6 +6,7 @@
 
 # Standard Library
 import inspect
+import threading
 
 from types import FrameType
 from typing import (
@@ -27,6 +28,10 @@ class __Sentinel:
     def __repr__(self) -> str:
         return "sentinel"
 
+    def __reduce__(self) -> str:
+        # pickled by reference to keep it singleton
+        return "sentinel"
+
 
 sentinel = __Sentinel()
 
@@ -98,18 +103,39 @@ if TYPE_CHECKING:
     from .core import AbstractExtractors
 
 
+_load_lock = threading.RLock()
+
+
+def _private_name(name: str) -> str:
+    """
+    Name of the slot or attribute stores the value of property.
+    """
+    return f"_property_{name}"
+
+
 class Property(Generic[T]):
     """
     Extractor property.
+
+    The values are stored in the slots of the extractors of this package, \
+        which are created by their metaclass, \
+        or in the instance dictionary otherwise.
+
+    :param loader: Optional name of the method creates the value \
+        on first access if it is not set, e.g. the compiled expression.
+    :type loader: str, optional
     """
 
+    def __init__(self, loader: Optional[str] = None):
+        self.loader = loader
+
     def __set_name__(self, owner: Any, name: str) -> None:
         """
         Customized names -- Descriptor HowTo Guide
         https://docs.python.org/3/howto/descriptor.html#customized-names
         """
         self.public_name = name
-        self.private_name = f"__property_{name}"
+        self.private_name = _private_name(name)
 
     @overload
     def __get__(self, obj: None, cls: Type["AbstractExtractors"]) -> "Property[T]":
@@ -128,10 +154,31 @@ class Property(Generic[T]):
         try:
             return getattr(obj, self.private_name)
         except AttributeError as exc:
+            if self.loader is not None:
+                return self._load(obj)
+
             # raise right AttributeError
             msg: str = exc.args[0]
             raise AttributeError(msg.replace(self.private_name, self.public_name))
 
+    def _load(self, obj: Any) -> T:
+        with _load_lock:
+            try:
+                # loaded by another thread
+                return getattr(obj, self.private_name)
+            except AttributeError:
+                pass
+
+            value: T = getattr(obj, self.loader)()  # type: ignore
+            setattr(obj, self.private_name, value)
+            return value
+
+    def is_loaded(self, obj: Any) -> bool:
+        """
+        Determine the value of object is set or loaded, return :obj:`True` if it is.
+        """
+        return hasattr(obj, self.private_name)
+
     def __set__(self, obj: Any, value: T) -> T:
         if hasattr(obj, self.private_name):
             raise AttributeError("can't set attribute")
@@ -148,6 +195,10 @@ class Property(Generic[T]):
             raise AttributeError(f"Type of attribute {property_name!r} is not Property")
 
         setattr(obj, attr.private_name, value)
+        property_changed = getattr(obj, "_property_changed", None)
+        if property_changed is not None:
+            # e.g. Field drops the plans compiled with the old value
+            property_changed(property_name)
 
 
 def _missing_dependency(dependency: str) -> None:
@@ -10,6 +10,9 @@ import pytest
 import data_extractor.json
 import data_extractor.utils
 
+# Local Folder
+from .utils import build_user
+
 
 @pytest.fixture(
     params=[
@@ -37,6 +40,15 @@ def json_extractor_backend(request):
     return backend_cls
 
 
+@pytest.fixture
+def user_schema(request, json_extractor_backend, monkeypatch):
+    # the options of schema are set by the USER_OPTIONS of test module
+    module = request.module
+    cls = build_user(module.__name__, **getattr(module, "USER_OPTIONS", {}))
+    monkeypatch.setattr(module, "User", cls, raising=False)
+    return cls
+
+
 @pytest.fixture
 def json0():
     return {
@@ -0,0 +1,213 @@
+# Standard Library
+import asyncio
+import threading
+import warnings
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from data_extractor.aio import extract_async, extract_many_async
+from data_extractor.exceptions import ExtractError
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+
+# Local Folder
+from .utils import user_getattr
+
+
+async def upper(value):
+    await asyncio.sleep(0)
+    upper.threads.add(threading.get_ident())
+    return value.upper()
+
+
+upper.threads = set()
+
+USER_OPTIONS = {"id_type": int, "convertor": upper}
+__getattr__ = user_getattr(__name__)
+
+
+def payload(idx):
+    return f'{{"id": {idx}, "name": "user{idx}"}}'
+
+
+def expected(idx):
+    return {"id": idx, "name": f"USER{idx}"}
+
+
+async def collect(aiterator):
+    return [rv async for rv in aiterator]
+
+
+def test_extract_async(user_schema):
+    async def main():
+        upper.threads.clear()
+        rv = await user_schema().extract_async(payload(1), parser="json")
+        assert rv == expected(1)
+        assert upper.threads == {threading.get_ident()}
+
+        rv = await extract_async(f"{__name__}:User", {"id": 2, "name": "user2"})
+        assert rv == expected(2)
+
+        with pytest.raises(ExtractError):
+            await extract_async(user_schema(), {"name": "user"})
+
+    asyncio.run(main())
+
+
+def test_extract_with_async_convertor_outside_event_loop(user_schema):
+    assert user_schema().extract({"id": 1, "name": "user1"}) == expected(1)
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+@pytest.mark.parametrize("codegen", [False, True])
+def test_extract_with_convertor_returning_coroutine(codegen):
+    class AsyncUpper:
+        async def __call__(self, value):
+            return value.upper()
+
+    class Names(Item):
+        a = Field(JSONExtractor("a"), convertor=lambda value: upper(value))
+        b = Field(JSONExtractor("b"), convertor=AsyncUpper())
+
+    item = Names()
+    item.compile(codegen=codegen)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert item.extract({"a": "x", "b": "y"}) == {"a": "X", "b": "Y"}
+        assert item.a.extract({"a": "x"}) == item.a._extract("x") == "X"
+
+
+def test_extract_with_async_convertor_inside_event_loop(user_schema):
+    async def main():
+        with pytest.raises(RuntimeError, match="extract_async"):
+            user_schema().extract({"id": 1, "name": "user1"})
+
+    with warnings.catch_warnings():
+        # the coroutine of convertor is closed instead of never awaited
+        warnings.simplefilter("error")
+        asyncio.run(main())
+
+
+def test_extract_async_in_process_pool(user_schema):
+    async def main():
+        with ProcessPoolExecutor(1) as executor:
+            rv = await extract_async(f"{__name__}:User", payload(2), "json", executor)
+            assert rv == expected(2)
+            rvs = await collect(
+                extract_many_async(
+                    f"{__name__}:User", [payload(0), payload(1)], "json", executor
+                )
+            )
+            assert rvs == [expected(0), expected(1)]
+
+            with pytest.raises(ValueError):
+                await extract_async(user_schema(), payload(1), "json", executor)
+
+            with pytest.raises(ValueError):
+                await collect(
+                    user_schema().extract_many_async([payload(1)], "json", executor)
+                )
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_extract_many_async(ordered, user_schema):
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def parse(payload):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+
+        threading.Event().wait(0.005)
+        with lock:
+            running -= 1
+
+        return payload
+
+    async def payloads():
+        for idx in range(20):
+            await asyncio.sleep(0)
+            yield {"id": idx, "name": f"user{idx}"}
+
+    async def main():
+        with ThreadPoolExecutor(8) as executor:
+            return await collect(
+                user_schema().extract_many_async(
+                    payloads(),
+                    parser=parse,
+                    executor=executor,
+                    concurrency=3,
+                    ordered=ordered,
+                )
+            )
+
+    rvs = asyncio.run(main())
+    if not ordered:
+        rvs.sort(key=lambda rv: rv["id"])
+
+    assert rvs == [expected(idx) for idx in range(20)]
+    assert max_running <= 3
+
+
+def test_extract_many_async_failures(user_schema):
+    documents = [payload(0), '{"id": 1}', "{"]
+
+    async def main():
+        rvs = await collect(
+            extract_many_async(user_schema(), documents, "json", return_exceptions=True)
+        )
+        assert rvs[0] == (expected(0), None)
+        assert rvs[1][0] is None and isinstance(rvs[1][1], ExtractError)
+        assert rvs[2][0] is None and isinstance(rvs[2][1], ValueError)
+
+        with pytest.raises(ExtractError):
+            await collect(extract_many_async(user_schema(), documents, "json"))
+
+        with pytest.raises(ValueError):
+            await collect(extract_many_async(user_schema(), documents, concurrency=0))
+
+    asyncio.run(main())
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_extract_many_async_cancellation():
+    started = threading.Event()
+    release = threading.Event()
+    parsed = []
+
+    def parse(payload):
+        started.set()
+        release.wait(5)
+        parsed.append(payload)
+        return payload
+
+    async def main(executor):
+        aiterator = extract_many_async(
+            Field(JSONExtractor("id")),
+            [{"id": idx} for idx in range(10)],
+            parse,
+            executor,
+        )
+        task = asyncio.ensure_future(aiterator.__anext__())
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await aiterator.aclose()
+        release.set()
+
+    with ThreadPoolExecutor(1) as executor:
+        asyncio.run(main(executor))
+
+    # the pending extractings are cancelled, except the running one
+    assert len(parsed) == 1
@@ -0,0 +1,77 @@
+# Standard Library
+import threading
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from data_extractor.cache import CacheInfo, LRUCache, cache_info, clear_caches
+
+
+@pytest.fixture
+def cache():
+    return LRUCache("test", maxsize=2)
+
+
+def test_lru_cache(cache):
+    assert cache.get_or_create("a", lambda: 1) == 1
+    assert cache.get_or_create("a", lambda: 2) == 1
+    assert cache.get_or_create("b", lambda: 2) == 2
+    assert cache.cache_info() == CacheInfo(1, 2, 0, 2, 2)
+
+    # "a" is the most recently used one, so "b" gets evicted.
+    assert cache.get_or_create("a", lambda: 0) == 1
+    assert cache.get_or_create("c", lambda: 3) == 3
+    assert cache.get_or_create("b", lambda: 4) == 4
+    assert cache.cache_info() == CacheInfo(2, 4, 2, 2, 2)
+
+
+def test_lru_cache_not_caching_exception(cache):
+    def factory():
+        raise ValueError
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            cache.get_or_create("a", factory)
+
+    assert cache.cache_info() == CacheInfo(0, 2, 0, 2, 0)
+
+
+def test_lru_cache_resize(cache):
+    cache.get_or_create("a", lambda: 1)
+    cache.get_or_create("b", lambda: 2)
+    cache.resize(1)
+    assert cache.cache_info() == CacheInfo(0, 2, 1, 1, 1)
+    assert cache.get_or_create("b", lambda: 0) == 2
+
+    cache.resize(0)
+    assert cache.get_or_create("b", lambda: 0) == 0
+    assert cache.get_or_create("b", lambda: 1) == 1
+    assert cache.cache_info() == CacheInfo(1, 4, 2, 0, 0)
+
+
+def test_lru_cache_thread_safety():
+    cache = LRUCache("test", maxsize=8)
+    values = []
+
+    def worker():
+        for idx in range(1000):
+            values.append(cache.get_or_create(idx % 16, object))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = cache.cache_info()
+    assert info.hits + info.misses == 4000
+    assert info.currsize == 8
+    assert info.evictions == info.misses - 8
+
+
+def test_cache_info_and_clear_caches(cache):
+    cache.get_or_create("a", lambda: 1)
+    assert cache_info()["test"] == CacheInfo(0, 1, 0, 2, 1)
+    clear_caches()
+    assert cache_info()["test"] == CacheInfo(0, 0, 0, 2, 0)
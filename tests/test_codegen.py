@@ -0,0 +1,122 @@
+# Standard Library
+import traceback
+
+from collections import namedtuple
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from data_extractor.codegen import generate
+from data_extractor.exceptions import ExtractError
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+
+# Local Folder
+from .utils import D
+
+
+@pytest.fixture
+def User():
+    class User(Item):
+        uid = Field(JSONExtractor("id"))
+        username = Field(JSONExtractor("name"), name="name")
+        gender = Field(JSONExtractor("gender"), default=None)
+
+    return User
+
+
+@pytest.fixture
+def UserResponse(User):
+    class UserResponse(Item):
+        start = Field(JSONExtractor("start"), default=0)
+        size = Field[int](JSONExtractor("size"))
+        total = Field(JSONExtractor("total"), convertor=str)
+        data = User(JSONExtractor("users[*]"), is_many=True)
+        first = User(JSONExtractor("users[0]"), type=namedtuple("U", "uid name gender"))
+
+    return UserResponse
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+@pytest.mark.parametrize("is_many", [True, False])
+def test_codegen_same_as_plan(json0, UserResponse, is_many):
+    data = [json0] if is_many else json0
+    item = UserResponse(JSONExtractor("data"), is_many=is_many)
+    expect = item.compile()(data)
+
+    plan = item.compile(codegen=True)
+    assert plan(data) == expect
+    assert item.extract(data) == expect
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_codegen_cached_per_class(UserResponse, User):
+    assert generate(UserResponse) is generate(UserResponse)
+    assert generate(User) is generate(User)
+    assert generate(User) is not generate(UserResponse)
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_codegen_extract_error(json0, UserResponse, User):
+    item = UserResponse(JSONExtractor("data"))
+    item.compile(codegen=True)
+    json0["data"]["users"][1].pop("id")
+    with pytest.raises(ExtractError) as catch:
+        item.extract(json0)
+
+    exc = catch.value
+    assert len(exc.extractors) == 3
+    assert exc.extractors[0] is User.uid
+    assert exc.extractors[1] is UserResponse.data
+    assert exc.extractors[2] is item
+    assert exc.element == json0["data"]["users"][1]
+
+    names = [frame.name for frame in traceback.extract_tb(exc.__traceback__)]
+    assert "extract_UserResponse" in names
+    assert "extract_UserResponse_data" in names
+    assert "extract_User" in names
+    assert "extract_User_uid" in names
+
+
+def test_codegen_with_unusual_field_names():
+    Foo = type(
+        "Foo-Bar",
+        (Item,),
+        {
+            "a-b": Field(D()),
+            "a_b": Field(D(), name="it's"),
+            "0": Field(D(), is_many=True),
+        },
+    )
+    item = Foo()
+    expect = item.compile()(1)
+    assert item.compile(codegen=True)(1) == expect == {"a-b": 1, "it's": 1, "0": [1]}
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_codegen_respects_customized_methods(json0):
+    class UpperField(Field):
+        def _extract(self, element):
+            return element.upper()
+
+    class NameField(Field):
+        def extract(self, element):
+            return f"name: {super().extract(element)}"
+
+    class Count(Item):
+        def _extract(self, element):
+            return len(element)
+
+    class User(Item):
+        gender = UpperField(JSONExtractor("gender"), default="")
+        name_ = NameField(JSONExtractor("name"), name="name")
+        count = Count()
+
+    item = User(JSONExtractor("data.users[*]"))
+    item.compile(codegen=True)
+    assert item.extract(json0) == {
+        "gender": "FEMALE",
+        "name": "name: Vang Stout",
+        "count": 3,
+    }
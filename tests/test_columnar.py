@@ -0,0 +1,178 @@
+# Standard Library
+import importlib.util
+
+from array import array
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from data_extractor.columnar import extract_columns
+from data_extractor.exceptions import ExtractError
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+
+need_numpy = pytest.mark.skipif(
+    importlib.util.find_spec("numpy") is None, reason="Missing 'numpy'"
+)
+
+
+@pytest.fixture
+def Article(json_extractor_backend):
+    class Author(Item):
+        username = Field(JSONExtractor("name"))
+        karma = Field(JSONExtractor("karma"), type=int, default=None)
+
+    class Article(Item):
+        id = Field(JSONExtractor("id"), type=int)
+        title = Field(JSONExtractor("title"), default="untitled")
+        score = Field(JSONExtractor("score"), type=float, default=0.5)
+        published = Field(JSONExtractor("published"), type=bool, default=False)
+        tags = Field(JSONExtractor("tags[*]"), is_many=True)
+        author = Author(JSONExtractor("author"), default=None)
+
+    return Article
+
+
+DOCUMENT = {
+    "articles": [
+        {
+            "id": 1,
+            "title": "a",
+            "score": 1,
+            "published": 1,
+            "tags": ["x", "y"],
+            "author": {"name": "u1", "karma": 10},
+        },
+        {"id": "2", "tags": [], "author": {"name": "u2"}},
+        {"id": 3, "title": "c", "score": 3.5, "tags": ["z"]},
+    ]
+}
+
+
+def test_extract_columns(Article):
+    item = Article(JSONExtractor("articles[*]"), is_many=True)
+    columns = extract_columns(item, [DOCUMENT], numpy=False)
+    assert columns.size == 3
+    assert set(columns.data) == {
+        "id",
+        "title",
+        "score",
+        "published",
+        "tags",
+        "author.username",
+        "author.karma",
+    }
+    assert columns.data["id"] == array("q", [1, 2, 3])
+    assert columns.data["title"] == ["a", "untitled", "c"]
+    assert columns.data["score"] == array("d", [1.0, 0.0, 3.5])
+    assert columns.data["published"] == array("B", [1, 0, 0])
+    assert columns.data["tags"] == [["x", "y"], [], ["z"]]
+    assert columns.data["author.username"] == ["u1", "u2", None]
+    assert columns.data["author.karma"] == array("q", [10, 0, 0])
+
+    assert columns.valid["id"] == array("B", [1, 1, 1])
+    assert columns.valid["title"] == array("B", [1, 0, 1])
+    assert columns.valid["score"] == array("B", [1, 0, 1])
+    assert columns.valid["tags"] == array("B", [1, 1, 1])
+    assert columns.valid["author.username"] == array("B", [1, 1, 0])
+    assert columns.valid["author.karma"] == array("B", [1, 0, 0])
+
+
+def test_extract_columns_same_as_rows(Article):
+    item = Article(JSONExtractor("articles[*]"), is_many=True)
+    rows = item.extract(DOCUMENT)
+    columns = extract_columns(item, [DOCUMENT, DOCUMENT], numpy=False)
+    assert columns.size == 6
+    for name in ("title", "tags"):
+        assert columns.data[name] == [row[name] for row in rows] * 2
+
+    assert list(columns.data["id"]) == [row["id"] for row in rows] * 2
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_extract_columns_not_flattened():
+    class Point(Item):
+        x = Field(JSONExtractor("x"), type=int)
+
+    class Shape(Item):
+        origin = Point(JSONExtractor("origin"), type=lambda x: (x,))
+        points = Point(JSONExtractor("points[*]"), is_many=True)
+
+    item = Shape(is_many=True)
+    document = {"origin": {"x": 0}, "points": [{"x": 1}, {"x": 2}]}
+    columns = extract_columns(item, [document], numpy=False)
+    assert columns.size == 1
+    assert columns.data == {"origin": [(0,)], "points": [[{"x": 1}, {"x": 2}]]}
+
+
+def test_extract_columns_not_is_many(Article):
+    item = Article(JSONExtractor("articles[*]"))
+    columns = extract_columns(item, [DOCUMENT], numpy=False)
+    assert columns.size == 1
+    assert columns.data["title"] == ["a"]
+
+    item = Article(JSONExtractor("missing[*]"), default=None)
+    assert extract_columns(item, [DOCUMENT], numpy=False).size == 0
+
+    with pytest.raises(ExtractError):
+        extract_columns(Article(JSONExtractor("missing[*]")), [DOCUMENT])
+
+
+def test_extract_columns_error(Article):
+    item = Article(JSONExtractor("articles[*]"), is_many=True)
+    document = {"articles": [{"id": 1, "author": {}}]}
+    with pytest.raises(ExtractError) as catch:
+        extract_columns(item, [document])
+
+    exc = catch.value
+    assert len(exc.extractors) == 3
+    assert exc.extractors[0] is Article.author.username
+    assert exc.extractors[1] is Article.author
+    assert exc.extractors[2] is item
+    assert exc.element == {}
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_extract_columns_typed_column_fallback():
+    class Counter(Item):
+        count = Field(JSONExtractor("count"), type=int)
+
+    document = [{"count": 1}, {"count": 2**64}]
+    columns = extract_columns(Counter(is_many=True), [document], numpy=False)
+    assert columns.data["count"] == [1, 2**64]
+
+
+@need_numpy
+def test_extract_columns_numpy(Article):
+    # Third Party Library
+    import numpy as np
+
+    item = Article(JSONExtractor("articles[*]"), is_many=True)
+    columns = extract_columns(item, [DOCUMENT])
+    assert columns.data["id"].dtype == np.int64
+    assert columns.data["id"].tolist() == [1, 2, 3]
+    assert columns.data["score"].dtype == np.float64
+    assert columns.data["published"].dtype == np.bool_
+    assert columns.data["published"].tolist() == [True, False, False]
+    assert columns.data["title"] == ["a", "untitled", "c"]
+    assert columns.valid["author.karma"].dtype == np.bool_
+    assert columns.valid["author.karma"].tolist() == [True, False, False]
+    assert (
+        np.ma.masked_array(
+            columns.data["author.karma"], mask=~columns.valid["author.karma"]
+        ).sum()
+        == 10
+    )
+
+
+def test_extract_columns_missing_numpy(monkeypatch, Article):
+    # First Party Library
+    import data_extractor.columnar
+
+    monkeypatch.setattr(data_extractor.columnar, "_missing_numpy", True)
+    item = Article(JSONExtractor("articles[*]"), is_many=True)
+    with pytest.raises(RuntimeError):
+        extract_columns(item, [DOCUMENT], numpy=True)
+
+    assert isinstance(extract_columns(item, [DOCUMENT]).data["id"], array)
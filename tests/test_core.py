@@ -0,0 +1,72 @@
+# Standard Library
+import linecache
+
+# Third Party Library
+import pytest
+
+# First Party Library
+import data_extractor.core
+
+from data_extractor.core import run_deferred_source_checks, source_index_cache
+from data_extractor.item import Field, Item
+
+# Local Folder
+from .utils import D
+
+source_code = """
+class User(Item):
+    baz = Field(D())
+
+    def baz(self):
+        pass
+
+
+class Article(Item):
+    title = Field(D())
+""".lstrip()
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    tmp_file = tmp_path / "foo.py"
+    tmp_file.write_text(source_code)
+    tmp_file = str(tmp_file)
+    linecache.updatecache(tmp_file)
+    return tmp_file
+
+
+@pytest.fixture
+def defer_source_checks(monkeypatch):
+    monkeypatch.setattr(data_extractor.core, "defer_source_checks", True)
+    monkeypatch.setattr(data_extractor.core, "_deferred_source_checks", {})
+
+
+def test_source_index_cached_per_file(source_file):
+    source_index_cache.clear()
+    good_source_code = source_code.split("\n\n\n")[1]
+    globals_ = {"Item": Item, "Field": Field, "D": D}
+    for _ in range(3):
+        exec(compile("\n" * 7 + good_source_code, source_file, "exec"), globals_)
+
+    assert source_index_cache.cache_info()[:2] == (2, 1)
+
+
+@pytest.mark.usefixtures("defer_source_checks")
+def test_deferred_source_checks(source_file):
+    globals_ = {"Item": Item, "Field": Field, "D": D}
+    exec(compile(source_code, source_file, "exec"), globals_)
+
+    errors = run_deferred_source_checks()
+    assert len(errors) == 1
+    exc = errors[0]
+    assert exc.filename == source_file
+    assert exc.lineno == 4
+    assert exc.text == "def baz(self):"
+
+    assert run_deferred_source_checks() == []
+
+
+@pytest.mark.usefixtures("defer_source_checks")
+def test_deferred_source_checks_in_repl():
+    exec(source_code, {"Item": Item, "Field": Field, "D": D})
+    assert run_deferred_source_checks() == []
@@ -1,4 +1,7 @@
 # Standard Library
+import gc
+import weakref
+
 from collections import namedtuple
 
 # Third Party Library
@@ -44,3 +47,37 @@ def test_item_with_type():
     rv = article.extract({"title": "example"})
     assert isinstance(rv, ArticleTuple)
     assert rv.title == "example"
+
+
+def test_specialization_cached():
+    assert Field[str] is Field[str]
+    assert Field[int] is not Field[str]
+    assert Item[str] is Item[str]
+    assert Item[str] is not Field[str]
+    assert Field[RV] is Field
+    assert Field[str](D()).extract(1) == "1"
+    assert Field[int](D()).extract("1") == 1
+
+
+def test_specialization_not_pinning_class():
+    class UserField(Field[RV]):
+        pass
+
+    specialized = UserField[int]
+    assert UserField[int] is specialized
+
+    ref = weakref.ref(UserField)
+    del UserField, specialized
+    gc.collect()
+    assert ref() is None
+
+
+def test_specialization_with_unhashable_type_parameter():
+    class Unhashable:
+        __hash__ = None  # type: ignore
+
+        def __call__(self, value):
+            return [value]
+
+    rv_type = Unhashable()
+    assert Field[rv_type](D()).extract(1) == [1]  # type: ignore
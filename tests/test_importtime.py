@@ -0,0 +1,80 @@
+# Standard Library
+import subprocess
+import sys
+
+from pathlib import Path
+from typing import Dict
+
+# Third Party Library
+import pytest
+
+OPTIONAL_BACKENDS = {
+    "lxml",
+    "cssselect",
+    "jsonpath",
+    "jsonpath_rw",
+    "jsonpath_rw_ext",
+    "ply",
+}
+
+# imported by the modules using them only, e.g. data_extractor.aio
+DEFERRED_MODULES = {
+    "asyncio",
+    "concurrent",
+    "multiprocessing",
+    "numpy",
+}
+
+
+def importtime(statement: str) -> Dict[str, int]:
+    """
+    Cold import in a new interpreter,
+    returns the cumulative import time in microseconds of every module.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rv = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:") :].split("|")
+        rv[name.strip()] = int(cumulative)
+
+    return rv
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import data_extractor",
+        "from data_extractor import Field, Item",
+        "import data_extractor.json",
+    ],
+)
+def test_cold_import_without_optional_backends(statement):
+    modules = importtime(statement)
+    imported = {name.partition(".")[0] for name in modules}
+    assert "data_extractor" in imported
+    assert not imported & OPTIONAL_BACKENDS
+    assert not imported & DEFERRED_MODULES
+
+
+def test_lazy_attributes():
+    modules = importtime("import data_extractor; data_extractor.XPathExtractor")
+    assert "lxml.etree" in modules
+
+
+def test_missing_attribute():
+    # First Party Library
+    import data_extractor
+
+    with pytest.raises(AttributeError):
+        data_extractor.NotExists
+
+    assert "XPathExtractor" in dir(data_extractor)
@@ -15,11 +15,12 @@ from typing import Any, Iterable, Optional, Tuple
 import pytest
 
 # First Party Library
-from data_extractor.exceptions import ExtractError
+from data_extractor.exceptions import ExprError, ExtractError
 from data_extractor.item import Field, Item
 from data_extractor.json import JSONExtractor
 from data_extractor.lxml import CSSExtractor, TextCSSExtractor, XPathExtractor
 from data_extractor.utils import (
+    Property,
     __Sentinel,
     is_complex_extractor,
     is_simple_extractor,
@@ -451,6 +452,31 @@ def test_type_creation():
     type("Foo", (Item,), {"bar": Field(JSONExtractor("bar"))})
 
 
+@pytest.mark.usefixtures("json_extractor_backend")
+@pytest.mark.parametrize(
+    "method",
+    ["validate", "extract_many", "extract_async", "extract_many_async", "compile"],
+)
+def test_field_overwrites_item_method(method):
+    with pytest.raises(SyntaxError):
+        type("Foo", (Item,), {method: Field(JSONExtractor(method))})
+
+    item = type("Foo", (Item,), {"bar": Field(JSONExtractor(method), name=method)})()
+    assert item.extract({method: 1}) == {method: 1}
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_field_named_after_helper_function():
+    class Foo(Item):
+        extract_columns = Field(JSONExtractor("columns"))
+        record_type = Field(JSONExtractor("record"))
+
+    assert Foo().extract({"columns": 1, "record": 2}) == {
+        "extract_columns": 1,
+        "record_type": 2,
+    }
+
+
 @need_lxml
 def test_field_overwrites_item_parameter_type_creation(
     stack_frame_support, item_property
@@ -1284,3 +1310,139 @@ def test_item_remove_super_extractor():
 
     extractor = NoIdUser()
     assert extractor.extract({"id": 1}) == {}
+
+
+@need_cssselect
+def test_item_compile(element1, Article0):
+    item = Article0(CSSExtractor("li.article"), is_many=True)
+    plan = item.compile()
+    assert plan(element1) == [
+        {"title": "Title 1", "content": "Content 1"},
+        {"title": "Title 2", "content": "Content 2"},
+    ]
+    assert item.extract(element1) == plan(element1)
+
+
+@need_cssselect
+def test_item_compiled_failure_trace(element2, Article0):
+    item = Article0(CSSExtractor("li.article"), is_many=True)
+    item.compile()
+    with pytest.raises(ExtractError) as catch:
+        item.extract(element2)
+
+    exc = catch.value
+    assert len(exc.extractors) == 2
+    assert exc.extractors[0] is Article0.content
+    assert exc.extractors[1] is item
+    assert exc.element is element2.xpath("//li[@class='article'][2]")[0]
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_item_compile_again_after_changing_property(json0):
+    class User(Item):
+        uid = Field(JSONExtractor("id"))
+
+    item = User(JSONExtractor("data.users[*]"))
+    assert item.extract(json0) == {"uid": 0}
+
+    Property.change_internal_value(item, "is_many", True)
+    assert item.extract(json0) == [{"uid": uid} for uid in range(6)]
+
+    class Users(Item):
+        uid = Field(JSONExtractor("data.users[*].id"))
+
+    item = Users()
+    item.compile(codegen=True)
+    assert item.extract(json0) == {"uid": 0}
+    assert item.extract(json0, only={"uid"}) == {"uid": 0}
+
+    Property.change_internal_value(Users.uid, "is_many", True)
+    assert Users.uid.extract(json0) == list(range(6))
+    # the item built with the old plan of field is compiled again
+    assert item.extract(json0) == {"uid": list(range(6))}
+    assert item.extract(json0, only={"uid"}) == {"uid": list(range(6))}
+    assert dict(item.extract(json0, lazy=True)) == {"uid": list(range(6))}
+
+    Property.change_internal_value(Users.uid, "is_many", False)
+    Property.change_internal_value(Users.uid, "default", -1)
+    assert item.extract({}) == {"uid": -1}
+    for codegen in (False, True):
+        item.compile(codegen=codegen)
+        Property.change_internal_value(Users.uid, "default", codegen)
+        assert item.extract({}) == {"uid": codegen}
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_compiled_item_respects_customized_methods(json0):
+    class UpperField(Field):
+        def _extract(self, element):
+            return element.upper()
+
+    class NameField(Field):
+        def extract(self, element):
+            return f"name: {super().extract(element)}"
+
+    class User(Item):
+        gender = UpperField(JSONExtractor("gender"), default="")
+        name_ = NameField(JSONExtractor("name"), name="name")
+
+    class CountingUser(User):
+        def _extract(self, element):
+            rv = super()._extract(element)
+            rv["count"] = len(rv)
+            return rv
+
+    assert User(JSONExtractor("data.users[*]")).extract(json0) == {
+        "gender": "FEMALE",
+        "name": "name: Vang Stout",
+    }
+    assert CountingUser(JSONExtractor("data.users[*]")).extract(json0) == {
+        "gender": "FEMALE",
+        "name": "name: Vang Stout",
+        "count": 2,
+    }
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_item_validate_lazy_extractors():
+    class User(Item):
+        id = Field(JSONExtractor("id", lazy=True))
+        title = Field(JSONExtractor("title[", lazy=True))
+
+    class Users(Item):
+        users = User(JSONExtractor("users", lazy=True), is_many=True)
+
+    item = Users()
+    with pytest.raises(ExprError) as catch:
+        item.validate()
+
+    assert catch.value.extractor is User.title.extractor
+    with pytest.raises(ExprError):
+        item.simplify().validate()
+
+
+@need_lxml
+def test_item_extract_many(element1, element2, Article0):
+    item = Article0(XPathExtractor("//li[@class='article']"), is_many=True)
+    results = item.extract_many(iter([element1, element1]))
+    assert inspect.isgenerator(results)
+    assert list(results) == [item.extract(element1)] * 2
+
+    with pytest.raises(ExtractError):
+        list(item.extract_many([element1, element2]))
+
+    results = list(item.extract_many([element2, element1], return_exceptions=True))
+    assert len(results) == 2
+    rv, exc = results[0]
+    assert rv is None
+    assert isinstance(exc, ExtractError)
+    assert results[1] == (item.extract(element1), None)
+
+
+def test_field_extract_many_respects_customized_extract():
+    class Upper(Field):
+        def extract(self, element):
+            return super().extract(element).upper()
+
+    field = Upper()
+    assert list(field.extract_many(["a", "b"])) == ["A", "B"]
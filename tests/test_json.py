@@ -103,3 +103,284 @@ def test_invalid_jsonpath_expr(element, expr):
         assert isinstance(exc.exc, (JsonPathLexerError, Exception))
 
     assert re.match(r"ExprError with .+? raised by .+? extracting", str(exc))
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_renamed_backend_type_cached():
+    extractors = [JSONExtractor("foo"), JSONExtractor("bar")]
+    cls = type(extractors[0])
+    assert cls is type(extractors[1])
+    assert cls.__name__ == "JSONExtractor"
+    assert issubclass(cls, data_extractor.json.json_extractor_backend)
+
+
+def test_renamed_backend_type_switching():
+    class FooBackend(JSONExtractor):
+        def __init__(self, expr):
+            super(JSONExtractor, self).__init__(expr)
+
+    class BarBackend(FooBackend):
+        pass
+
+    backend = data_extractor.json.json_extractor_backend
+    try:
+        data_extractor.json.json_extractor_backend = FooBackend
+        foo = JSONExtractor("foo")
+        data_extractor.json.json_extractor_backend = BarBackend
+        bar = JSONExtractor("bar")
+        assert type(foo).__bases__ == (FooBackend,)
+        assert type(bar).__bases__ == (BarBackend,)
+
+        data_extractor.json.json_extractor_backend = FooBackend
+        assert type(JSONExtractor("foo")) is type(foo)
+    finally:
+        data_extractor.json.json_extractor_backend = backend
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_jsonpath_cache():
+    cache = data_extractor.json.jsonpath_cache
+    cache.clear()
+    data_extractor.json.prewarm(["foo[*].baz", "foo[0].baz", "foo[*].baz"])
+    assert cache.cache_info()[:2] == (1, 2)
+
+    extractors = [JSONExtractor("foo[*].baz") for _ in range(2)]
+    assert extractors[0]._jsonpath is extractors[1]._jsonpath
+    assert cache.cache_info()[:2] == (3, 2)
+
+    with pytest.raises(ExprError):
+        data_extractor.json.prewarm(["foo.."])
+
+
+def test_jsonpath_cache_keyed_by_backend():
+    backends = [
+        backend
+        for backend, missing in [
+            (
+                data_extractor.json.JSONPathExtractor,
+                data_extractor.json._missing_jsonpath,
+            ),
+            (
+                data_extractor.json.JSONPathRWExtractor,
+                data_extractor.json._missing_jsonpath_rw,
+            ),
+            (
+                data_extractor.json.JSONPathRWExtExtractor,
+                data_extractor.json._missing_jsonpath_rw_ext,
+            ),
+        ]
+        if not missing
+    ]
+    if not backends:
+        pytest.skip("Missing JSONPath backends")
+
+    data_extractor.json.jsonpath_cache.clear()
+    data_extractor.json.prewarm(["foo[*].baz"] * 2, backend=backends[0])
+    for backend in backends:
+        data_extractor.json.prewarm(["foo[*].baz"], backend=backend)
+
+    info = data_extractor.json.jsonpath_cache.cache_info()
+    assert info.hits == 2
+    assert info.currsize == info.misses == len(backends)
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_lazy_compile(element, monkeypatch):
+    extractor = JSONExtractor("foo..", lazy=True)
+    with pytest.raises(ExprError) as catch:
+        extractor.extract(element)
+
+    assert catch.value.extractor is extractor
+    with pytest.raises(ExprError):
+        extractor.validate()
+
+    monkeypatch.setattr(data_extractor.core, "lazy_compile", True)
+    extractor = JSONExtractor("foo[0].baz")
+    assert not type(extractor)._jsonpath.is_loaded(extractor)
+    assert extractor.extract_first(element) == 1
+    assert type(extractor)._jsonpath.is_loaded(extractor)
+
+    # prewarm compiles the expressions even if in lazy mode
+    with pytest.raises(ExprError):
+        data_extractor.json.prewarm(["foo.."])
+
+
+STREAMING_DOCUMENT = """
+{
+    "data": {
+        "users": [
+            {"id": 0, "name": "Vang \\\\\\"Stout\\\\\\"", "tags": ["a]", "{b"]},
+            {"id": 1, "name": "Jeannie Gaines", "score": -1.5e3},
+            {"id": 2, "name": "\\u00e9t\\u00e9", "active": true, "note": null}
+        ],
+        "total": 100
+    },
+    "status": 0
+}
+"""
+
+
+@pytest.mark.parametrize(
+    "path,expect",
+    [
+        ("$.data.total", [100]),
+        ("data.total", [100]),
+        ("$['data']['users'][1].id", [1]),
+        ('$["status"]', [0]),
+        ("$.data.users[*].name", ['Vang \\"Stout\\"', "Jeannie Gaines", "été"]),
+        ("$.data.users[0].tags[*]", ["a]", "{b"]),
+        ("$.data.users[*].score", [-1500.0]),
+        ("$.*", [json.loads(STREAMING_DOCUMENT)["data"], 0]),
+        ("$.data.*[2]", [json.loads(STREAMING_DOCUMENT)["data"]["users"][2]]),
+        ("$.data.users[3]", []),
+        ("$.missing[*]", []),
+        ("$", [json.loads(STREAMING_DOCUMENT)]),
+    ],
+)
+@pytest.mark.parametrize(
+    "source", ["str", "text_file", "binary_file", "path", "bytes", "memoryview"]
+)
+@pytest.mark.parametrize("chunksize", [1, 7, 2**16])
+def test_iterparse(tmp_path, source, chunksize, path, expect):
+    # Standard Library
+    import io
+
+    # First Party Library
+    from data_extractor.json import iterparse
+
+    text = STREAMING_DOCUMENT
+    if source == "text_file":
+        text = io.StringIO(text)
+    elif source == "binary_file":
+        text = io.BytesIO(text.encode())
+    elif source == "bytes":
+        text = text.encode()
+    elif source == "memoryview":
+        text = memoryview(bytearray(text.encode()))
+    else:
+        filename = tmp_path / "data.json"
+        filename.write_text(text, encoding="utf-8")
+        text = str(filename) if source == "str" else filename
+
+    assert list(iterparse(text, path, chunksize=chunksize)) == expect
+
+
+def test_iterparse_number_cut_off():
+    # Standard Library
+    import io
+
+    # First Party Library
+    from data_extractor.json import iterparse
+
+    # the buffer ends right after the dot of float
+    text = '["' + "x" * 65528 + '", 12.75, 1]'
+    assert list(iterparse(io.StringIO(text), "$[1]")) == [12.75]
+
+
+def test_iterparse_chunk_boundaries():
+    # Standard Library
+    import io
+    import random
+
+    # First Party Library
+    from data_extractor.json import iterparse
+
+    rand = random.Random(0)
+    scalars = [
+        lambda: rand.randint(-(10**6), 10**6),
+        lambda: round(rand.uniform(-1e3, 1e3), rand.randint(0, 6)),
+        lambda: rand.uniform(-1, 1) * 10 ** rand.randint(-30, 30),
+        lambda: "".join(
+            rand.choice('ab"\\é{}[],: ') for _ in range(rand.randint(0, 5))
+        ),
+        lambda: rand.choice([True, False, None]),
+    ]
+
+    def value(depth=0):
+        kind = rand.randint(0, 6 if depth < 3 else 4)
+        if kind == 5:
+            return [value(depth + 1) for _ in range(rand.randint(0, 4))]
+        if kind == 6:
+            return {f"k{idx}": value(depth + 1) for idx in range(rand.randint(0, 4))}
+        return scalars[kind]()
+
+    for _ in range(200):
+        doc = [value() for _ in range(rand.randint(1, 6))]
+        text = json.dumps(doc, indent=rand.choice([None, 1]))
+        expect = json.loads(text)
+        for chunksize in range(1, 8):
+            rv = list(iterparse(io.StringIO(text), "$[*]", chunksize=chunksize))
+            assert rv == expect, (text, chunksize)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"data": [1, 2', '{"data": [1 2]}', '{"data": []} []', '{"data" 1}', "[1,"],
+)
+def test_iterparse_invalid_document(text):
+    # Standard Library
+    import io
+
+    # First Party Library
+    from data_extractor.json import iterparse
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iterparse(io.StringIO(text), "$.data[*]", chunksize=4))
+
+
+@pytest.mark.parametrize("path", ["$..users", "$.users[?(@.id)]", "$.users[0:2]"])
+def test_iterparse_unsupported_path(path):
+    # Standard Library
+    import io
+
+    # First Party Library
+    from data_extractor.json import iterparse
+
+    with pytest.raises(ValueError):
+        list(iterparse(io.StringIO("{}"), path))
+
+
+@pytest.mark.parametrize("source", [1, None, ["{}"]])
+def test_iterparse_unsupported_source(source):
+    # First Party Library
+    from data_extractor.json import iterparse
+
+    with pytest.raises(TypeError):
+        list(iterparse(source, "$"))
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_iterextract():
+    # Standard Library
+    import io
+
+    # First Party Library
+    from data_extractor.item import Field, Item
+    from data_extractor.json import iterextract
+
+    class User(Item):
+        id = Field(JSONExtractor("id"))
+        username = Field(JSONExtractor("name"), name="name")
+        score = Field(JSONExtractor("score"), default=None)
+
+    users = User(JSONExtractor("data.users[*]"), is_many=True)
+    with pytest.raises(ValueError):
+        next(iterextract(users, io.StringIO(STREAMING_DOCUMENT), "$.data.users[*]"))
+
+    records = iterextract(User(), io.StringIO(STREAMING_DOCUMENT), "$.data.users[*]")
+    assert list(records) == users.extract(json.loads(STREAMING_DOCUMENT))
+
+    class Tagged(Item):
+        tag = Field(JSONExtractor("tags[0]"))
+
+    rvs = list(
+        iterextract(
+            Tagged(),
+            io.StringIO(STREAMING_DOCUMENT),
+            "$.data.users[*]",
+            return_exceptions=True,
+        )
+    )
+    assert rvs[0] == ({"tag": "a]"}, None)
+    assert rvs[1][0] is None
+    assert isinstance(rvs[1][1], ExtractError)
@@ -0,0 +1,159 @@
+# Standard Library
+import io
+import json
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from data_extractor.exceptions import ExtractError
+from data_extractor.jsonl import JSONLinesWriter, iterextract, iterlines, shards
+
+# Local Folder
+from .utils import build_user
+
+USER_OPTIONS = {"id_type": int, "name": None}
+
+
+@pytest.fixture
+def users_file(tmp_path):
+    path = tmp_path / "users.jsonl"
+    path.write_text(
+        "".join(
+            json.dumps({"id": idx, "name": f"user{idx}" * (idx % 7)}) + "\n"
+            for idx in range(100)
+        )
+    )
+    return path
+
+
+def test_iterlines(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(b'{"a": 1}\n\n  \n{"a": 2}\r\n{"a": 3}')
+    assert [json.loads(line) for line in iterlines(path)] == [
+        {"a": 1},
+        {"a": 2},
+        {"a": 3},
+    ]
+
+
+def test_iterlines_empty_file(tmp_path):
+    path = tmp_path / "empty.jsonl"
+    path.write_bytes(b"")
+    assert list(iterlines(path)) == []
+    assert list(iterlines(path, 0, 10)) == []
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 7, 100, 1000])
+def test_shards_cover_lines_once(users_file, count):
+    ranges = shards(users_file, count)
+    assert len(ranges) == count
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == users_file.stat().st_size
+
+    lines = [
+        line for start, end in ranges for line in iterlines(users_file, start, end)
+    ]
+    assert lines == list(iterlines(users_file))
+    assert len(lines) == 100
+
+
+def test_shards_every_offset(users_file):
+    size = users_file.stat().st_size
+    expect = list(iterlines(users_file))
+    for offset in range(size + 1):
+        lines = list(iterlines(users_file, 0, offset))
+        lines.extend(iterlines(users_file, offset, size))
+        assert lines == expect
+
+
+def test_shards_invalid_count(users_file):
+    with pytest.raises(ValueError):
+        shards(users_file, 0)
+
+
+def test_iterextract(users_file, user_schema):
+    users = list(iterextract(user_schema(), users_file))
+    assert users[:3] == [
+        {"id": 0, "username": ""},
+        {"id": 1, "username": "user1"},
+        {"id": 2, "username": "user2user2"},
+    ]
+    assert [user["id"] for user in users] == list(range(100))
+
+
+def test_iterextract_return_exceptions(tmp_path, user_schema):
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"id": 1, "name": "a"}\n{"id": 2}\n{invalid\n')
+    results = list(iterextract(user_schema(), path, return_exceptions=True))
+    assert results[0] == ({"id": 1, "username": "a"}, None)
+    assert results[1][0] is None
+    assert isinstance(results[1][1], ExtractError)
+    assert results[2][0] is None
+    assert isinstance(results[2][1], json.JSONDecodeError)
+
+    with pytest.raises(ExtractError):
+        list(iterextract(user_schema(), path))
+
+
+def _extract_shard(args):
+    path, start, end, output = args
+    with JSONLinesWriter(output) as sink:
+        # built in the worker of spawn start method
+        return sink.write_many(
+            iterextract(build_user(__name__, **USER_OPTIONS)(), path, start, end)
+        )
+
+
+def test_extract_shards_in_processes(users_file, tmp_path, user_schema):
+    ranges = shards(users_file, 3)
+    outputs = [tmp_path / f"output-{idx}.jsonl" for idx in range(len(ranges))]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(2, mp_context=context) as executor:
+        counts = list(
+            executor.map(
+                _extract_shard,
+                [
+                    (users_file, start, end, output)
+                    for (start, end), output in zip(ranges, outputs)
+                ],
+            )
+        )
+
+    assert sum(counts) == 100
+    users = [
+        json.loads(line)
+        for output in outputs
+        for line in output.read_text().split("\n")
+        if line
+    ]
+    assert users == list(iterextract(user_schema(), users_file))
+
+
+def test_writer_buffers():
+    fp = io.BytesIO()
+    sink = JSONLinesWriter(fp, buffer_size=64)
+    sink.write({"name": "ä"})
+    assert fp.getvalue() == b""
+
+    assert sink.write_many({"id": idx} for idx in range(10)) == 10
+    assert fp.getvalue() != b""
+
+    sink.close()
+    assert not fp.closed
+    lines = fp.getvalue().decode().splitlines()
+    assert lines[0] == '{"name":"ä"}'
+    assert [json.loads(line) for line in lines[1:]] == [
+        {"id": idx} for idx in range(10)
+    ]
+
+
+def test_writer_path(tmp_path):
+    path = tmp_path / "output.jsonl"
+    with JSONLinesWriter(str(path), ensure_ascii=True) as sink:
+        sink.write({"name": "ä"})
+
+    assert path.read_bytes() == b'{"name":"\\u00e4"}\n'
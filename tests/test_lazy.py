@@ -0,0 +1,163 @@
+# Standard Library
+import pickle
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from data_extractor.exceptions import ExtractError
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+from data_extractor.lazy import LazyResult, extract_lazy
+
+
+@pytest.fixture
+def Author(json_extractor_backend):
+    class Author(Item):
+        username = Field(JSONExtractor("name"))
+
+    return Author
+
+
+@pytest.fixture
+def Article(Author):
+    class Article(Item):
+        id = Field(JSONExtractor("id"), type=int)
+        title = Field(JSONExtractor("title"), name="headline", default="")
+        author = Author(JSONExtractor("author"))
+        text = Field(JSONExtractor("text"))
+
+    return Article
+
+
+DOCUMENT = {
+    "articles": [
+        {"id": "1", "title": "a", "author": {"name": "u1"}, "text": "t1"},
+        {"id": 2, "author": {}, "text": "t2"},
+    ]
+}
+
+
+def test_extract_lazy(Article):
+    item = Article(JSONExtractor("articles[*]"), is_many=True)
+    rvs = item.extract(DOCUMENT, lazy=True)
+    assert all(isinstance(rv, LazyResult) for rv in rvs)
+    assert list(rvs[0]) == ["id", "headline", "author", "text"]
+    assert len(rvs[0]) == 4
+    assert not rvs[0].is_extracted("id")
+    assert repr(rvs[0]) == (
+        "LazyResult({'id': ..., 'headline': ..., 'author': ..., 'text': ...})"
+    )
+
+    assert rvs[0]["id"] == 1
+    assert rvs[0].is_extracted("id")
+    assert not rvs[0].is_extracted("text")
+    assert repr(rvs[0]).startswith("LazyResult({'id': 1, 'headline': ...")
+    assert dict(rvs[0]) == Article(JSONExtractor("articles[0]")).extract(DOCUMENT)
+    assert rvs[0]._element is None
+
+    assert "text" in rvs[1]
+    assert not rvs[1].is_extracted("text")
+
+    with pytest.raises(KeyError):
+        rvs[0]["title"]
+
+    with pytest.raises(KeyError):
+        rvs[0].is_extracted("title")
+
+
+def test_extract_lazy_failures(Article):
+    item = Article(JSONExtractor("articles[1]"))
+    rv = item.extract(DOCUMENT, lazy=True)
+    assert rv["id"] == 2
+    assert rv["headline"] == ""
+    for _ in range(2):
+        with pytest.raises(ExtractError) as catch:
+            rv["author"]
+
+        exc = catch.value
+        assert len(exc.extractors) == 3
+        assert exc.extractors[1] is item.author
+        assert exc.extractors[2] is item
+
+    assert not rv.is_extracted("author")
+    assert rv.get("text") == "t2"
+    assert "author" in rv
+    assert "missing" not in rv
+    assert rv.get("missing", 1) == 1
+    with pytest.raises(ExtractError):
+        rv.get("author")
+
+
+def test_extract_lazy_default(Article):
+    item = Article(JSONExtractor("missing"))
+    with pytest.raises(ExtractError) as catch:
+        item.extract(DOCUMENT, lazy=True)
+
+    assert catch.value.extractors == [item]
+
+    item = Article(JSONExtractor("missing"), default=None)
+    assert item.extract(DOCUMENT, lazy=True) is None
+    assert (
+        Article(JSONExtractor("missing[*]"), is_many=True).extract(DOCUMENT, lazy=True)
+        == []
+    )
+
+
+def test_extract_lazy_skip_convertor(Author):
+    item = Author(JSONExtractor("articles[0].author"), convertor=lambda rv: None)
+    assert item.extract(DOCUMENT) is None
+    assert dict(item.extract(DOCUMENT, lazy=True)) == {"username": "u1"}
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_extract_lazy_customized():
+    class Customized(Item):
+        username = Field(JSONExtractor("name"))
+
+        def _extract(self, element):
+            return super()._extract(element)
+
+    with pytest.raises(ValueError):
+        extract_lazy(Customized(), {"name": "u1"})
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_extract_lazy_threads():
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def convertor(value):
+        calls.append(value)
+        return value
+
+    class User(Item):
+        username = Field(JSONExtractor("name"), convertor=convertor)
+
+    rv = User().extract({"name": "u1"}, lazy=True)
+
+    def access(_):
+        barrier.wait()
+        return rv["username"]
+
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(access, range(8))) == ["u1"] * 8
+
+    assert calls == ["u1"]
+
+
+def test_pickle_lazy_result(Article):
+    rv = Article(JSONExtractor("articles[0]")).extract(DOCUMENT, lazy=True)
+    unpickled = pickle.loads(pickle.dumps(rv))
+    assert type(unpickled) is dict
+    assert unpickled == Article(JSONExtractor("articles[0]")).extract(DOCUMENT)
+
+
+def test_nested_lazy_plans(Article):
+    item = Article(JSONExtractor("articles[0]"))
+    assert item.extract(DOCUMENT) == dict(item.extract(DOCUMENT, lazy=True))
+    # the overridden extract method of item doesn't customize the plan
+    assert item.author._plan is not None
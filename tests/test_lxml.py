@@ -214,3 +214,274 @@ def test_xpath_result_not_list(element):
     extractor = XPathExtractor("normalize-space(//span)")
     assert extractor.extract(element) == ["a"]
     assert extractor.extract_first(element) == "a"
+
+
+@need_lxml
+def test_xpath_cache(element):
+    # First Party Library
+    from data_extractor.lxml import xpath_cache
+
+    xpath_cache.clear()
+    extractors = [XPathExtractor("//span/@class") for _ in range(3)]
+    assert all(e._find is extractors[0]._find for e in extractors)
+    assert xpath_cache.cache_info()[:2] == (2, 1)
+    assert extractors[2].extract(element) == ["class_a", "class_b"]
+
+    with pytest.raises(ExprError):
+        XPathExtractor("///")
+
+    assert xpath_cache.cache_info().currsize == 1
+
+
+@need_cssselect
+def test_css_to_xpath_cache(element):
+    # First Party Library
+    from data_extractor.lxml import css_to_xpath_cache
+
+    css_to_xpath_cache.clear()
+    extractors = [
+        TextCSSExtractor("span.class_a"),
+        AttrCSSExtractor("span.class_a", "class"),
+        CSSExtractor("span.class_a"),
+    ]
+    assert css_to_xpath_cache.cache_info()[:2] == (2, 1)
+    assert extractors[0].extract(element) == ["a"]
+    assert extractors[1].extract(element) == ["class_a"]
+
+    excs = []
+    for _ in range(2):
+        with pytest.raises(ExprError) as catch:
+            CSSExtractor("a##")
+
+        excs.append(catch.value.exc)
+
+    assert excs[0] is excs[1]
+    assert css_to_xpath_cache.cache_info()[:2] == (3, 2)
+
+
+@pytest.mark.parametrize(
+    "Extractor,args",
+    [
+        (XPathExtractor, ("///",)),
+        pytest.param(CSSExtractor, ("a##",), marks=need_cssselect),
+        pytest.param(TextCSSExtractor, ("a##",), marks=need_cssselect),
+        pytest.param(AttrCSSExtractor, ("a##", "class"), marks=need_cssselect),
+    ],
+)
+def test_lazy_compile_invalid_expr(element, Extractor, args):
+    extractor = Extractor(*args, lazy=True)
+    with pytest.raises(ExprError) as catch:
+        extractor.validate()
+
+    assert catch.value.extractor is extractor
+    with pytest.raises(ExprError):
+        extractor.extract(element)
+
+
+@need_cssselect
+def test_lazy_compile(element, monkeypatch):
+    # First Party Library
+    import data_extractor.core
+
+    monkeypatch.setattr(data_extractor.core, "lazy_compile", True)
+    xpath_extractor = XPathExtractor("//span/text()")
+    css_extractor = TextCSSExtractor("span")
+    assert not XPathExtractor._find.is_loaded(xpath_extractor)
+    assert not CSSExtractor._extractor.is_loaded(css_extractor)
+
+    assert xpath_extractor.extract(element) == ["a", "b", "c"]
+    assert css_extractor.extract(element) == ["a", "b", "c"]
+    assert XPathExtractor._find.is_loaded(xpath_extractor)
+    assert CSSExtractor._extractor.is_loaded(css_extractor)
+
+    xpath_extractor = XPathExtractor("//span", lazy=False)
+    assert XPathExtractor._find.is_loaded(xpath_extractor)
+
+
+@need_lxml
+def test_lazy_compile_exactly_once(element, monkeypatch):
+    # Standard Library
+    import threading
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    compiled = []
+    origin = XPathExtractor._compile
+    barrier = threading.Barrier(8)
+
+    def compile(self):
+        compiled.append(self)
+        return origin(self)
+
+    monkeypatch.setattr(XPathExtractor, "_compile", compile)
+    extractor = XPathExtractor("//span/@class", lazy=True)
+
+    def extract(_):
+        barrier.wait()
+        return extractor.extract(element)
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(extract, range(8)))
+
+    assert compiled == [extractor]
+    assert all(rv == ["class_a", "class_b"] for rv in results)
+    extractor.validate()
+    assert compiled == [extractor]
+
+
+@need_lxml
+def test_iterextract(tmp_path):
+    # Standard Library
+    import io
+
+    # First Party Library
+    from data_extractor.item import Field, Item
+    from data_extractor.lxml import iterextract
+
+    class Product(Item):
+        id = Field(XPathExtractor("./@id"), type=int)
+        title = Field(XPathExtractor("./title/text()"))
+        price = Field(XPathExtractor("./price/text()"), type=float, default=None)
+
+    records = "".join(
+        f"<product id='{idx}'><title>product {idx}</title>"
+        + ("" if idx % 3 else f"<price>{idx}.5</price>")
+        + "</product>"
+        for idx in range(100)
+    )
+    path = tmp_path / "feed.xml"
+    path.write_text(f"<feed><meta/>{records}</feed>")
+
+    with pytest.raises(ValueError):
+        next(iterextract(Product(XPathExtractor("//product")), path, "product"))
+
+    products = iterextract(Product(), path, "product")
+    for idx, product in enumerate(products):
+        assert product == {
+            "id": idx,
+            "title": f"product {idx}",
+            "price": None if idx % 3 else idx + 0.5,
+        }
+
+    assert idx == 99
+
+    # the extracted records and their preceding siblings are cleared
+    preceding_siblings = []
+
+    def title(element):
+        preceding_siblings.append(len(list(element.itersiblings(preceding=True))))
+        return element.findtext("title")
+
+    field = Field(convertor=title)
+    source = io.BytesIO(path.read_bytes())
+    assert list(iterextract(field, source, "product")) == [
+        f"product {idx}" for idx in range(100)
+    ]
+    assert preceding_siblings == [1] * 100
+
+
+@need_lxml
+def test_iterextract_failures():
+    # Standard Library
+    import io
+
+    # First Party Library
+    from data_extractor.item import Field, Item
+    from data_extractor.lxml import iterextract
+
+    class Product(Item):
+        title = Field(XPathExtractor("./title/text()"))
+
+    source = b"<feed><product><title>a</title></product><product/></feed>"
+    rvs = list(
+        iterextract(Product(), io.BytesIO(source), "product", return_exceptions=True)
+    )
+    assert rvs[0] == ({"title": "a"}, None)
+    assert rvs[1][0] is None
+    assert isinstance(rvs[1][1], ExtractError)
+
+    with pytest.raises(ExtractError):
+        list(iterextract(Product(), io.BytesIO(source), "product"))
+
+
+@pytest.mark.parametrize(
+    "Extractor,args",
+    [
+        (XPathExtractor, ("//span[@class]/text() | //span/@class",)),
+        pytest.param(TextCSSExtractor, ("span",), marks=need_cssselect),
+        pytest.param(AttrCSSExtractor, ("span", "class"), marks=need_cssselect),
+    ],
+    ids=repr,
+)
+def test_detached_results(text, Extractor, args):
+    # Standard Library
+    import gc
+    import weakref
+
+    try:
+        # Third Party Library
+        from lxml.html import HTMLParser, fromstring
+    except ImportError:
+        pytest.skip("Missing 'lxml'")
+
+    class Parser(HTMLParser):
+        # the document refers to its parser, which is weak referenceable
+        pass
+
+    parser = Parser()
+    document = weakref.ref(parser)
+    element = fromstring(text, parser=parser)
+    del parser
+
+    extractor = Extractor(*args, detached=True)
+    rv = extractor.extract(element)
+    assert rv
+    assert all(type(value) is str for value in rv)
+
+    del element
+    gc.collect()
+    assert document() is None
+
+
+@need_lxml
+def test_smart_strings_refer_document(text):
+    # Standard Library
+    import gc
+    import weakref
+
+    # Third Party Library
+    from lxml.html import HTMLParser, fromstring
+
+    class Parser(HTMLParser):
+        pass
+
+    parser = Parser()
+    document = weakref.ref(parser)
+    element = fromstring(text, parser=parser)
+    del parser
+
+    rv = XPathExtractor("//span/text()").extract(element)
+    assert rv[0].getparent().tag == "span"
+
+    del element
+    gc.collect()
+    assert document() is not None
+
+    del rv
+    gc.collect()
+    assert document() is None
+
+
+@need_lxml
+def test_detach_results(element, monkeypatch):
+    # First Party Library
+    import data_extractor.lxml
+
+    monkeypatch.setattr(data_extractor.lxml, "detach_results", True)
+    extractor = XPathExtractor("//span/@class")
+    assert extractor.detached
+    assert [type(value) for value in extractor.extract(element)] == [str, str]
+
+    extractor = XPathExtractor("//span/@class", detached=False)
+    assert not extractor.detached
+    assert extractor.extract(element)[0].getparent().tag == "span"
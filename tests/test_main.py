@@ -0,0 +1,178 @@
+# Standard Library
+import bz2
+import gzip
+import io
+import json
+import lzma
+import sys
+
+# Third Party Library
+import pytest
+
+# First Party Library
+import data_extractor.core
+
+from data_extractor.__main__ import main
+
+
+@pytest.fixture
+def modules(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(data_extractor.core, "defer_source_checks", False)
+    monkeypatch.setattr(data_extractor.core, "_deferred_source_checks", {})
+    header = "from data_extractor.item import Field, Item\n"
+    (tmp_path / "good_schemas.py").write_text(header + """
+class User(Item):
+    baz = Field()
+""")
+    (tmp_path / "bad_schemas.py").write_text(header + """
+class User(Item):
+    baz = Field()
+
+    def baz(self):
+        pass
+""")
+    (tmp_path / "bad_property_schemas.py").write_text(header + """
+class User(Item):
+    name = Field()
+""")
+
+
+@pytest.mark.usefixtures("modules")
+def test_check(capsys):
+    assert main(["check", "good_schemas"]) == 0
+    assert capsys.readouterr().err == ""
+
+    assert main(["check", "good_schemas", "bad_schemas", "bad_property_schemas"]) == 1
+    lines = capsys.readouterr().err.splitlines()
+    assert len(lines) == 2
+    assert "bad_property_schemas.py:4: " in lines[0]
+    assert "bad_schemas.py:6: " in lines[1]
+
+
+@pytest.fixture
+def run_schemas(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / "run_schemas.py").write_text("""
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+
+VERSION = 1
+
+class Tag(Item):
+    label = Field(JSONExtractor("label"))
+
+
+class User(Item):
+    id = Field(JSONExtractor("id"), type=int)
+    username = Field(JSONExtractor("name"))
+    tags = Tag(JSONExtractor("tags[*]"), is_many=True)
+""")
+    return tmp_path
+
+
+def dump_users(count):
+    lines = []
+    for idx in range(count):
+        user = {"id": idx, "name": f"user{idx}", "tags": [{"label": "a"}]}
+        if idx % 5 == 1:
+            del user["name"]
+        elif idx % 5 == 2:
+            user["tags"].append({})
+
+        lines.append(json.dumps(user) + "\n")
+
+    return "".join(lines).encode()
+
+
+def read_users(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def expect_users(count):
+    return [
+        {"id": idx, "username": f"user{idx}", "tags": [{"label": "a"}]}
+        for idx in range(count)
+        if idx % 5 not in (1, 2)
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize(
+    "suffix, compress",
+    [
+        ("", lambda data: data),
+        (".gz", gzip.compress),
+        (".bz2", bz2.compress),
+        (".xz", lzma.compress),
+    ],
+)
+def test_run_jsonl(run_schemas, capsys, workers, suffix, compress):
+    source = run_schemas / f"users.jsonl{suffix}"
+    source.write_bytes(compress(dump_users(20)))
+    output = run_schemas / "output.jsonl"
+    argv = ["run", "--schema", "run_schemas:User", "--input", str(source)]
+    argv.extend(["--format", "jsonl", "--output", str(output)])
+    argv.extend(["--workers", str(workers), "--chunksize", "3"])
+    assert main(argv) == 1
+
+    assert read_users(output) == expect_users(20)
+    lines = capsys.readouterr().err.splitlines()
+    assert lines[0].startswith("20 documents (0.0MiB) in ")
+    assert f"with {workers} worker(s)" in lines[0]
+    assert lines[1:] == [
+        "8 errors",
+        "  username: 4 (20.00%)",
+        "  tags.label: 4 (20.00%)",
+    ]
+
+
+def test_run_json_directory(run_schemas, capsys):
+    directory = run_schemas / "documents"
+    (directory / "nested").mkdir(parents=True)
+    users = [json.loads(line) for line in dump_users(3).splitlines()]
+    (directory / "0.json").write_text(json.dumps(users[0]))
+    (directory / "nested" / "1.json.gz").write_bytes(
+        gzip.compress(json.dumps(users[2]).encode())
+    )
+    (directory / "2.json").write_text("{invalid")
+    output = run_schemas / "output.jsonl"
+    argv = ["run", "--schema", "run_schemas:User", "--input", str(directory)]
+    argv.extend(["--format", "json", "--output", str(output), "--workers", "1"])
+    assert main(argv) == 1
+
+    assert read_users(output) == expect_users(1)
+    lines = capsys.readouterr().err.splitlines()
+    assert lines[0].startswith("3 documents")
+    assert lines[1:] == [
+        "2 errors",
+        "  <document>: 1 (33.33%)",
+        "  tags.label: 1 (33.33%)",
+    ]
+
+
+def test_run_stdin(run_schemas, capsys, monkeypatch):
+    stdin = io.TextIOWrapper(io.BufferedReader(io.BytesIO(gzip.compress(b"\n" * 3))))
+    monkeypatch.setattr(sys, "stdin", stdin)
+    argv = ["run", "--schema", "run_schemas:User", "--input", "-"]
+    argv.extend(["--format", "jsonl", "--workers", "1"])
+    assert main(argv) == 0
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err.splitlines()[1:] == ["0 errors"]
+
+    lines = dump_users(6).splitlines()
+    users = b"\n".join(lines[idx] for idx in (0, 3, 4, 5))
+    stdin = io.TextIOWrapper(io.BufferedReader(io.BytesIO(users)))
+    monkeypatch.setattr(sys, "stdin", stdin)
+    assert main(argv) == 0
+
+    captured = capsys.readouterr()
+    assert [json.loads(line) for line in captured.out.splitlines()] == expect_users(6)
+
+
+def test_run_invalid_schema(run_schemas):
+    argv = ["run", "--schema", "run_schemas:VERSION", "--input", "-"]
+    with pytest.raises(ValueError):
+        main([*argv, "--format", "json", "--workers", "2"])
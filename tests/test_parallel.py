@@ -0,0 +1,172 @@
+# Standard Library
+import importlib.util
+import multiprocessing
+import os
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from data_extractor.exceptions import ExtractError
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+from data_extractor.parallel import (
+    ExtractorPool,
+    WorkerError,
+    extract,
+    threaded_extract,
+)
+
+# Local Folder
+from .utils import user_getattr
+
+need_lxml = pytest.mark.skipif(
+    importlib.util.find_spec("lxml") is None, reason="Missing 'lxml'"
+)
+need_fork = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="Missing 'fork' start method",
+)
+
+
+__getattr__ = user_getattr(__name__)
+
+
+def payloads(count):
+    return [f'{{"id": {idx}, "name": "user{idx}"}}' for idx in range(count)]
+
+
+def expected(count):
+    return [{"id": idx, "name": f"user{idx}"} for idx in range(count)]
+
+
+@pytest.mark.parametrize("mp_context", [pytest.param("fork", marks=need_fork), "spawn"])
+@pytest.mark.usefixtures("user_schema")
+def test_pool_extract(mp_context):
+    with ExtractorPool(
+        f"{__name__}:User", parser="json", processes=2, mp_context=mp_context
+    ) as pool:
+        assert list(pool.extract(payloads(100), chunksize=7)) == expected(100)
+        assert list(pool.extract(payloads(10), max_in_flight=1)) == expected(10)
+
+        stats = pool.stats()
+        assert sum(s.documents for s in stats.values()) == 110
+        assert all(s.throughput > 0 for s in stats.values())
+        assert os.getpid() not in stats
+
+
+@pytest.mark.usefixtures("user_schema")
+def test_pool_extract_unordered():
+    rvs = extract(
+        f"{__name__}:User",
+        payloads(50),
+        parser="json",
+        processes=2,
+        chunksize=3,
+        ordered=False,
+        max_in_flight=2,
+    )
+    assert sorted(rvs, key=lambda rv: rv["id"]) == expected(50)
+
+
+@pytest.mark.parametrize("mp_context", [pytest.param("fork", marks=need_fork), "spawn"])
+def test_pool_extract_item_object(mp_context, user_schema):
+    item = user_schema(JSONExtractor("users[*]"), is_many=True)
+    documents = [{"users": [{"id": 0, "name": "user0"}]}] * 3
+    rvs = extract(item, documents, parser=None, processes=1, mp_context=mp_context)
+    assert list(rvs) == [expected(1)] * 3
+
+
+@need_lxml
+def test_pool_extract_html():
+    # First Party Library
+    from data_extractor.lxml import XPathExtractor
+
+    class Title(Item):
+        title = Field(XPathExtractor("//title/text()"))
+
+    pages = [f"<html><title>{idx}</title></html>" for idx in range(5)]
+    rvs = extract(Title(), pages, processes=1, mp_context="fork")
+    assert [rv["title"] for rv in rvs] == [str(idx) for idx in range(5)]
+
+
+@pytest.mark.usefixtures("user_schema")
+def test_pool_extract_failures():
+    documents = [*payloads(2), '{"id": 2}', "{"]
+    with ExtractorPool(f"{__name__}:User", parser="json", processes=1) as pool:
+        rvs = list(pool.extract(documents, return_exceptions=True))
+        assert [rv for rv, _ in rvs] == [*expected(2), None, None]
+        assert rvs[0][1] is None
+        assert rvs[2][1].message.startswith("ExtractError:")
+        assert rvs[3][1].message.startswith("JSONDecodeError:")
+        assert "Traceback" in rvs[3][1].traceback
+        assert rvs[2][1].field == "name"
+        assert rvs[3][1].field is None
+
+        with pytest.raises(WorkerError, match="ExtractError"):
+            list(pool.extract(documents))
+
+
+@pytest.mark.usefixtures("user_schema")
+def test_pool_invalid_arguments():
+    with pytest.raises(ValueError):
+        ExtractorPool(f"{__name__}:User", parser="yaml")
+
+    with pytest.raises(ValueError):
+        ExtractorPool(f"{__name__}:payloads")
+
+
+@need_lxml
+@pytest.mark.parametrize("ordered", [True, False])
+def test_threaded_extract(ordered):
+    # First Party Library
+    from data_extractor.lxml import XPathExtractor
+
+    class Title(Item):
+        title = Field(XPathExtractor("//title/text()"))
+
+    pages = [f"<html><title>{idx}</title></html>".encode() for idx in range(50)]
+    rvs = list(
+        threaded_extract(Title(), pages, threads=4, max_in_flight=3, ordered=ordered)
+    )
+    titles = [rv["title"] for rv in rvs]
+    if not ordered:
+        titles.sort(key=int)
+
+    assert titles == [str(idx) for idx in range(50)]
+
+
+@need_lxml
+def test_threaded_extract_reuses_parser_per_thread():
+    # Standard Library
+    from concurrent.futures import ThreadPoolExecutor
+
+    # First Party Library
+    from data_extractor.lxml import XPathExtractor
+    from data_extractor.parallel import _lxml_parser
+
+    assert _lxml_parser("xml") is _lxml_parser("xml")
+    assert _lxml_parser("xml") is not _lxml_parser("html")
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(_lxml_parser, "xml").result() is not _lxml_parser("xml")
+
+    documents = [f"<a><b>{idx}</b></a>" for idx in range(20)]
+    rvs = threaded_extract(
+        Field(XPathExtractor("//b/text()")), documents, parser="xml", threads=2
+    )
+    assert list(rvs) == [str(idx) for idx in range(20)]
+
+
+def test_threaded_extract_failures(user_schema):
+    documents = [*payloads(2), '{"id": 2}', "{"]
+    rvs = list(
+        threaded_extract(
+            f"{__name__}:User", documents, parser="json", return_exceptions=True
+        )
+    )
+    assert [rv for rv, _ in rvs] == [*expected(2), None, None]
+    assert isinstance(rvs[2][1], ExtractError)
+    assert isinstance(rvs[3][1], ValueError)
+
+    with pytest.raises(ExtractError):
+        list(threaded_extract(user_schema(), documents, parser="json"))
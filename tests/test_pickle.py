@@ -0,0 +1,185 @@
+# Standard Library
+import importlib.util
+import pickle
+
+from dataclasses import dataclass
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+from data_extractor.lxml import (
+    AttrCSSExtractor,
+    CSSExtractor,
+    TextCSSExtractor,
+    XPathExtractor,
+)
+from data_extractor.utils import sentinel
+
+# Local Folder
+from .utils import set_module_attributes
+
+need_cssselect = pytest.mark.skipif(
+    importlib.util.find_spec("cssselect") is None,
+    reason="Missing 'cssselect'",
+)
+need_lxml = pytest.mark.skipif(
+    importlib.util.find_spec("lxml") is None, reason="Missing 'lxml'"
+)
+
+PROTOCOLS = range(2, pickle.HIGHEST_PROTOCOL + 1)
+
+
+@dataclass
+class UserData:
+    id: int
+    name: str
+
+
+@pytest.fixture
+def User(json_extractor_backend, monkeypatch):
+    class User(Item):
+        id = Field(JSONExtractor("id"), type=int)
+        username = Field(JSONExtractor("name"), name="name")
+        gender = Field(JSONExtractor("gender"), default=None)
+
+    set_module_attributes(monkeypatch, User)
+    return User
+
+
+@pytest.fixture
+def Users(User, monkeypatch):
+    class Users(Item):
+        users = User(JSONExtractor("data.users[*]"), is_many=True)
+        total = Field[int](JSONExtractor("data.total"))
+
+    set_module_attributes(monkeypatch, Users)
+    return Users
+
+
+@pytest.fixture
+def Article(monkeypatch):
+    class Article(Item):
+        title = Field(XPathExtractor("./div[@class='title']/text()"))
+
+    set_module_attributes(monkeypatch, Article)
+    return Article
+
+
+@pytest.fixture
+def element():
+    # Third Party Library
+    from lxml.html import fromstring
+
+    return fromstring("""
+        <ul>
+            <li class="article"><div class="title">Title 1</div></li>
+            <li class="article"><div class="title">Title 2</div></li>
+        </ul>
+        """)
+
+
+def round_trip(obj, protocol=pickle.HIGHEST_PROTOCOL):
+    return pickle.loads(pickle.dumps(obj, protocol=protocol))
+
+
+@need_lxml
+@pytest.mark.parametrize("protocol", PROTOCOLS)
+@pytest.mark.parametrize(
+    "extractor_cls,args,expect",
+    [
+        (XPathExtractor, ("//div/text()",), ["Title 1", "Title 2"]),
+        pytest.param(CSSExtractor, ("li.article",), 2, marks=need_cssselect),
+        pytest.param(
+            TextCSSExtractor,
+            ("div.title",),
+            ["Title 1", "Title 2"],
+            marks=need_cssselect,
+        ),
+        pytest.param(
+            AttrCSSExtractor,
+            ("li", "class"),
+            ["article", "article"],
+            marks=need_cssselect,
+        ),
+    ],
+    ids=repr,
+)
+def test_lxml_extractor(element, extractor_cls, args, expect, protocol):
+    extractor = extractor_cls(*args)
+    extractor.validate()
+    rv = round_trip(extractor, protocol)
+    assert type(rv) is type(extractor)
+    assert repr(rv) == repr(extractor)
+
+    if isinstance(expect, int):
+        assert len(rv.extract(element)) == expect
+    else:
+        assert rv.extract(element) == expect
+
+
+@need_lxml
+def test_lxml_extractor_recompiled_via_cache():
+    extractor = XPathExtractor("//span")
+    rv = round_trip(extractor)
+    assert not XPathExtractor._find.is_loaded(rv)
+    rv.validate()
+    assert rv._find is extractor._find
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+@pytest.mark.parametrize("protocol", PROTOCOLS)
+def test_json_extractor(json0, protocol):
+    extractor = JSONExtractor("data.users[*].name")
+    rv = round_trip(extractor, protocol)
+    assert type(rv) is type(extractor)
+    assert rv.extract(json0) == extractor.extract(json0)
+
+
+def test_json_extractor_of_backend(json0, json_extractor_backend):
+    extractor = json_extractor_backend("data.total")
+    rv = round_trip(extractor)
+    assert type(rv) is json_extractor_backend
+    assert rv.extract(json0) == [100]
+
+
+@pytest.mark.parametrize("protocol", PROTOCOLS)
+def test_item(json0, protocol, Users):
+    item = Users()
+    expect = item.extract(json0)
+    rv = round_trip(item, protocol)
+    assert type(rv) is Users
+    assert rv.extract(json0) == expect
+    assert type(rv.total) is type(Users.total)
+    assert rv.users.gender.default is None
+    assert rv.total.default is sentinel
+    assert rv.users.convertor.__self__ is rv.users
+
+
+def test_item_with_type(json0, User):
+    item = User[UserData](JSONExtractor("data.users[*]"), is_many=True)
+    rv = round_trip(item)
+    assert type(rv) is User[UserData]
+    assert rv.type is UserData
+
+
+@pytest.mark.parametrize("protocol", PROTOCOLS)
+def test_simplified_item(json0, protocol, User):
+    extractor = User(JSONExtractor("data.users[*]")).simplify()
+    rv = round_trip(extractor, protocol)
+    assert type(rv).__name__ == "UserSimplified"
+    assert rv.extract(json0) == extractor.extract(json0)
+    assert rv.extract_first(json0) == extractor.extract_first(json0)
+
+
+@need_lxml
+def test_field_and_item_with_lxml(element, Article):
+    item = Article(XPathExtractor("//li"), is_many=True)
+    rv = round_trip(item)
+    assert rv.extract(element) == [{"title": "Title 1"}, {"title": "Title 2"}]
+
+
+def test_sentinel():
+    assert round_trip(sentinel) is sentinel
@@ -0,0 +1,146 @@
+# Third Party Library
+import pytest
+
+# First Party Library
+from data_extractor.exceptions import ExtractError
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+from data_extractor.projection import compile_projection
+
+
+@pytest.fixture
+def Seller(json_extractor_backend):
+    class Seller(Item):
+        name_ = Field(JSONExtractor("name"), name="name")
+        rating = Field(JSONExtractor("rating"), type=float)
+
+    return Seller
+
+
+@pytest.fixture
+def Product(Seller):
+    class Tag(Item):
+        label = Field(JSONExtractor("label"))
+        color = Field(JSONExtractor("color"), default=None)
+
+    class Product(Item):
+        title = Field(JSONExtractor("title"))
+        price = Field(JSONExtractor("price"), type=float)
+        sku = Field(JSONExtractor("sku"), name="id")
+        seller = Seller(
+            JSONExtractor("seller"), convertor=lambda rv: tuple(rv.values())
+        )
+        tags = Tag(JSONExtractor("tags[*]"), is_many=True)
+
+    return Product
+
+
+DOCUMENT = {
+    "title": "t",
+    "price": "9.5",
+    "sku": "s1",
+    "seller": {"name": "n", "rating": "4"},
+    "tags": [{"label": "a", "color": "red"}, {"label": "b"}],
+}
+
+
+@pytest.mark.parametrize(
+    "only,exclude,expect",
+    [
+        (
+            {"title", "price", "seller.name"},
+            None,
+            {"title": "t", "price": 9.5, "seller": {"name": "n"}},
+        ),
+        (["id", "seller"], None, {"id": "s1", "seller": ("n", 4.0)}),
+        (
+            ["seller.name", "seller"],
+            None,
+            {"seller": ("n", 4.0)},
+        ),
+        (
+            {"tags.label"},
+            None,
+            {"tags": [{"label": "a"}, {"label": "b"}]},
+        ),
+        (
+            None,
+            {"price", "id", "seller.rating", "tags"},
+            {"title": "t", "seller": {"name": "n"}},
+        ),
+        ({"title", "price"}, {"price"}, {"title": "t"}),
+        (set(), None, {}),
+        (None, set(), None),
+    ],
+    ids=repr,
+)
+def test_extract_projection(only, exclude, expect, Product):
+    item = Product()
+    if expect is None:
+        expect = item.extract(DOCUMENT)
+
+    assert item.extract(DOCUMENT, only=only, exclude=exclude) == expect
+    assert dict(item.extract(DOCUMENT, lazy=True, only=only, exclude=exclude)) == (
+        expect
+    )
+
+
+def test_projection_cache(Product):
+    item = Product()
+    projection = compile_projection(item, {"title", "seller.name"})
+    assert projection is compile_projection(item, ["seller.name", "title"])
+    assert projection is not compile_projection(Product(), {"title", "seller.name"})
+    assert projection is not compile_projection(item, {"title"})
+    assert list(projection.fields) == ["title", "seller"]
+
+    projection = compile_projection(item)
+    assert projection.plan is item._plan
+    assert list(projection.fields) == ["title", "price", "id", "seller", "tags"]
+
+
+def test_projection_failures(Product):
+    item = Product(JSONExtractor("products[*]"), is_many=True)
+    document = {"products": [DOCUMENT, {"title": "t", "seller": {}}]}
+    assert item.extract(document, only={"title"}) == [{"title": "t"}] * 2
+
+    with pytest.raises(ExtractError) as catch:
+        item.extract(document, only={"title", "seller.name"})
+
+    exc = catch.value
+    assert len(exc.extractors) == 3
+    assert exc.extractors[1] is item.seller
+    assert exc.extractors[2] is item
+
+
+@pytest.mark.parametrize(
+    "only,exclude",
+    [
+        ({"titles"}, None),
+        (None, {"seller.names"}),
+        ({"sku"}, None),
+        ({"title.name"}, None),
+        ({"seller."}, None),
+    ],
+    ids=repr,
+)
+def test_invalid_projection(only, exclude, Product):
+    with pytest.raises(ValueError):
+        Product().extract(DOCUMENT, only=only, exclude=exclude)
+
+
+def test_customized_projection(Seller):
+    class Customized(Seller):
+        def _extract(self, element):
+            return super()._extract(element)
+
+    class Order(Item):
+        seller = Customized(JSONExtractor("seller"))
+
+    assert Order().extract(DOCUMENT, only={"seller"}) == {
+        "seller": {"name": "n", "rating": 4.0}
+    }
+    with pytest.raises(ValueError):
+        Order().extract(DOCUMENT, only={"seller.name"})
+
+    with pytest.raises(ValueError):
+        Customized().extract(DOCUMENT, exclude={"name"})
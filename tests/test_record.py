@@ -0,0 +1,148 @@
+# Standard Library
+import gc
+import pickle
+import weakref
+
+from collections import namedtuple
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from data_extractor.exceptions import ExtractError
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
+from data_extractor.record import record_type
+
+# Local Folder
+from .utils import set_module_attributes
+
+
+@pytest.fixture
+def Author(json_extractor_backend, monkeypatch):
+    class Author(Item):
+        username = Field(JSONExtractor("name"))
+
+    set_module_attributes(monkeypatch, Author)
+    return Author
+
+
+@pytest.fixture
+def Article(Author, monkeypatch):
+    class Article(Item):
+        id = Field(JSONExtractor("id"), type=int)
+        title = Field(JSONExtractor("title"), name="headline", default="")
+        author = Author(JSONExtractor("author"), type=record_type(Author))
+        tags = Field(JSONExtractor("tags[*]"), is_many=True)
+
+    set_module_attributes(monkeypatch, Article)
+    return Article
+
+
+@pytest.fixture
+def Comment(Article):
+    class Comment(Article):
+        text = Field(JSONExtractor("text"))
+        title = Field(JSONExtractor("subject"), name="headline")
+
+    return Comment
+
+
+DOCUMENT = {
+    "articles": [
+        {"id": "1", "title": "a", "author": {"name": "u1"}, "tags": ["x"]},
+        {"id": 2, "author": {"name": "u2"}, "tags": []},
+    ]
+}
+
+
+def test_field_names_order(Article, Comment):
+    assert list(Article.field_names()) == ["id", "title", "author", "tags"]
+    assert list(Comment.field_names()) == ["id", "title", "author", "tags", "text"]
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+@pytest.mark.parametrize("slots", [False, True])
+def test_extract_records(slots, codegen, Author, Article):
+    record = record_type(Article, slots)
+    assert record is record_type(Article, slots)
+    assert record._fields == ("id", "headline", "author", "tags")
+
+    item = Article(JSONExtractor("articles[*]"), is_many=True, type=record)
+    item.compile(codegen=codegen)
+    rvs = item.extract(DOCUMENT)
+    author = record_type(Author)
+    assert rvs == [
+        record(1, "a", author("u1"), ["x"]),
+        record(2, "", author("u2"), []),
+    ]
+    assert rvs[0]._asdict() == {
+        "id": 1,
+        "headline": "a",
+        "author": author("u1"),
+        "tags": ["x"],
+    }
+    assert pickle.loads(pickle.dumps(rvs)) == rvs
+
+
+def test_extract_records_error(Author, Article):
+    item = Article(
+        JSONExtractor("articles[*]"), is_many=True, type=record_type(Article)
+    )
+    with pytest.raises(ExtractError) as catch:
+        item.extract({"articles": [{"id": 1, "author": {}}]})
+
+    exc = catch.value
+    assert exc.extractors == [Author.username, Article.author, item]
+
+
+def test_slots_record(Author):
+    record = record_type(Author, slots=True)
+    rv = record("u1")
+    assert not hasattr(rv, "__dict__")
+    assert repr(rv) == "AuthorRecord(username='u1')"
+    assert rv == record._make(["u1"])
+    assert rv != record("u2")
+    assert rv != record_type(Author)("u1")
+    rv.username = "u2"
+    assert rv == record("u2")
+
+
+def test_record_positional_only_if_fields_matched(Author, Article):
+    # namedtuple in other order is created by keywords
+    Reversed = namedtuple("Reversed", ["tags", "author", "headline", "id"])
+    item = Article(JSONExtractor("articles[0]"), type=Reversed)
+    assert item._record_type_of() is None
+    assert item.extract(DOCUMENT) == Reversed(["x"], record_type(Author)("u1"), "a", 1)
+
+    # customized convertor is respected
+    record = record_type(Article)
+    item = Article(JSONExtractor("articles[0]"), type=record, convertor=dict)
+    assert item._record_type_of() is None
+    assert item.extract(DOCUMENT)["headline"] == "a"
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_record_invalid_field_name():
+    class Invalid(Item):
+        value = Field(JSONExtractor("value"), name="not valid")
+
+    with pytest.raises(ValueError):
+        record_type(Invalid)
+
+
+@pytest.mark.usefixtures("json_extractor_backend")
+def test_record_type_not_pinning_item_class():
+    class Temporary(Item):
+        value = Field(JSONExtractor("value"))
+
+    records = [record_type(Temporary), record_type(Temporary, slots=True)]
+    assert records == [record_type(Temporary), record_type(Temporary, slots=True)]
+
+    ref = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert ref() is None
+    for record in records:
+        with pytest.raises(pickle.PicklingError):
+            pickle.dumps(record(1))
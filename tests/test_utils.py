@@ -251,3 +251,74 @@ def test_property_change_internal_value_failure():
     bar = Bar("dummy expr")
     with pytest.raises(AttributeError):
         Property.change_internal_value(bar, "boo", 1)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        (
+            pytest.param(XPathExtractor("//a"), id="XPathExtractor")
+            if not _missing_lxml
+            else pytest.param("Missing 'lxml'", marks=pytest.mark.skip())
+        ),
+        (
+            pytest.param(AttrCSSExtractor("a", attr="href"), id="AttrCSSExtractor")
+            if not _missing_cssselect
+            else pytest.param("Missing 'cssselect'", marks=pytest.mark.skip())
+        ),
+        (
+            pytest.param(JSONPathExtractor("a"), id="JSONPathExtractor")
+            if not _missing_jsonpath
+            else pytest.param("Missing 'jsonpath-extractor'", marks=pytest.mark.skip())
+        ),
+        pytest.param(Field(), id="Field"),
+        pytest.param(Field[int](), id="Field[int]"),
+        pytest.param(Item(), id="Item"),
+        (
+            pytest.param(Item(XPathExtractor("//a")).simplify(), id="simplified Item")
+            if not _missing_lxml
+            else pytest.param("Missing 'lxml'", marks=pytest.mark.skip())
+        ),
+    ],
+)
+def test_property_stored_in_slots(obj):
+    assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        obj.undefined_attribute = 1
+
+
+def test_property_stored_in_slots_of_subclass():
+    class Bar(AbstractSimpleExtractor):
+        __slots__ = ()
+
+        boo = Property[int]()
+
+        def extract(self, element):
+            return super().extract(element)
+
+    assert Bar.__slots__ == ("_property_boo",)
+    bar = Bar("dummy expr")
+    assert not hasattr(bar, "__dict__")
+
+    assert not Bar.boo.is_loaded(bar)
+    bar.boo = 0
+    assert Bar.boo.is_loaded(bar)
+    with pytest.raises(AttributeError):
+        bar.boo = 1
+
+    Property.change_internal_value(bar, "boo", 1)
+    assert bar.boo == 1
+
+
+def test_property_stored_in_dict_of_subclass():
+    class Bar(AbstractSimpleExtractor):
+        boo = Property[int]()
+
+        def extract(self, element):
+            return super().extract(element)
+
+    bar = Bar("dummy expr")
+    bar.boo = 0
+    bar.other = 1
+    assert vars(bar) == {"_property_boo": 0, "other": 1}
+    assert bar.expr == "dummy expr"
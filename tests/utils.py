@@ -1,5 +1,10 @@
+# Standard Library
+import sys
+
 # First Party Library
 from data_extractor.core import AbstractSimpleExtractor
+from data_extractor.item import Field, Item
+from data_extractor.json import JSONExtractor
 
 
 class DumyExtractor(AbstractSimpleExtractor):
@@ -11,3 +16,35 @@ class DumyExtractor(AbstractSimpleExtractor):
 
 
 D = DumyExtractor
+
+
+def build_user(module, id_type=None, name="name", convertor=None):
+    class User(Item):
+        id = Field(JSONExtractor("id"), type=id_type)
+        username = Field(JSONExtractor("name"), name=name, convertor=convertor)
+
+    # referred by f"{module}:User"
+    User.__module__ = module
+    User.__qualname__ = "User"
+    return User
+
+
+def user_getattr(module):
+    def __getattr__(name):
+        # the workers of spawn start method import the schema by reference
+        if name != "User":
+            raise AttributeError(f"module {module!r} has no attribute {name!r}")
+
+        namespace = vars(sys.modules[module])
+        options = namespace.get("USER_OPTIONS", {})
+        return namespace.setdefault(name, build_user(module, **options))
+
+    return __getattr__
+
+
+def set_module_attributes(monkeypatch, *classes):
+    # the classes are pickled by reference
+    for cls in classes:
+        cls.__qualname__ = cls.__name__
+        module = sys.modules[cls.__module__]
+        monkeypatch.setattr(module, cls.__name__, cls, raising=False)